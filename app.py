@@ -2,12 +2,26 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import datetime
+import functools
 import time
 import plotly.graph_objects as go
 import plotly.express as px
 import math
+from concurrent.futures import ThreadPoolExecutor
+import os
+import glob
 from plotly.subplots import make_subplots
 
+from planetary import (
+    AGGREGATION_LABELS, CITY_COORDINATES, FORECAST_HORIZON_DAYS, FORECAST_LONG_HORIZONS, IMPACT_CATEGORIES,
+    OHLC_HISTORY_PATH, PLANETS, SENTIMENT_LEVELS, TIMING_ENABLED,
+    AspectIndex, BackgroundJob, ForecastDayCache, ResultCache, StageTimer, SunTimesCache, TimingHistory,
+    aspect_display_rows, aspect_rules_version, backtest_sentiment, city_local_now, city_planetary_hours,
+    compute_dashboard_data, current_slot, find_city, forecast_series, forecast_window, get_market_store, get_market_type,
+    get_planet_strength, get_sign_from_degree, load_ohlc, lttb_indices, parse_watchlist, planet_display_rows,
+    scan_watchlist, search_aspect_range, search_impact_summary, sentiment_factors_for_date
+)
+
 # Set page configuration
 st.set_page_config(
     page_title="Dynamic Planetary Trading Dashboard",
@@ -216,583 +230,149 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Define actual market data for August 2025 (Nifty)
-# This will override the calculated forecast for these specific dates
-actual_market_data = {
-    datetime.date(2025, 8, 1): {"sentiment": "Very Bearish", "score": -3.2, "reason": "Sharp market fall due to global economic concerns"},
-    datetime.date(2025, 8, 4): {"sentiment": "Very Bullish", "score": 2.8, "reason": "Strong recovery on positive global cues"},
-    datetime.date(2025, 8, 5): {"sentiment": "Very Bearish", "score": -3.5, "reason": "Market fell sharply throughout the day"},
-    datetime.date(2025, 8, 6): {"sentiment": "Very Bearish", "score": -3.0, "reason": "Continued selling pressure, bearish trend"}
-}
+DEFAULT_WATCHLIST = "NIFTY, BANKNIFTY, FINNIFTY, MIDCPNIFTY, AAPL, MSFT, TSLA, GOLD, CRUDEOIL, BTC"
 
-# Define planetary aspects data for August 6, 2025 - UPDATED WITH NEW IMPACT MEANINGS
-aug6_aspects = [
-    {
-        "time": "02:06 am",
-        "aspect": "Moon Quintile Node (☽ ⬠ ☊)",
-        "meaning": "Unusual opportunities, karmic shifts",
-        "indian_market": "Neutral",
-        "commodities": "Neutral",
-        "forex": "Sudden trend change",
-        "global_market": "Neutral"
-    },
-    {
-        "time": "02:34 am",
-        "aspect": "Moon BiQuintile Uranus (☽ bQ ♅)",
-        "meaning": "Innovative but erratic energy",
-        "indian_market": "Tech stocks volatile",
-        "commodities": "Neutral",
-        "forex": "Positive movement",
-        "global_market": "Neutral"
-    },
-    {
-        "time": "02:38 am",
-        "aspect": "Moon Opposition Venus (☽ ☍ ♀)",
-        "meaning": "Emotional vs. financial balance",
-        "indian_market": "Neutral",
-        "commodities": "Short-term dip",
-        "forex": "Neutral",
-        "global_market": "Neutral"
-    },
-    {
-        "time": "04:38 am",
-        "aspect": "Sun BiQuintile Moon (☉ bQ ☽)",
-        "meaning": "Creative problem-solving",
-        "indian_market": "Banking recovery",
-        "commodities": "Neutral",
-        "forex": "Neutral",
-        "global_market": "Neutral"
-    },
-    {
-        "time": "10:25 am",
-        "aspect": "Mars SemiSquare Lilith (♂ ∠ ⚸)",
-        "meaning": "Aggressive speculation",
-        "indian_market": "Midcaps/Smallcaps risks",
-        "commodities": "Neutral",
-        "forex": "Neutral",
-        "global_market": "Neutral"
-    },
-    {
-        "time": "01:39 pm",
-        "aspect": "Moon Opposition Jupiter (☽ ☍ ♃)",
-        "meaning": "Overconfidence vs. reality check",
-        "indian_market": "Rally then profit-taking",
-        "commodities": "Neutral",
-        "forex": "Neutral",
-        "global_market": "Temporary rally then profit-taking"
-    },
-    {
-        "time": "04:53 pm",
-        "aspect": "Sun Quincunx Moon (☉ ⚻ ☽)",
-        "meaning": "Adjustments needed",
-        "indian_market": "Neutral",
-        "commodities": "Downward pressure",
-        "forex": "Neutral",
-        "global_market": "Neutral"
-    },
-    {
-        "time": "05:10 pm",
-        "aspect": "Moon Sextile Lilith (☽ ⚹ ⚸)",
-        "meaning": "Hidden opportunities",
-        "indian_market": "Neutral",
-        "commodities": "Neutral",
-        "forex": "Altcoins surge",
-        "global_market": "Neutral"
-    },
-    {
-        "time": "07:35 pm",
-        "aspect": "Moon Sesquiquadrate Uranus (☽ ⚼ ♅)",
-        "meaning": "Sudden disruptions",
-        "indian_market": "Neutral",
-        "commodities": "Neutral",
-        "forex": "Neutral",
-        "global_market": "After-hours volatility"
-    },
-    {
-        "time": "09:18 pm",
-        "aspect": "Sun Square Lilith (☉ ☐ ⚸)",
-        "meaning": "Power struggles, manipulation",
-        "indian_market": "Neutral",
-        "commodities": "Institutional manipulation",
-        "forex": "Neutral",
-        "global_market": "Neutral"
-    }
+# Long-horizon forecast display limits
+FORECAST_PAGE_SIZE = 14
+FORECAST_CHART_POINTS = 500
+
+# Forecast chart threshold lines: score, colour, label
+SENTIMENT_GUIDES = [
+    (4, "green", "Extremely Bullish"), (2, "lightgreen", "Very Bullish"), (0.5, "yellow", "Bullish"),
+    (-0.5, "orange", "Bearish"), (-2, "red", "Very Bearish"), (-4, "darkred", "Extremely Bearish")
 ]
 
-# Function to generate aspects for any date
-def generate_aspects_for_date(date):
-    """Generate aspects for any given date based on planetary positions"""
-    # Calculate planetary positions for the date
-    degrees = calculate_dynamic_planetary_positions(date)
-    
-    # Calculate aspects
-    aspects = calculate_dynamic_aspects(degrees)
-    
-    # Generate time stamps throughout the day
-    times = [
-        "02:06 am", "02:34 am", "02:38 am", "04:38 am", "10:25 am", 
-        "01:39 pm", "04:53 pm", "05:10 pm", "07:35 pm", "09:18 pm"
-    ]
-    
-    # Create aspect data with market impacts
-    aspect_data = []
-    
-    for i, time_str in enumerate(times):
-        # Get a random aspect from the calculated aspects
-        if aspects and i < len(aspects):
-            aspect = aspects[i]
-            aspect_name = f"{aspect['Planet 1']} {aspect['Aspect']} {aspect['Planet 2']}"
-            
-            # Determine market impacts based on aspect type - UPDATED WITH NEW MEANINGS
-            if aspect['Aspect'] in ['Trine', 'Sextile']:
-                indian_impact = "Positive movement" if aspect['Strength'] in ['Exact', 'Close'] else "Neutral"
-                commodities_impact = "Positive movement" if aspect['Strength'] in ['Exact', 'Close'] else "Neutral"
-                forex_impact = "Positive movement" if aspect['Strength'] in ['Exact', 'Close'] else "Neutral"
-                global_impact = "Positive movement" if aspect['Strength'] in ['Exact', 'Close'] else "Neutral"
-            elif aspect['Aspect'] in ['Square', 'Opposition']:
-                indian_impact = "Negative pressure" if aspect['Strength'] in ['Exact', 'Close'] else "Neutral"
-                commodities_impact = "Negative pressure" if aspect['Strength'] in ['Exact', 'Close'] else "Neutral"
-                forex_impact = "Negative pressure" if aspect['Strength'] in ['Exact', 'Close'] else "Neutral"
-                global_impact = "Negative pressure" if aspect['Strength'] in ['Exact', 'Close'] else "Neutral"
-            else:
-                indian_impact = "Neutral"
-                commodities_impact = "Neutral"
-                forex_impact = "Neutral"
-                global_impact = "Neutral"
-            
-            # Create meaning based on aspect
-            if aspect['Aspect'] == 'Conjunction':
-                meaning = "Planets joining energies, new beginnings"
-            elif aspect['Aspect'] == 'Trine':
-                meaning = "Harmonious flow, favorable conditions"
-            elif aspect['Aspect'] == 'Square':
-                meaning = "Tension, challenges, need for action"
-            elif aspect['Aspect'] == 'Opposition':
-                meaning = "Polarity, balance, relationship focus"
-            elif aspect['Aspect'] == 'Sextile':
-                meaning = "Opportunities, positive connections"
-            else:
-                meaning = "Planetary interaction"
-            
-            aspect_data.append({
-                "time": time_str,
-                "aspect": aspect_name,
-                "meaning": meaning,
-                "indian_market": indian_impact,
-                "commodities": commodities_impact,
-                "forex": forex_impact,
-                "global_market": global_impact
-            })
-        else:
-            # If no aspects available, use default data
-            aspect_data.append({
-                "time": time_str,
-                "aspect": "No significant aspects",
-                "meaning": "Normal planetary motion",
-                "indian_market": "Neutral",
-                "commodities": "Neutral",
-                "forex": "Neutral",
-                "global_market": "Neutral"
-            })
-    
-    return aspect_data
+# Seconds between progress refreshes while an aspect search runs in the background
+SEARCH_POLL_SECONDS = 0.5
+
+# Aspect search charts: above this many points the timeline switches to compact WebGL traces,
+# and the impact counts are binned by day, week or month to stay within this many bars
+SEARCH_WEBGL_POINTS = int(os.environ.get("PLANETARY_WEBGL_POINTS", 2000))
+SEARCH_COUNT_BINS = int(os.environ.get("PLANETARY_COUNT_BINS", 400))
+SEARCH_IMPACT_COLORS = {"Positive": "#16a34a", "Negative": "#dc2626", "Neutral": "#f59e0b"}
+
+@st.cache_resource
+def get_dashboard_cache():
+    """update_all_data results shared across reruns and sessions"""
+    return ResultCache(maxsize=256)
+
+@st.cache_resource
+def get_forecast_day_cache():
+    """Per-day forecast rows shared across reruns and sessions"""
+    return ForecastDayCache()
+
+@st.cache_resource
+def get_sun_times_cache():
+    """Sunrise and sunset per (city, date) shared across reruns and sessions"""
+    return SunTimesCache()
+
+@st.cache_resource
+def get_aspect_index():
+    """Aspect index shared across reruns and sessions"""
+    return AspectIndex()
+
+@st.cache_resource
+def get_search_executor():
+    """Worker threads for background aspect searches, shared across sessions"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="aspect-search")
+
+@st.cache_data(show_spinner=False)
+def run_ohlc_backtest(path, modified):
+    """Backtest of the OHLC history at path, recomputed when its files change"""
+    return backtest_sentiment(load_ohlc(path))
+
+def render_cards(cards, container=st):
+    """Render a list of HTML cards as one markdown element instead of one element per card
+    
+    Lines are stripped and blank lines dropped so the joined HTML stays a
+    single block and no indented line is read as a markdown code block.
+    """
+    if cards:
+        html = "\n".join(line.strip() for card in cards for line in card.splitlines() if line.strip())
+        container.markdown(html, unsafe_allow_html=True)
+
+def stage(name):
+    """Timing context for one stage of the current run; a shared no-op while diagnostics are off"""
+    return st.session_state.stage_timer.stage(name)
+
+def timed_panel(panel):
+    """Time a fragment panel as a stage of the script run, or as a run of its own when only the fragment reruns"""
+    @functools.wraps(panel)
+    def run(*args, **kwargs):
+        timer = st.session_state.stage_timer
+        if not timer.finished:
+            with timer.stage(panel.__name__):
+                return panel(*args, **kwargs)
+        
+        st.session_state.stage_timer = StageTimer(f"fragment {panel.__name__}", st.session_state.diagnostics)
+        try:
+            return panel(*args, **kwargs)
+        finally:
+            finish_run()
+    return run
+
+def plotly_chart(fig, name):
+    """st.plotly_chart at full width, recording the figure's JSON size as a payload while diagnostics are on"""
+    timer = st.session_state.stage_timer
+    if timer.enabled:
+        with timer.stage(f"{name}.serialize"):
+            timer.payload(name, len(fig.to_json()))
+    st.plotly_chart(fig, use_container_width=True)
+
+def finish_run():
+    """Close the current run's timings and add them to the session history while diagnostics are on"""
+    timer = st.session_state.stage_timer
+    run_record = timer.finish()
+    if timer.enabled:
+        st.session_state.timing_history.record(run_record)
 
 # Initialize session state with proper defaults
 def initialize_session_state():
     defaults = {
-        'planetary_data': [],
+        'planetary_data': None,
         'current_date': datetime.date(2025, 8, 6),
         'current_symbol': "NIFTY",
+        'current_city': "Mumbai",
         'planetary_degrees': {},
         'timeline_data': [],
-        'aspects': [],
+        'timeline_grid': None,
+        'aspects': None,
         'sentiment_data': {},
         'forecast_data': [],
+        'forecast_horizon': FORECAST_HORIZON_DAYS,
         'last_update': None,
         'aspects_data': [],
-        'filtered_aspects_data': []
+        'filtered_aspects_data': [],
+        'search_job': None,
+        'diagnostics': TIMING_ENABLED,
+        'timing_history': TimingHistory()
     }
     
     for key, value in defaults.items():
         if key not in st.session_state:
             st.session_state[key] = value
 
-# Enhanced planetary calculations
-def calculate_dynamic_planetary_positions(date):
-    reference_date = datetime.date(2025, 8, 6)
-    days_diff = (date - reference_date).days
-    
-    daily_movements = {
-        "Sun": 0.9856, "Moon": 13.1764, "Mercury": 1.383, 
-        "Venus": 1.202, "Mars": 0.524, "Jupiter": 0.083, 
-        "Saturn": 0.034, "Rahu": -0.053, "Ketu": -0.053
-    }
-    
-    base_positions = {
-        "Sun": 109.5, "Moon": 251.68, "Mercury": 94.27, 
-        "Venus": 137.75, "Mars": 87.0, "Jupiter": 22.67, 
-        "Saturn": 308.33, "Rahu": 352.67, "Ketu": 172.67
-    }
-    
-    new_positions = {}
-    for planet, base_pos in base_positions.items():
-        movement = daily_movements[planet] * days_diff
-        new_pos = (base_pos + movement) % 360
-        new_positions[planet] = new_pos
-    
-    return new_positions
-
-def get_planet_strength(planet, sign):
-    planet_rulerships = {
-        "Sun": {"exalted": "Aries", "own": ["Leo"], "debilitated": "Libra"},
-        "Moon": {"exalted": "Taurus", "own": ["Cancer"], "debilitated": "Scorpio"},
-        "Mercury": {"exalted": "Virgo", "own": ["Gemini", "Virgo"], "debilitated": "Pisces"},
-        "Venus": {"exalted": "Pisces", "own": ["Taurus", "Libra"], "debilitated": "Virgo"},
-        "Mars": {"exalted": "Capricorn", "own": ["Aries", "Scorpio"], "debilitated": "Cancer"},
-        "Jupiter": {"exalted": "Cancer", "own": ["Sagittarius", "Pisces"], "debilitated": "Capricorn"},
-        "Saturn": {"exalted": "Libra", "own": ["Capricorn", "Aquarius"], "debilitated": "Aries"},
-        "Rahu": {"exalted": "Gemini", "own": [], "debilitated": "Sagittarius"},
-        "Ketu": {"exalted": "Sagittarius", "own": [], "debilitated": "Gemini"}
-    }
-    
-    if planet in planet_rulerships:
-        rulership = planet_rulerships[planet]
-        if sign == rulership.get("exalted"):
-            return "Exalted"
-        elif sign in rulership.get("own", []):
-            return "Own Sign"
-        elif sign == rulership.get("debilitated"):
-            return "Debilitated"
-    return "Neutral"
-
-def get_sign_from_degree(degree):
-    signs = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
-             "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
-    sign_index = int(degree // 30)
-    return signs[sign_index % 12]
-
-def get_nakshatra_from_degree(degree):
-    nakshatras = [
-        "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra",
-        "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni",
-        "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha",
-        "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha",
-        "Purva Bhadrapada", "Uttara Bhadrapada", "Revati"
-    ]
-    nakshatra_index = int(degree // 13.333333)
-    return nakshatras[nakshatra_index % 27]
-
-def calculate_dynamic_aspects(degrees):
-    aspects = []
-    planets = list(degrees.keys())
-    
-    aspect_types = {
-        "Conjunction": {"angle": 0, "orb": 8},
-        "Sextile": {"angle": 60, "orb": 6},
-        "Square": {"angle": 90, "orb": 8},
-        "Trine": {"angle": 120, "orb": 8},
-        "Opposition": {"angle": 180, "orb": 8}
-    }
-    
-    for i in range(len(planets)):
-        for j in range(i+1, len(planets)):
-            planet1, planet2 = planets[i], planets[j]
-            angle1, angle2 = degrees[planet1], degrees[planet2]
-            
-            diff = abs(angle1 - angle2) % 360
-            if diff > 180:
-                diff = 360 - diff
-            
-            for aspect_name, aspect_data in aspect_types.items():
-                aspect_angle = aspect_data["angle"]
-                orb = aspect_data["orb"]
-                
-                if abs(diff - aspect_angle) <= orb:
-                    orb_difference = abs(diff - aspect_angle)
-                    if orb_difference <= 2:
-                        strength = "Exact"
-                    elif orb_difference <= 4:
-                        strength = "Close"
-                    else:
-                        strength = "Wide"
-                    
-                    aspects.append({
-                        "Planet 1": planet1,
-                        "Aspect": aspect_name,
-                        "Planet 2": planet2,
-                        "Strength": strength,
-                        "Orb": f"{orb_difference:.1f}°"
-                    })
-    
-    return aspects
-
-def calculate_market_sentiment_dynamic(planetary_data, aspects, date):
-    sentiment_score = 0
-    sentiment_factors = []
-    
-    # Check if we have actual market data for this date
-    if date in actual_market_data:
-        market_data = actual_market_data[date]
-        return market_data["sentiment"], market_data["score"], [f"Actual market: {market_data['reason']}"]
-    
-    # Otherwise, calculate based on planetary positions
-    for planet in planetary_data:
-        strength = planet.get("Strength", "Neutral")
-        planet_name = planet["Planet"]
-        
-        if planet_name in ["Jupiter", "Venus"]:
-            if strength == "Exalted":
-                sentiment_score += 3
-                sentiment_factors.append(f"✅ {planet_name} exalted (+3)")
-            elif strength == "Own Sign":
-                sentiment_score += 2
-                sentiment_factors.append(f"✅ {planet_name} in own sign (+2)")
-            elif strength == "Debilitated":
-                sentiment_score -= 2
-                sentiment_factors.append(f"❌ {planet_name} debilitated (-2)")
-            else:
-                sentiment_score += 1
-                sentiment_factors.append(f"⚪ {planet_name} neutral (+1)")
-        
-        elif planet_name in ["Mars", "Saturn"]:
-            if strength == "Exalted":
-                sentiment_score += 1
-                sentiment_factors.append(f"⚡ {planet_name} exalted (+1)")
-            elif strength == "Own Sign":
-                sentiment_score += 0.5
-                sentiment_factors.append(f"⚡ {planet_name} in own sign (+0.5)")
-            elif strength == "Debilitated":
-                sentiment_score -= 3
-                sentiment_factors.append(f"💥 {planet_name} debilitated (-3)")
-            else:
-                sentiment_score -= 1
-                sentiment_factors.append(f"⚠️ {planet_name} neutral (-1)")
-        
-        elif planet_name in ["Rahu", "Ketu"]:
-            if strength == "Exalted":
-                sentiment_score += 0.5
-                sentiment_factors.append(f"🌟 {planet_name} exalted (+0.5)")
-            elif strength == "Debilitated":
-                sentiment_score -= 2
-                sentiment_factors.append(f"🌑 {planet_name} debilitated (-2)")
-            else:
-                sentiment_score -= 0.5
-                sentiment_factors.append(f"🔄 {planet_name} creates uncertainty (-0.5)")
-    
-    # Enhanced aspect influence with more weight for negative aspects
-    for aspect in aspects[:6]:
-        aspect_type = aspect["Aspect"]
-        strength = aspect["Strength"]
-        
-        multiplier = {"Exact": 1.0, "Close": 0.8, "Wide": 0.5}[strength]
-        
-        if aspect_type in ["Trine", "Sextile"]:
-            sentiment_score += 1 * multiplier
-            sentiment_factors.append(f"🔺 {aspect['Planet 1']}-{aspect['Planet 2']} {aspect_type} (+{1*multiplier:.1f})")
-        elif aspect_type in ["Square", "Opposition"]:
-            # Increase negative impact of challenging aspects
-            sentiment_score -= 1.5 * multiplier  # Increased from 1.0 to 1.5
-            sentiment_factors.append(f"🔻 {aspect['Planet 1']}-{aspect['Planet 2']} {aspect_type} (-{1.5*multiplier:.1f})")
-    
-    # Day of week influence with more realistic weights
-    weekday = date.weekday()
-    weekday_effects = {
-        0: ("🌙 Monday (Moon day) - emotional volatility", -0.8),  # Increased negative impact
-        1: ("⚔️ Tuesday (Mars day) - aggressive trading", -1.2),  # Increased negative impact
-        2: ("☿️ Wednesday (Mercury day) - volatile trading", -0.5),  # Added Wednesday
-        3: ("🎯 Thursday (Jupiter day) - optimistic trading", 0.8),  # Reduced positive impact
-        4: ("💎 Friday (Venus day) - favorable for gains", 0.3),  # Reduced positive impact
-        5: ("🪐 Saturday (Saturn day) - slow trading", -0.7),  # Added Saturday
-        6: ("☉ Sunday (Sun day) - weekly close effect", -0.4)  # Added Sunday
-    }
-    
-    if weekday in weekday_effects:
-        effect_text, effect_score = weekday_effects[weekday]
-        sentiment_score += effect_score
-        sentiment_factors.append(f"{effect_text} ({effect_score:+.1f})")
-    
-    # Special date-based adjustments
-    if date.month == 8 and date.day in [1, 5, 6]:  # August 1, 5, 6
-        sentiment_score -= 2.5  # Additional bearish adjustment for these specific dates
-        sentiment_factors.append(f"⚠️ Historical bearish pattern for this date (-2.5)")
-    elif date.month == 8 and date.day == 4:  # August 4
-        sentiment_score += 2.0  # Additional bullish adjustment for this specific date
-        sentiment_factors.append(f"✅ Historical bullish pattern for this date (+2.0)")
-    
-    # Determine sentiment level with adjusted thresholds
-    if sentiment_score >= 4:
-        return "Extremely Bullish", sentiment_score, sentiment_factors
-    elif sentiment_score >= 2:
-        return "Very Bullish", sentiment_score, sentiment_factors
-    elif sentiment_score >= 0.5:
-        return "Bullish", sentiment_score, sentiment_factors
-    elif sentiment_score >= -0.5:
-        return "Neutral", sentiment_score, sentiment_factors
-    elif sentiment_score >= -2:
-        return "Bearish", sentiment_score, sentiment_factors
-    elif sentiment_score >= -4:
-        return "Very Bearish", sentiment_score, sentiment_factors
-    else:
-        return "Extremely Bearish", sentiment_score, sentiment_factors
-
-def generate_dynamic_timeline(symbol, date, planetary_degrees, aspects):
-    market_type = "Indian" if symbol.upper() in ["NIFTY", "BANKNIFTY", "FINNIFTY", "MIDCPNIFTY"] else "International"
-    
-    hora_sequence = ["Sun", "Venus", "Mercury", "Moon", "Saturn", "Jupiter", "Mars"]
-    
-    if market_type == "Indian":
-        times = ["09:15 AM", "10:15 AM", "11:15 AM", "12:15 PM", "01:15 PM", "02:15 PM", "03:15 PM"]
-    else:
-        times = ["05:00 AM", "07:00 AM", "09:00 AM", "11:00 AM", "01:00 PM", "03:00 PM", "05:00 PM", "07:00 PM", "09:00 PM", "11:00 PM"]
-    
-    timeline_data = []
-    hora_index = (date.weekday() * 24 + 9) % 7
-    
-    for i, time_str in enumerate(times):
-        hora_lord = hora_sequence[hora_index % 7]
-        
-        hora_degree = planetary_degrees.get(hora_lord, 0)
-        hora_sign = get_sign_from_degree(hora_degree)
-        hora_nakshatra = get_nakshatra_from_degree(hora_degree)
-        hora_strength = get_planet_strength(hora_lord, hora_sign)
-        
-        relevant_aspects = [asp for asp in aspects if asp["Planet 1"] == hora_lord or asp["Planet 2"] == hora_lord]
-        
-        influence_parts = []
-        influence_parts.append(f"{hora_lord} at {hora_degree:.1f}° in {hora_sign} ({hora_nakshatra})")
-        
-        if hora_strength != "Neutral":
-            influence_parts.append(f"{hora_lord} is {hora_strength}")
-        
-        sentiment_score = 0
-        for aspect in relevant_aspects[:2]:
-            other_planet = aspect["Planet 2"] if aspect["Planet 1"] == hora_lord else aspect["Planet 1"]
-            aspect_type = aspect["Aspect"]
-            strength = aspect["Strength"]
-            
-            influence_parts.append(f"{aspect_type} with {other_planet} ({strength})")
-            
-            if aspect_type in ["Trine", "Sextile"]:
-                sentiment_score += {"Exact": 2, "Close": 1.5, "Wide": 1}[strength]
-            elif aspect_type in ["Square", "Opposition"]:
-                sentiment_score -= {"Exact": 2, "Close": 1.5, "Wide": 1}[strength]
-        
-        # Adjust sentiment based on actual market data for the date
-        if date in actual_market_data:
-            market_sentiment = actual_market_data[date]["sentiment"]
-            if "Bearish" in market_sentiment:
-                sentiment_score -= 1.5  # Adjust for bearish market
-            elif "Bullish" in market_sentiment:
-                sentiment_score += 1.0  # Adjust for bullish market
-        
-        if hora_lord in ["Jupiter", "Venus"]:
-            sentiment_score += {"Exalted": 2, "Own Sign": 1, "Debilitated": -2}.get(hora_strength, 0)
-        elif hora_lord in ["Mars", "Saturn", "Rahu", "Ketu"]:
-            sentiment_score += {"Exalted": 1, "Own Sign": 0.5, "Debilitated": -2}.get(hora_strength, -0.5)
-        else:
-            sentiment_score += {"Exalted": 1.5, "Own Sign": 1, "Debilitated": -1.5}.get(hora_strength, 0)
-        
-        if sentiment_score >= 2:
-            sentiment = "Very Bullish"
-        elif sentiment_score >= 1:
-            sentiment = "Bullish"
-        elif sentiment_score >= -1:
-            sentiment = "Neutral"
-        elif sentiment_score >= -2:
-            sentiment = "Bearish"
-        else:
-            sentiment = "Very Bearish"
-        
-        timeline_data.append({
-            "Time": time_str,
-            "Hora Lord": hora_lord,
-            "Influence": ". ".join(influence_parts),
-            "Sentiment": sentiment,
-            "Score": sentiment_score,
-            "Action": "BUY" if sentiment_score > 1 else "SELL" if sentiment_score < -1 else "HOLD"
-        })
-        
-        hora_index += 1
-    
-    return timeline_data
-
-def update_all_data(date, symbol):
-    with st.spinner("Updating planetary data..."):
-        st.session_state.planetary_degrees = calculate_dynamic_planetary_positions(date)
-        
-        planetary_data = []
-        for planet, degree in st.session_state.planetary_degrees.items():
-            sign = get_sign_from_degree(degree)
-            nakshatra = get_nakshatra_from_degree(degree)
-            strength = get_planet_strength(planet, sign)
-            
-            planetary_data.append({
-                "Planet": planet,
-                "Degree": f"{int(degree)}°{int((degree % 1) * 60)}'",
-                "Sign": sign,
-                "Nakshatra": nakshatra,
-                "Strength": strength
-            })
-        
-        st.session_state.planetary_data = planetary_data
-        st.session_state.aspects = calculate_dynamic_aspects(st.session_state.planetary_degrees)
-        st.session_state.timeline_data = generate_dynamic_timeline(symbol, date, st.session_state.planetary_degrees, st.session_state.aspects)
-        
-        sentiment, sentiment_score, sentiment_factors = calculate_market_sentiment_dynamic(
-            st.session_state.planetary_data, st.session_state.aspects, date
-        )
-        
-        st.session_state.sentiment_data = {
-            "sentiment": sentiment,
-            "sentiment_score": sentiment_score,
-            "sentiment_factors": sentiment_factors
-        }
-        
-        # Generate aspects data for the selected date
-        if date == datetime.date(2025, 8, 6):
-            st.session_state.aspects_data = aug6_aspects
-        else:
-            st.session_state.aspects_data = generate_aspects_for_date(date)
-        
-        # Initialize filtered aspects data
-        st.session_state.filtered_aspects_data = st.session_state.aspects_data.copy()
-        
-        forecast_data = []
-        for i in range(-3, 4):
-            forecast_date = date + datetime.timedelta(days=i)
-            forecast_degrees = calculate_dynamic_planetary_positions(forecast_date)
-            forecast_aspects = calculate_dynamic_aspects(forecast_degrees)
-            
-            forecast_planetary_data = []
-            for planet, degree in forecast_degrees.items():
-                sign = get_sign_from_degree(degree)
-                strength = get_planet_strength(planet, sign)
-                forecast_planetary_data.append({
-                    "Planet": planet,
-                    "Sign": sign,
-                    "Strength": strength
-                })
-            
-            forecast_sentiment, forecast_score, forecast_factors = calculate_market_sentiment_dynamic(
-                forecast_planetary_data, forecast_aspects, forecast_date
-            )
-            
-            forecast_data.append({
-                "Date": forecast_date.strftime("%d %B %Y"),
-                "Day": forecast_date.strftime("%A"),
-                "Sentiment": forecast_sentiment,
-                "Score": forecast_score,
-                "Aspects": len(forecast_aspects),
-                "Is Today": i == 0,
-                "Factors": forecast_factors
-            })
+def update_all_data(date, symbol, horizon=FORECAST_HORIZON_DAYS, city=None):
+    with st.spinner("Updating planetary data..."), stage("update_all_data"):
+        hora_city = find_city(city)
+        key = (date, symbol, get_market_type(symbol), hora_city, aspect_rules_version(), get_market_store().generation)
+        dashboard_data = get_dashboard_cache().get_or_compute(key, lambda: compute_dashboard_data(
+            date, symbol, get_aspect_index(), hora_city, get_sun_times_cache(), st.session_state.stage_timer
+        ))
         
-        st.session_state.forecast_data = forecast_data
+        # Sessions keep references to the shared cached result, not copies
+        for name, value in dashboard_data.items():
+            st.session_state[name] = value
+        with stage("update.forecast_window"):
+            st.session_state.forecast_data = forecast_window(date, horizon, get_forecast_day_cache())
         st.session_state.last_update = datetime.datetime.now()
 
 # Initialize session state
 initialize_session_state()
 
+# Stage timings of this script run, shown in the sidebar diagnostics panel
+st.session_state.stage_timer = StageTimer("script", st.session_state.diagnostics)
+
 # Header with dynamic styling
 st.markdown("""
 <div class="main-title">🌟 DYNAMIC PLANETARY TRADING DASHBOARD</div>
@@ -836,6 +416,7 @@ st.sidebar.markdown("""
 date = st.sidebar.date_input("📅 Select Date", value=st.session_state.current_date)
 symbol = st.sidebar.text_input("💹 Trading Symbol", value=st.session_state.current_symbol)
 city = st.sidebar.text_input("🌍 Location", value="Mumbai")
+horizon = st.sidebar.number_input("🔭 Forecast Horizon (± days)", min_value=1, max_value=30, value=st.session_state.forecast_horizon)
 
 st.sidebar.markdown("---")
 st.sidebar.markdown("""
@@ -847,15 +428,19 @@ st.sidebar.markdown("""
 """, unsafe_allow_html=True)
 
 # Auto-update when inputs change
-if date != st.session_state.current_date or symbol != st.session_state.current_symbol:
+if (date != st.session_state.current_date or symbol != st.session_state.current_symbol
+        or horizon != st.session_state.forecast_horizon or city != st.session_state.current_city):
     st.session_state.current_date = date
     st.session_state.current_symbol = symbol
-    update_all_data(date, symbol)
+    st.session_state.forecast_horizon = horizon
+    st.session_state.current_city = city
+    update_all_data(date, symbol, horizon, city)
+    finish_run()
     st.rerun()
 
 # Initialize data if not exists
-if not st.session_state.planetary_data or not st.session_state.last_update:
-    update_all_data(date, symbol)
+if st.session_state.planetary_data is None or not st.session_state.last_update:
+    update_all_data(date, symbol, horizon, city)
 
 # Display market sentiment with enhanced card
 sentiment_data = st.session_state.sentiment_data
@@ -883,7 +468,52 @@ if sentiment_data:
 # Create tabs with dynamic layouts
 tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["🕐 Transit Timeline", "🪐 Planetary Positions", "⚡ Strategy", "🔮 Forecast", "📅 Aspects Timeline", "🔍 Advanced Aspect Search"])
 
-with tab1:
+@st.fragment
+@timed_panel
+def watchlist_panel():
+    """Watchlist scanner; editing the symbols reruns only this panel"""
+    # Watchlist scanner: one timeline per market session group, one board row per symbol
+    st.subheader("📋 Watchlist Scanner")
+    watchlist = parse_watchlist(st.text_area("Symbols (comma or newline separated)", value=DEFAULT_WATCHLIST))
+    if watchlist:
+        board_df = pd.DataFrame(scan_watchlist(
+            watchlist, st.session_state.current_date, st.session_state.planetary_degrees or None, st.session_state.aspects,
+            find_city(st.session_state.current_city), get_sun_times_cache()
+        ))
+        action_counts = board_df["Action"].value_counts()
+        st.caption(
+            f"{len(board_df)} symbols in {board_df.groupby(['Market', 'Realized']).ngroups} session groups: "
+            f"{action_counts.get('BUY', 0)} BUY, {action_counts.get('SELL', 0)} SELL, {action_counts.get('HOLD', 0)} HOLD"
+        )
+        st.dataframe(board_df, use_container_width=True, hide_index=True)
+    else:
+        st.info("Add symbols to scan the watchlist.")
+
+@st.fragment
+@timed_panel
+def city_hours_panel():
+    """Current planetary hour by city; changing the cities reruns only this panel"""
+    # Current planetary hour in several cities, all read through the shared sunrise cache
+    st.subheader("🌍 Planetary Hours by City")
+    compare_cities = st.multiselect("Compare cities", list(CITY_COORDINATES), default=["Mumbai", "London", "New York"])
+    city_rows = []
+    for compare_city in compare_cities:
+        local_now = city_local_now(compare_city)
+        today = np.datetime64(local_now.date())
+        hours = city_planetary_hours(compare_city, [today - 1, today], get_sun_times_cache())
+        hour = np.searchsorted(hours["start"].ravel(), np.datetime64(local_now, "s"), side="right") - 1
+        city_rows.append({
+            "City": compare_city,
+            "Local Time": local_now.strftime("%I:%M %p"),
+            "Sunrise": hours["start"][1, 0].item().strftime("%I:%M %p"),
+            "Sunset": hours["start"][1, 12].item().strftime("%I:%M %p"),
+            "Current Hora": PLANETS[hours["lord"].ravel()[hour]],
+            "Until": hours["end"].ravel()[hour].item().strftime("%I:%M %p")
+        })
+    if city_rows:
+        st.dataframe(pd.DataFrame(city_rows), use_container_width=True, hide_index=True)
+
+with tab1, stage("tab1"):
     st.markdown("""
     <div class="tab1-theme">
         <h1 style="color: white; text-align: center;">🕐 Critical Transit Timeline</h1>
@@ -894,20 +524,25 @@ with tab1:
         # Create a vertical timeline layout
         st.markdown('<div class="timeline-line"></div>', unsafe_allow_html=True)
         
-        now = datetime.datetime.now()
+        # Current hora: binary search of the slot boundaries, None outside the session
+        hora_city = find_city(st.session_state.current_city)
+        if hora_city:
+            sun = get_sun_times_cache().get_range(hora_city, [st.session_state.current_date])
+            st.caption(
+                f"Horas from local sunrise in {hora_city}: sunrise {sun['sunrise'][0].item():%I:%M %p}, "
+                f"sunset {sun['sunset'][0].item():%I:%M %p} (standard time)"
+            )
+            now = city_local_now(hora_city)
+        else:
+            st.caption(f"{st.session_state.current_city or 'No location'} is not in the city table; using the fixed hora count.")
+            now = datetime.datetime.now()
+        # Match by time of day as before, so the slot pulses for any selected date
+        now = datetime.datetime.combine(st.session_state.current_date, now.time())
+        current = current_slot(st.session_state.timeline_grid, now)
         
+        timeline_cards = []
         for i, item in enumerate(st.session_state.timeline_data):
-            # Determine if current hora
-            is_current = False
-            try:
-                item_time = datetime.datetime.strptime(item["Time"], "%I:%M %p").time()
-                if i < len(st.session_state.timeline_data) - 1:
-                    next_time = datetime.datetime.strptime(st.session_state.timeline_data[i+1]["Time"], "%I:%M %p").time()
-                    is_current = item_time <= now.time() < next_time
-                else:
-                    is_current = item_time <= now.time()
-            except:
-                pass
+            is_current = current == (0, i)
             
             # Card styling based on sentiment
             if item['Sentiment'] in ["Very Bullish", "Bullish"]:
@@ -920,7 +555,7 @@ with tab1:
             if is_current:
                 card_class += " pulse"
             
-            st.markdown(f"""
+            timeline_cards.append(f"""
             <div class="timeline-item">
                 <div class="card {card_class}">
                     <div style="display: flex; justify-content: space-between; align-items: center;">
@@ -940,24 +575,28 @@ with tab1:
                     </div>
                 </div>
             </div>
-            """, unsafe_allow_html=True)
+            """)
+        render_cards(timeline_cards)
     else:
         st.warning("No timeline data available. Please update parameters.")
+    
+    watchlist_panel()
+    city_hours_panel()
 
-with tab2:
+with tab2, stage("tab2"):
     st.markdown("""
     <div class="tab2-theme">
         <h1 style="color: white; text-align: center;">🪐 Planetary Positions & Strengths</h1>
     </div>
     """, unsafe_allow_html=True)
     
-    if st.session_state.planetary_data:
+    if st.session_state.planetary_data is not None:
         # Create a circular layout for planets
-        st.markdown("""
+        planet_cards = ["""
         <div style="display: flex; flex-wrap: wrap; justify-content: center; gap: 20px; margin: 20px 0;">
-        """, unsafe_allow_html=True)
+        """]
         
-        for planet in st.session_state.planetary_data:
+        for planet in planet_display_rows(st.session_state.planetary_data):
             strength_color = {
                 "Exalted": "#16a34a",
                 "Own Sign": "#3b82f6",
@@ -965,63 +604,66 @@ with tab2:
                 "Neutral": "#f59e0b"
             }.get(planet['Strength'], "#6b7280")
             
-            st.markdown(f"""
+            planet_cards.append(f"""
             <div class="planet-card">
                 <h3 style="color: {strength_color};">{planet['Planet']}</h3>
                 <p><strong>Position:</strong> {planet['Degree']} in {planet['Sign']}</p>
                 <p><strong>Nakshatra:</strong> {planet['Nakshatra']}</p>
                 <p style="color: {strength_color}; font-weight: bold;">{planet['Strength']}</p>
             </div>
-            """, unsafe_allow_html=True)
+            """)
         
-        st.markdown("</div>", unsafe_allow_html=True)
+        planet_cards.append("</div>")
+        render_cards(planet_cards)
         
         # Create a 3D scatter plot for planet positions
-        fig = go.Figure()
-        
-        planet_colors = {
-            "Sun": "#FDB813", "Moon": "#C4C4C4", "Mercury": "#8C7853", 
-            "Venus": "#FFC649", "Mars": "#CD5C5C", "Jupiter": "#D8CA9D",
-            "Saturn": "#FAD5A5", "Rahu": "#4B0082", "Ketu": "#8B0000"
-        }
-        
-        for planet in st.session_state.planetary_data:
-            degree = float(planet['Degree'].split('°')[0]) + float(planet['Degree'].split('°')[1].replace("'", '')) / 60
-            rad = math.radians(degree)
+        with stage("chart.positions_3d"):
+            fig = go.Figure()
             
-            fig.add_trace(go.Scatter3d(
-                x=[math.cos(rad)],
-                y=[math.sin(rad)],
-                z=[0],
-                mode='markers+text',
-                marker=dict(size=15, color=planet_colors.get(planet['Planet'], '#666')),
-                text=planet['Planet'],
-                textposition="top center",
-                name=planet['Planet']
-            ))
-        
-        fig.update_layout(
-            title="3D Planetary Positions",
-            scene=dict(
-                xaxis=dict(title='X'),
-                yaxis=dict(title='Y'),
-                zaxis=dict(title='Z'),
-                camera=dict(eye=dict(x=1.5, y=1.5, z=1.5))
-            ),
-            height=500
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+            planet_colors = {
+                "Sun": "#FDB813", "Moon": "#C4C4C4", "Mercury": "#8C7853", 
+                "Venus": "#FFC649", "Mars": "#CD5C5C", "Jupiter": "#D8CA9D",
+                "Saturn": "#FAD5A5", "Rahu": "#4B0082", "Ketu": "#8B0000"
+            }
+            
+            planets = st.session_state.planetary_data
+            for planet, degree in zip(planets["planet"].tolist(), planets["degree"].tolist()):
+                planet_name = PLANETS[planet]
+                rad = math.radians(degree)
+            
+                fig.add_trace(go.Scatter3d(
+                    x=[math.cos(rad)],
+                    y=[math.sin(rad)],
+                    z=[0],
+                    mode='markers+text',
+                    marker=dict(size=15, color=planet_colors.get(planet_name, '#666')),
+                    text=planet_name,
+                    textposition="top center",
+                    name=planet_name
+                ))
+            
+            fig.update_layout(
+                title="3D Planetary Positions",
+                scene=dict(
+                    xaxis=dict(title='X'),
+                    yaxis=dict(title='Y'),
+                    zaxis=dict(title='Z'),
+                    camera=dict(eye=dict(x=1.5, y=1.5, z=1.5))
+                ),
+                height=500
+            )
+            
+            plotly_chart(fig, "chart.positions_3d")
         
         # Display aspects in a table
-        if st.session_state.aspects:
+        if len(st.session_state.aspects):
             st.subheader("⚡ Active Planetary Aspects")
-            aspects_df = pd.DataFrame(st.session_state.aspects[:15])
+            aspects_df = pd.DataFrame(aspect_display_rows(st.session_state.aspects[:15]))
             st.dataframe(aspects_df, use_container_width=True)
     else:
         st.info("No planetary data available. Please update parameters.")
 
-with tab3:
+with tab3, stage("tab3"):
     st.markdown("""
     <div class="tab3-theme">
         <h1 style="color: white; text-align: center;">⚡ Dynamic Trading Strategy</h1>
@@ -1042,12 +684,11 @@ with tab3:
             </div>
             """, unsafe_allow_html=True)
             
-            for factor in sentiment_data["sentiment_factors"][:10]:
-                st.markdown(f"""
+            render_cards([f"""
                 <div class="card">
                     <p>• {factor}</p>
                 </div>
-                """, unsafe_allow_html=True)
+                """ for factor in sentiment_data["sentiment_factors"][:10]])
         
         with col2:
             st.markdown("""
@@ -1096,17 +737,15 @@ with tab3:
                 </div>
                 """, unsafe_allow_html=True)
                 
-                for entry in best_entries[:3]:
-                    target = f"{1.2 + entry['Score'] * 0.3:.1f}%"
-                    st.markdown(f"""
+                render_cards([f"""
                     <div class="card bullish-card">
                         <h4>⏰ {entry['Time']} - {entry['Hora Lord']} Hora</h4>
                         <p><strong>Action:</strong> Strong Buy</p>
-                        <p><strong>Target:</strong> {target}</p>
+                        <p><strong>Target:</strong> {1.2 + entry['Score'] * 0.3:.1f}%</p>
                         <p><strong>Stop:</strong> 0.5%</p>
                         <p><strong>Reason:</strong> {entry['Influence'][:100]}...</p>
                     </div>
-                    """, unsafe_allow_html=True)
+                    """ for entry in best_entries[:3]])
             
             if avoid_periods:
                 st.markdown("""
@@ -1115,14 +754,13 @@ with tab3:
                 </div>
                 """, unsafe_allow_html=True)
                 
-                for avoid in avoid_periods[:3]:
-                    st.markdown(f"""
+                render_cards([f"""
                     <div class="card bearish-card">
                         <h4>⏰ {avoid['Time']} - {avoid['Hora Lord']} Hora</h4>
                         <p><strong>Action:</strong> Avoid/Short</p>
                         <p><strong>Reason:</strong> {avoid['Influence'][:100]}...</p>
                     </div>
-                    """, unsafe_allow_html=True)
+                    """ for avoid in avoid_periods[:3]])
         
         # Symbol-specific analysis
         st.markdown(f"""
@@ -1166,19 +804,59 @@ with tab3:
             </div>
             """, unsafe_allow_html=True)
 
-with tab4:
-    st.markdown("""
-    <div class="tab4-theme">
-        <h1 style="color: white; text-align: center;">🔮 Multi-day Forecast</h1>
-    </div>
-    """, unsafe_allow_html=True)
+@st.fragment
+@timed_panel
+def forecast_panel():
+    """Forecast cards, chart and comparison; the range and page widgets rerun only this panel"""
+    window_label = f"±{st.session_state.forecast_horizon} days"
+    forecast_range = st.radio(
+        "📆 Forecast Range", [0, *FORECAST_LONG_HORIZONS], horizontal=True,
+        format_func=lambda days: window_label if days == 0 else f"{days} days"
+    )
     
-    if st.session_state.forecast_data:
+    if forecast_range:
+        # Long horizons: score every day in one batch, page the cards and downsample the chart
+        forecast_start = st.session_state.current_date
+        series = forecast_series(forecast_start, forecast_range)
+        page_count = math.ceil(forecast_range / FORECAST_PAGE_SIZE)
+        page = st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, value=1)
+        page_dates = series["date"][(page - 1) * FORECAST_PAGE_SIZE:page * FORECAST_PAGE_SIZE].tolist()
+        forecast_rows = [
+            {**row, "Is Today": forecast_date == forecast_start}
+            for forecast_date, row in zip(page_dates, get_forecast_day_cache().get_range(page_dates))
+        ]
+        
+        kept = lttb_indices(np.arange(forecast_range), series["score"], FORECAST_CHART_POINTS)
+        forecast_df = pd.DataFrame({"Date": series["date"][kept], "Score": series["score"][kept]})
+        chart_title = f"{forecast_range}-Day Sentiment Forecast ({len(kept)} of {forecast_range} points shown)"
+        
+        comparison_rows = []
+        realized = get_market_store().read(forecast_start, forecast_start + datetime.timedelta(days=forecast_range - 1))
+        for actual_date in realized["day"].tolist():
+            offset = (actual_date - forecast_start).days
+            if 0 <= offset < forecast_range:
+                comparison_rows.append({
+                    "Date": actual_date.strftime("%d %B %Y"),
+                    "Sentiment": SENTIMENT_LEVELS[series["sentiment"][offset]],
+                    "Score": float(series["score"][offset])
+                })
+    else:
+        forecast_rows = st.session_state.forecast_data
+        page_dates = [
+            st.session_state.current_date + datetime.timedelta(days=offset)
+            for offset in range(-st.session_state.forecast_horizon, st.session_state.forecast_horizon + 1)
+        ]
+        forecast_df = pd.DataFrame(forecast_rows)
+        chart_title = f"{len(forecast_df)}-Day Sentiment Forecast"
+        comparison_rows = forecast_rows
+    
+    if forecast_rows:
         # Create a calendar-like layout
         col1, col2 = st.columns(2)
         
-        for i, forecast in enumerate(st.session_state.forecast_data):
-            current_col = col1 if i % 2 == 0 else col2
+        # Alternate cards between the columns, one batched element per column
+        column_cards = ([], [])
+        for i, (forecast_date, forecast) in enumerate(zip(page_dates, forecast_rows)):
             
             sentiment_color = {
                 "Extremely Bullish": "#16a34a",
@@ -1195,12 +873,13 @@ with tab4:
             else:
                 border_style = ""
             
-            # Display key factors for this forecast
+            # Display key factors for this forecast, built only for the cards on screen
+            factors = sentiment_factors_for_date(forecast_date)
             factors_text = ""
-            if 'Factors' in forecast and forecast['Factors']:
-                factors_text = "<br><small>" + "<br>".join([f"• {factor}" for factor in forecast['Factors'][:3]]) + "</small>"
+            if factors:
+                factors_text = "<br><small>" + "<br>".join([f"• {factor}" for factor in factors[:3]]) + "</small>"
             
-            current_col.markdown(f"""
+            column_cards[i % 2].append(f"""
             <div class="forecast-card" style="{border_style}">
                 <h3 style="color: {sentiment_color};">{'🎯 ' if forecast['Is Today'] else ''}{forecast['Date']} ({forecast['Day']})</h3>
                 <p><strong>Sentiment:</strong> <span style="color: {sentiment_color}; font-weight: bold;">{forecast['Sentiment']}</span></p>
@@ -1209,34 +888,39 @@ with tab4:
                 <p><strong>Recommendation:</strong> {'Long bias' if forecast['Score'] > 1 else 'Short bias' if forecast['Score'] < -1 else 'Neutral'}</p>
                 {factors_text}
             </div>
-            """, unsafe_allow_html=True)
+            """)
+        render_cards(column_cards[0], col1)
+        render_cards(column_cards[1], col2)
         
         # Create a line chart for forecast scores
-        forecast_df = pd.DataFrame(st.session_state.forecast_data)
-        fig = px.line(forecast_df, x='Date', y='Score', 
-                      title='7-Day Sentiment Forecast',
-                      labels={'Score': 'Sentiment Score', 'Date': 'Date'},
-                      line_shape='linear')
-        
-        # Add horizontal lines for sentiment thresholds
-        fig.add_hline(y=4, line_dash="dash", line_color="green", annotation_text="Extremely Bullish")
-        fig.add_hline(y=2, line_dash="dash", line_color="lightgreen", annotation_text="Very Bullish")
-        fig.add_hline(y=0.5, line_dash="dash", line_color="yellow", annotation_text="Bullish")
-        fig.add_hline(y=-0.5, line_dash="dash", line_color="orange", annotation_text="Bearish")
-        fig.add_hline(y=-2, line_dash="dash", line_color="red", annotation_text="Very Bearish")
-        fig.add_hline(y=-4, line_dash="dash", line_color="darkred", annotation_text="Extremely Bearish")
-        
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        with stage("chart.forecast"):
+            fig = px.line(forecast_df, x='Date', y='Score', 
+                          title=chart_title,
+                          labels={'Score': 'Sentiment Score', 'Date': 'Date'},
+                          line_shape='linear')
+            
+            # Horizontal lines for sentiment thresholds, set in one layout update (add_hline costs ~15 ms per line)
+            fig.update_layout(
+                height=400,
+                shapes=[
+                    dict(type="line", xref="paper", x0=0, x1=1, y0=y, y1=y, line=dict(dash="dash", color=color))
+                    for y, color, _ in SENTIMENT_GUIDES
+                ],
+                annotations=[
+                    dict(xref="paper", x=1, y=y, text=label, showarrow=False, xanchor="right", yanchor="bottom")
+                    for y, _, label in SENTIMENT_GUIDES
+                ]
+            )
+            plotly_chart(fig, "chart.forecast")
         
         # Show actual vs predicted comparison
         st.subheader("📊 Actual vs Predicted Sentiment")
         
         comparison_data = []
-        for forecast in st.session_state.forecast_data:
+        for forecast in comparison_rows:
             forecast_date = datetime.datetime.strptime(forecast['Date'], "%d %B %Y").date()
-            if forecast_date in actual_market_data:
-                actual = actual_market_data[forecast_date]
+            actual = get_market_store().lookup(forecast_date)
+            if actual is not None:
                 comparison_data.append({
                     "Date": forecast['Date'],
                     "Predicted": forecast['Sentiment'],
@@ -1251,7 +935,58 @@ with tab4:
     else:
         st.info("No forecast data available. Please update parameters.")
 
-with tab5:
+@st.fragment
+@timed_panel
+def backtest_panel():
+    """Sentiment backtest; the path and run widgets rerun only this panel"""
+    # Backtest of the BUY/SELL/HOLD rule against local daily OHLC history
+    st.subheader("🧪 Sentiment Backtest")
+    ohlc_path = st.text_input("OHLC history (CSV file or folder of CSVs)", value=OHLC_HISTORY_PATH)
+    ohlc_files = sorted(glob.glob(os.path.join(ohlc_path, "*.csv"))) if os.path.isdir(ohlc_path) else [ohlc_path]
+    ohlc_files = [path for path in ohlc_files if os.path.isfile(path)]
+    
+    if not ohlc_files:
+        st.info("No OHLC history found. Provide daily Date, Symbol, Open, High, Low, Close columns to run the backtest.")
+    elif st.checkbox("Run backtest"):
+        with st.spinner("Backtesting sentiment against OHLC history..."):
+            backtest = run_ohlc_backtest(ohlc_path, max(os.path.getmtime(path) for path in ohlc_files))
+        
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Hit Rate", f"{backtest['hit_rate']:.1%}")
+        col2.metric("Trades", f"{backtest['trades']:,}")
+        col3.metric("Information Coefficient", f"{backtest['ic']:.3f}")
+        col4.metric("Strategy Equity", f"{backtest['equity'].iloc[-1]:.2f}x", f"{backtest['benchmark'].iloc[-1]:.2f}x buy & hold")
+        st.caption(
+            f"{backtest['symbols']} symbols, {len(backtest['dates'])} dates, {backtest['observations']:,} symbol-days; "
+            + ", ".join(f"{action} {count} days" for action, count in backtest['actions'].items())
+        )
+        
+        st.markdown("**Predicted sentiment vs realized direction (symbol-days)**")
+        st.dataframe(backtest['confusion'], use_container_width=True)
+        
+        kept = lttb_indices(np.arange(len(backtest['dates'])), backtest['equity'].to_numpy(), FORECAST_CHART_POINTS)
+        with stage("chart.backtest_equity"):
+            equity_fig = go.Figure()
+            equity_fig.add_trace(go.Scatter(x=backtest['equity'].index[kept], y=backtest['equity'].to_numpy()[kept], name="Sentiment rule"))
+            equity_fig.add_trace(go.Scatter(x=backtest['benchmark'].index[kept], y=backtest['benchmark'].to_numpy()[kept], name="Buy & hold"))
+            equity_fig.update_layout(title="Equity Curve (equal-weight portfolio)", height=400)
+            plotly_chart(equity_fig, "chart.backtest_equity")
+
+with tab4, stage("tab4"):
+    st.markdown("""
+    <div class="tab4-theme">
+        <h1 style="color: white; text-align: center;">🔮 Multi-day Forecast</h1>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    forecast_panel()
+    
+    backtest_panel()
+
+@st.fragment
+@timed_panel
+def aspect_timeline_panel(date):
+    """Tab5 aspect timeline; the symbol selectbox reruns only this panel"""
     st.markdown("""
     <div class="tab5-theme">
         <h1 style="color: white; text-align: center;">📅 Planetary Aspects Timeline</h1>
@@ -1302,12 +1037,17 @@ with tab5:
             "Aspect": aspect["aspect"],
             "Meaning": aspect["meaning"],
             "Impact": impact,
-            "Market Status": market_status
+            "Market Status": market_status,
+            "Orb Window": aspect.get("orb_window", "")
         })
     
     # Display aspects in a timeline layout
     st.subheader(f"Planetary Aspects for {selected_symbol} - {date.strftime('%d %B %Y')}")
     
+    if not aspects_display:
+        st.info("No planetary aspects perfect on this date.")
+    
+    aspect_cards = []
     for aspect in aspects_display:
         # Determine impact category for coloring
         impact_category = "Neutral"
@@ -1322,20 +1062,22 @@ with tab5:
             "Neutral": "#f59e0b"
         }.get(impact_category, "#6b7280")
         
-        st.markdown(f"""
+        aspect_cards.append(f"""
         <div class="aspect-card">
             <div style="display: flex; justify-content: space-between; align-items: center;">
                 <div>
                     <h3>{aspect['Time']} - {aspect['Aspect']}</h3>
                     <p><strong>Meaning:</strong> {aspect['Meaning']}</p>
                     <p><strong>Market Status:</strong> {aspect['Market Status']}</p>
+                    {f"<p><strong>In Orb:</strong> {aspect['Orb Window']}</p>" if aspect['Orb Window'] else ""}
                 </div>
                 <div style="text-align: right;">
                     <h4 style="color: {impact_color};">{aspect['Impact']}</h4>
                 </div>
             </div>
         </div>
-        """, unsafe_allow_html=True)
+        """)
+    render_cards(aspect_cards)
     
     # Create a heatmap of aspects
     st.subheader("📊 Aspect Impact Heatmap")
@@ -1357,25 +1099,27 @@ with tab5:
             "Aspect": aspect["Aspect"].split(" (")[0]
         })
     
-    heatmap_df = pd.DataFrame(heatmap_data)
-    
-    fig = px.density_heatmap(
-        heatmap_df, 
-        x="Time", 
-        y="Aspect", 
-        z="Impact",
-        color_continuous_scale=["red", "yellow", "green"],
-        title="Aspect Impact Heatmap"
-    )
-    
-    fig.update_layout(height=400)
-    st.plotly_chart(fig, use_container_width=True)
+    if heatmap_data:
+        heatmap_df = pd.DataFrame(heatmap_data)
+        
+        with stage("chart.aspect_heatmap"):
+            fig = px.density_heatmap(
+                heatmap_df, 
+                x="Time", 
+                y="Aspect", 
+                z="Impact",
+                color_continuous_scale=["red", "yellow", "green"],
+                title="Aspect Impact Heatmap"
+            )
+            
+            fig.update_layout(height=400)
+            plotly_chart(fig, "chart.aspect_heatmap")
     
     # Summary statistics
     st.subheader("📈 Summary Statistics")
     
     # Create a DataFrame for sentiment analysis
-    aspects_df = pd.DataFrame(aspects_display)
+    aspects_df = pd.DataFrame(aspects_display, columns=["Time", "Aspect", "Meaning", "Impact", "Market Status", "Orb Window"])
     sentiment_counts = aspects_df['Impact'].apply(lambda x: 'Positive' if 'Positive' in x or 'recovery' in x.lower() or 'rally' in x.lower() else ('Negative' if 'Negative' in x or 'dip' in x.lower() or 'pressure' in x.lower() or 'risks' in x.lower() else 'Neutral')).value_counts()
     
     col1, col2, col3 = st.columns(3)
@@ -1402,7 +1146,13 @@ with tab5:
         </div>
         """, unsafe_allow_html=True)
 
-with tab6:
+with tab5, stage("tab5"):
+    aspect_timeline_panel(date)
+
+@st.fragment
+@timed_panel
+def aspect_search_panel():
+    """Tab6 filters, search job and results; filter changes rerun only this panel"""
     st.markdown("""
     <div class="tab6-theme">
         <h1 style="color: white; text-align: center;">🔍 Advanced Aspect Search & Timeline</h1>
@@ -1430,149 +1180,138 @@ with tab6:
             default=["Positive", "Negative", "Neutral"]
         )
     
-    # Generate aspects for the selected date range
+    # The search runs on demand in a worker thread; its result stays in the session until the query changes
+    search_key = (search_symbol, start_date, end_date, tuple(impact_filter))
+    search_job = st.session_state.search_job
+    if search_job is not None and search_job.key != search_key:
+        search_job.cancel()
+        search_job = st.session_state.search_job = None
+    
     if start_date > end_date:
         st.error("Start date must be before end date")
+    elif st.button("🔍 Run Search", disabled=search_job is not None and search_job.running):
+        # Missing index years are built on first use, so long ranges can take seconds
+        search_job = st.session_state.search_job = BackgroundJob(
+            get_search_executor(), search_key, search_aspect_range,
+            get_aspect_index(), start_date, end_date, search_symbol, list(impact_filter)
+        )
+    
+    def show_search_progress():
+        """Progress of the running search, refreshed on its own; a full rerun shows the finished result"""
+        job = st.session_state.search_job
+        if job is None or not job.running:
+            st.rerun()
+        st.progress(job.fraction, text=f"Searching aspects... {job.done} of {job.total or '?'} steps")
+        if st.button("✖ Cancel Search"):
+            job.cancel()
+            st.session_state.search_job = None
+            st.rerun()
+    
+    search_df = None
+    if search_job is None:
+        st.info("Set the filters and press Run Search to search the aspect index.")
+    elif search_job.running:
+        st.fragment(show_search_progress, run_every=SEARCH_POLL_SECONDS)()
     else:
-        # Calculate number of days
-        num_days = (end_date - start_date).days + 1
-        
-        # Create a progress bar
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        # Initialize filtered aspects data
-        filtered_aspects = []
-        
-        # Generate aspects for each day in the range
-        for i in range(num_days):
-            current_date = start_date + datetime.timedelta(days=i)
-            
-            # Update progress
-            progress = (i + 1) / num_days
-            progress_bar.progress(progress)
-            status_text.text(f"Generating aspects for {current_date.strftime('%d %B %Y')}...")
-            
-            # Generate aspects for the current date
-            if current_date == datetime.date(2025, 8, 6):
-                daily_aspects = aug6_aspects
-            else:
-                daily_aspects = generate_aspects_for_date(current_date)
-            
-            # Process each aspect
-            for aspect in daily_aspects:
-                # Determine impact based on selected symbol
-                if search_symbol in ["Nifty", "BankNifty"]:
-                    impact = aspect["indian_market"]
-                elif search_symbol in ["Gold", "Silver", "Crude"]:
-                    impact = aspect["commodities"]
-                elif search_symbol == "BTC":
-                    impact = aspect["forex"]
-                elif search_symbol == "DowJones":
-                    impact = aspect["global_market"]
-                else:
-                    impact = "Neutral"
-                
-                # Check if impact matches filter
-                impact_category = "Neutral"
-                if "Positive" in impact or "recovery" in impact.lower() or "rally" in impact.lower():
-                    impact_category = "Positive"
-                elif "Negative" in impact or "dip" in impact.lower() or "pressure" in impact.lower() or "risks" in impact.lower():
-                    impact_category = "Negative"
-                
-                if impact_category in impact_filter:
-                    # Add to filtered aspects
-                    filtered_aspects.append({
-                        "Date": current_date.strftime("%d %B %Y"),
-                        "Time": aspect["time"],
-                        "Aspect": aspect["aspect"],
-                        "Meaning": aspect["meaning"],
-                        "Impact": impact,
-                        "Impact Category": impact_category
-                    })
-        
-        # Clear progress bar
-        progress_bar.empty()
-        status_text.empty()
+        try:
+            search_df = search_job.result()
+        except Exception as error:
+            st.error(f"Aspect search failed: {error}")
         
+        index_stats = get_aspect_index().stats()
+        st.caption(f"Aspect index {index_stats['version']}: {index_stats['mapped_years']} years mapped, {index_stats['built']} built by this process")
+    
+    if search_df is not None:
         # Display filtered aspects
-        if filtered_aspects:
+        if not search_df.empty:
             st.subheader(f"📊 {search_symbol} Aspect Timeline ({start_date.strftime('%d %b %Y')} - {end_date.strftime('%d %b %Y')})")
             
-            # Create a timeline chart
-            timeline_df = pd.DataFrame(filtered_aspects)
-            
-            # Convert date and time to datetime for plotting
-            timeline_df['DateTime'] = pd.to_datetime(timeline_df['Date'] + ' ' + timeline_df['Time'], format='%d %B %Y %I:%M %p')
-            
-            # Create a color map for impacts
-            color_map = {
-                "Positive": "#16a34a",
-                "Negative": "#dc2626",
-                "Neutral": "#f59e0b"
-            }
-            
-            # Create a scatter plot for the timeline
-            fig = px.scatter(
-                timeline_df, 
-                x="DateTime", 
-                y="Aspect",
-                color="Impact Category",
-                color_discrete_map=color_map,
-                hover_data=["Meaning", "Impact"],
-                title=f"{search_symbol} Aspect Timeline",
-                labels={"DateTime": "Date & Time", "Aspect": "Planetary Aspect"}
-            )
+            # Create a timeline chart from the frame's DateTime timestamps
+            timeline_df = search_df
             
-            fig.update_layout(height=500)
-            st.plotly_chart(fig, use_container_width=True)
+            # Create a scatter plot for the timeline; large results use WebGL traces with
+            # epoch milliseconds sent as typed arrays and a hover trimmed to aspect and time
+            with stage("chart.search_timeline"):
+                if len(timeline_df) > SEARCH_WEBGL_POINTS:
+                    milliseconds = timeline_df['DateTime'].to_numpy().astype('datetime64[ms]').astype(np.int64).astype(float)
+                    fig = go.Figure()
+                    for impact_cat, color in SEARCH_IMPACT_COLORS.items():
+                        rows = (timeline_df['Impact Category'] == impact_cat).to_numpy()
+                        if rows.any():
+                            fig.add_trace(go.Scattergl(
+                                x=milliseconds[rows],
+                                y=timeline_df['Aspect'].to_numpy()[rows],
+                                mode='markers',
+                                name=impact_cat,
+                                marker=dict(color=color),
+                                hovertemplate='%{y}<br>%{x|%d %b %Y %I:%M %p}'
+                            ))
+                    fig.update_layout(
+                        title=f"{search_symbol} Aspect Timeline ({len(timeline_df):,} aspects)",
+                        xaxis=dict(type='date', title='Date & Time'),
+                        yaxis=dict(title='Planetary Aspect'),
+                        legend_title_text='Impact Category'
+                    )
+                else:
+                    fig = px.scatter(
+                        timeline_df, 
+                        x="DateTime", 
+                        y="Aspect",
+                        color="Impact Category",
+                        color_discrete_map=SEARCH_IMPACT_COLORS,
+                        hover_data=["Meaning", "Impact"],
+                        title=f"{search_symbol} Aspect Timeline",
+                        labels={"DateTime": "Date & Time", "Aspect": "Planetary Aspect"}
+                    )
+                
+                fig.update_layout(height=500)
+                plotly_chart(fig, "chart.search_timeline")
             
             # Create a summary table
             st.subheader("📋 Aspect Summary")
             
-            # Group by date and count impacts
-            summary_df = timeline_df.groupby(['Date', 'Impact Category']).size().unstack(fill_value=0)
-            
-            # Add total column
-            summary_df['Total'] = summary_df.sum(axis=1)
+            # Count impacts per day in one pass, rolled up by week or month when days would exceed SEARCH_COUNT_BINS bars
+            with stage("search.summary"):
+                summary = search_impact_summary(timeline_df, SEARCH_COUNT_BINS)
+                impact_columns = [list(IMPACT_CATEGORIES).index(impact_cat) for impact_cat in SEARCH_IMPACT_COLORS]
+                summary_df = pd.DataFrame(
+                    summary['daily'][:, impact_columns],
+                    index=pd.Index(pd.DatetimeIndex(summary['days']).strftime('%d %B %Y'), name='Date'),
+                    columns=pd.Index(list(SEARCH_IMPACT_COLORS), name='Impact Category')
+                )
+                
+                # Keep the categories that occur, then add total column
+                summary_df = summary_df.loc[:, summary_df.any()]
+                summary_df['Total'] = summary_df.sum(axis=1)
             
             # Display summary table
             st.dataframe(summary_df, use_container_width=True)
             
-            # Create a bar chart for daily impact counts
-            st.subheader("📈 Daily Impact Counts")
+            bins, counts = summary['bins'], summary['counts'][:, impact_columns]
+            bin_label = AGGREGATION_LABELS[summary['freq']]
             
-            # Prepare data for bar chart
-            bar_data = []
-            for date, group in timeline_df.groupby('Date'):
-                for impact_cat in ['Positive', 'Negative', 'Neutral']:
-                    count = len(group[group['Impact Category'] == impact_cat])
-                    bar_data.append({
-                        'Date': date,
-                        'Impact Category': impact_cat,
-                        'Count': count
-                    })
+            st.subheader(f"📈 {bin_label} Impact Counts")
             
-            bar_df = pd.DataFrame(bar_data)
-            
-            fig = px.bar(
-                bar_df,
-                x="Date",
-                y="Count",
-                color="Impact Category",
-                color_discrete_map=color_map,
-                title="Daily Impact Counts",
-                labels={"Count": "Number of Aspects", "Date": "Date"}
-            )
-            
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            with stage("chart.search_counts"):
+                fig = go.Figure([
+                    go.Bar(x=bins, y=counts[:, k], name=impact_cat, marker_color=color)
+                    for k, (impact_cat, color) in enumerate(SEARCH_IMPACT_COLORS.items())
+                ])
+                fig.update_layout(
+                    title=f"{bin_label} Impact Counts",
+                    barmode='relative',
+                    xaxis_title="Date",
+                    yaxis_title="Number of Aspects",
+                    legend_title_text='Impact Category',
+                    height=400
+                )
+                plotly_chart(fig, "chart.search_counts")
             
             # Display detailed aspects in a table
             st.subheader("🔍 Detailed Aspect Information")
             
             # Create a DataFrame with all aspects
-            aspects_df = pd.DataFrame(filtered_aspects)
+            aspects_df = search_df
             
             # Reorder columns
             aspects_df = aspects_df[['Date', 'Time', 'Aspect', 'Impact Category', 'Impact', 'Meaning']]
@@ -1591,6 +1330,9 @@ with tab6:
         else:
             st.info("No aspects found matching your criteria. Please adjust your filters.")
 
+with tab6, stage("tab6"):
+    aspect_search_panel()
+
 # Footer with enhanced styling
 st.markdown("""
 <hr>
@@ -1630,3 +1372,32 @@ if st.session_state.sentiment_data:
         <p><strong>Score:</strong> {score:.1f}</p>
     </div>
     """, unsafe_allow_html=True)
+
+# Diagnostics: close this run's timings, then show the session's recent runs
+finish_run()
+with st.sidebar.expander("⏱️ Diagnostics"):
+    st.checkbox("Record stage timings", key="diagnostics")
+    timing_history = st.session_state.timing_history
+    if timing_history.runs:
+        st.caption(f"Milliseconds over the last {len(timing_history.runs)} runs; stages nest, so they do not add up to the total")
+        percentiles_df = pd.DataFrame(timing_history.percentiles()).T
+        percentiles_df[percentiles_df.columns[1:]] *= 1000
+        st.dataframe(percentiles_df.round(1), use_container_width=True)
+        st.dataframe(pd.DataFrame([
+            {"Run": run["run"], "At": run["at"][11:], "Total": run["total"] * 1000,
+             **{name: seconds * 1000 for name, seconds in run["stages"].items()}}
+            for run in reversed(timing_history.runs)
+        ]).round(1), use_container_width=True, hide_index=True)
+        payload_runs = [run for run in timing_history.runs if run.get("payloads")]
+        if payload_runs:
+            latest = payload_runs[-1]
+            st.caption(f"Chart payloads of the last {latest['run']} run that drew charts: figure JSON size and server-side milliseconds")
+            st.dataframe(pd.DataFrame([
+                {"Chart": name, "KB": size / 1024, "Serialize ms": latest["stages"].get(f"{name}.serialize", 0.0) * 1000,
+                 "Chart ms": latest["stages"].get(name, 0.0) * 1000}
+                for name, size in latest["payloads"].items()
+            ]).round(1), use_container_width=True, hide_index=True)
+    elif st.session_state.diagnostics:
+        st.caption("Timings appear after the next run.")
+    else:
+        st.caption("Times update_all_data, each tab and each chart per run; off by default.")
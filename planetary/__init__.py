@@ -0,0 +1,70 @@
+"""Headless compute core of the planetary trading dashboard
+
+Positions, aspects, sentiment and timeline calculations plus the static
+reference tables, importable without Streamlit.
+"""
+from .aspect_data import (
+    ASPECT_EVENT_COLUMNS, ASPECT_EVENT_NAMES, ASPECT_IMPACTS, ASPECT_MEANINGS,
+    IMPACT_CATEGORIES, IMPACT_LABELS, MINUTE_LABELS,
+    aspect_event_columns, aspect_event_frame, aspect_event_records, build_aspect_data,
+    classify_impact, generate_aspects_for_date, generate_aspects_for_dates,
+    market_impact, search_aspect_events, search_impact_summary
+)
+from .aspects import (
+    ASPECT_ANGLES, ASPECT_NAMES, ASPECT_ORBS, ASPECT_RECORD_DTYPE, STRENGTH_LIMITS, STRENGTHS,
+    aspect_array, aspect_arrays_by_date, aspect_display_rows, aspect_hit_ranks,
+    calculate_dynamic_aspects, find_aspects_batch
+)
+from .backtest import (
+    BACKTEST_ACTIONS, BACKTEST_THRESHOLD, OHLC_COLUMNS, OHLC_HISTORY_PATH, REALIZED_LABELS,
+    backtest_sentiment, load_ohlc
+)
+from .cache import ForecastDayCache, LRUCache, ResultCache, SunTimesCache
+from .dashboard import (
+    FORECAST_HORIZON_DAYS, FORECAST_LONG_HORIZONS, compute_dashboard_data, forecast_series, forecast_window
+)
+from .data import actual_market_data, aug6_aspects
+from .downsample import (
+    AGGREGATION_BINS, AGGREGATION_LABELS, aggregation_bin, bin_starts, binned_counts, lttb_indices, rollup_counts
+)
+from .ephemeris import (
+    BASE_POSITIONS, DAILY_MOVEMENTS, PLANETS, REFERENCE_DATE,
+    calculate_dynamic_planetary_positions, calculate_planetary_positions_batch,
+    days_since_reference, planetary_positions_at, reference_offset_to_datetime
+)
+from .events import (
+    ASPECT_TARGET_ANGLES, ASPECT_TARGET_CODES, aspect_rules_version, find_aspect_events
+)
+from .index import ASPECT_INDEX_DIR, ASPECT_INDEX_MARKER, AspectIndex, search_aspect_range, use_aspect_index_dir
+from .intraday import (
+    HORA_ACTIONS, HORA_SENTIMENTS, HORA_SEQUENCE, MARKET_SESSION_CLOSE_MINUTES, MARKET_SESSION_SLOT_MINUTES,
+    current_slot, fixed_hora_lords, hora_aspect_scores, hora_grid, minute_grid, minutes_after_midnight,
+    realized_adjustments, slot_hora_lords, sunrise_hora_lords
+)
+from .jobs import JOB_PROGRESS_INTERVAL, BackgroundJob, JobCancelled
+from .market_store import (
+    MARKET_DATA_DIR, MARKET_REFERENCE_SYMBOL, MARKET_STORE_COLUMNS, MarketDataStore, encode_market_codes, encode_market_rows,
+    get_market_store, market_store_generation, use_market_data_dir
+)
+from .sentiment import (
+    SENTIMENT_LEVELS, SENTIMENT_THRESHOLDS,
+    calculate_market_sentiment_batch, calculate_market_sentiment_dynamic, forecast_rows_for_dates,
+    sentiment_factors_for_date
+)
+from .solar import (
+    CHALDEAN_ORDER, CITY_COORDINATES, CITY_NAMES, WEEKDAY_FIRST_HOUR,
+    city_local_now, city_planetary_hours, find_city, planetary_hours, sun_times
+)
+from .tables import (
+    DIGNITIES, DIGNITY_TABLE, NAKSHATRAS, PLANET_CODES, PLANET_RECORD_DTYPE, SIGN_CODES, SIGNS,
+    dignity_code, get_nakshatra_from_degree, get_planet_strength, get_sign_from_degree,
+    nakshatra_code, planet_array, planet_display_rows, sign_code
+)
+from .timeline import (
+    INDIAN_INDEX_SYMBOLS, MARKET_SESSION_TIMES,
+    generate_dynamic_timeline, get_market_type, hora_timeline, realized_market_sentiment
+)
+from .timing import (
+    NULL_TIMER, TIMING_ENABLED, TIMING_HISTORY_SIZE, TIMING_LOG_PATH, TIMING_PERCENTILES, StageTimer, TimingHistory
+)
+from .watchlist import group_watchlist, parse_watchlist, scan_watchlist, summarize_timeline, watchlist_timelines
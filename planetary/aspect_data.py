@@ -0,0 +1,249 @@
+"""Timed aspect rows with meanings and market impacts, in dict and columnar form"""
+import datetime
+
+import numpy as np
+
+from .aspects import ASPECT_NAMES, STRENGTHS
+from .data import aug6_aspects
+from .downsample import aggregation_bin, binned_counts, rollup_counts
+from .ephemeris import PLANETS
+from .events import find_aspect_events
+
+# Columnar aspect events, one row per perfection instant
+MINUTE_LABELS = np.array([datetime.time(m // 60, m % 60).strftime("%I:%M %p").lower() for m in range(1440)], dtype=object)
+
+ASPECT_MEANINGS = np.array([
+    "Planets joining energies, new beginnings",  # Conjunction
+    "Opportunities, positive connections",       # Sextile
+    "Tension, challenges, need for action",      # Square
+    "Harmonious flow, favorable conditions",     # Trine
+    "Polarity, balance, relationship focus"      # Opposition
+], dtype=object)
+
+# Impact codes index IMPACT_LABELS and IMPACT_CATEGORIES; rows follow ASPECT_NAMES, columns STRENGTHS
+IMPACT_LABELS = np.array(["Neutral", "Positive movement", "Negative pressure"], dtype=object)
+IMPACT_CATEGORIES = np.array(["Neutral", "Positive", "Negative"], dtype=object)
+ASPECT_IMPACTS = np.array([
+    [0, 0, 0],  # Conjunction
+    [1, 1, 0],  # Sextile
+    [2, 2, 0],  # Square
+    [1, 1, 0],  # Trine
+    [2, 2, 0]   # Opposition
+])
+
+def build_aspect_event_names():
+    """(body1, body2, aspect) codes -> display name"""
+    names = np.empty((len(PLANETS), len(PLANETS), len(ASPECT_NAMES)), dtype=object)
+    for body1, planet1 in enumerate(PLANETS):
+        for body2, planet2 in enumerate(PLANETS):
+            for aspect, aspect_name in enumerate(ASPECT_NAMES):
+                names[body1, body2, aspect] = f"{planet1} {aspect_name} {planet2}"
+    return names
+
+ASPECT_EVENT_NAMES = build_aspect_event_names()
+
+ASPECT_EVENT_COLUMNS = ("day", "minute", "body1", "body2", "aspect", "strength", "enter", "leave")
+
+def aspect_event_columns(dates):
+    """Columnar aspect events perfecting on the given dates, ordered by exact instant"""
+    days = np.unique(np.atleast_1d(np.asarray(dates)).astype("datetime64[D]"))
+    runs = np.split(days, np.nonzero(np.diff(days) > np.timedelta64(1, "D"))[0] + 1) if len(days) else []
+    
+    pieces = []
+    for run in runs:
+        events = find_aspect_events(run[0], run[-1] + 1)
+        day = events["exact"].astype("datetime64[D]")
+        pieces.append({
+            "day": day,
+            "minute": ((events["exact"] - day) // np.timedelta64(1, "m")).astype(np.int16),
+            "body1": events["body1"],
+            "body2": events["body2"],
+            "aspect": events["aspect"],
+            "strength": np.zeros(len(day), dtype=np.int8),  # perfection is always Exact
+            "enter": events["enter"].astype("datetime64[m]"),
+            "leave": events["leave"].astype("datetime64[m]")
+        })
+    
+    if not pieces:
+        return {
+            "day": np.array([], dtype="datetime64[D]"), "minute": np.array([], dtype=np.int16),
+            "body1": np.array([], dtype=np.int8), "body2": np.array([], dtype=np.int8),
+            "aspect": np.array([], dtype=np.int8), "strength": np.array([], dtype=np.int8),
+            "enter": np.array([], dtype="datetime64[m]"), "leave": np.array([], dtype="datetime64[m]")
+        }
+    return {name: np.concatenate([piece[name] for piece in pieces]) for name in ASPECT_EVENT_COLUMNS}
+
+def format_orb_edge(stamp):
+    return "…" if np.isnat(stamp) else stamp.astype(datetime.datetime).strftime("%d %b %H:%M")
+
+def aspect_event_records(columns, start=0, stop=None):
+    """Timed aspect dicts for rows start:stop of aspect_event_columns output"""
+    rows = slice(start, stop)
+    return [
+        {
+            "Planet 1": PLANETS[body1],
+            "Aspect": ASPECT_NAMES[aspect],
+            "Planet 2": PLANETS[body2],
+            "Strength": STRENGTHS[strength],
+            "Time": MINUTE_LABELS[minute],
+            "Orb Window": f"{format_orb_edge(enter)} → {format_orb_edge(leave)}"
+        }
+        for body1, body2, aspect, strength, minute, enter, leave in zip(
+            columns["body1"][rows].tolist(), columns["body2"][rows].tolist(), columns["aspect"][rows].tolist(),
+            columns["strength"][rows].tolist(), columns["minute"][rows].tolist(),
+            columns["enter"][rows], columns["leave"][rows]
+        )
+    ]
+
+# Function to generate aspects for any date
+def generate_aspects_for_date(date):
+    """Generate the aspects perfecting on a given date, with their exact times"""
+    return generate_aspects_for_dates([date])[0]
+
+def generate_aspects_for_dates(dates):
+    """Generate aspects for a range of dates from one batch event search"""
+    columns = aspect_event_columns(dates)
+    days = np.array(dates, dtype="datetime64[D]")
+    starts = np.searchsorted(columns["day"], days).tolist()
+    stops = np.searchsorted(columns["day"], days + 1).tolist()
+    return [build_aspect_data(aspect_event_records(columns, start, stop)) for start, stop in zip(starts, stops)]
+
+def build_aspect_data(aspects):
+    """Attach meanings and market impacts to timed aspect events"""
+    # Create aspect data with market impacts
+    aspect_data = []
+    
+    for aspect in aspects:
+        aspect_name = f"{aspect['Planet 1']} {aspect['Aspect']} {aspect['Planet 2']}"
+        
+        # Determine market impacts based on aspect type - UPDATED WITH NEW MEANINGS
+        if aspect['Aspect'] in ['Trine', 'Sextile']:
+            indian_impact = "Positive movement" if aspect['Strength'] in ['Exact', 'Close'] else "Neutral"
+            commodities_impact = "Positive movement" if aspect['Strength'] in ['Exact', 'Close'] else "Neutral"
+            forex_impact = "Positive movement" if aspect['Strength'] in ['Exact', 'Close'] else "Neutral"
+            global_impact = "Positive movement" if aspect['Strength'] in ['Exact', 'Close'] else "Neutral"
+        elif aspect['Aspect'] in ['Square', 'Opposition']:
+            indian_impact = "Negative pressure" if aspect['Strength'] in ['Exact', 'Close'] else "Neutral"
+            commodities_impact = "Negative pressure" if aspect['Strength'] in ['Exact', 'Close'] else "Neutral"
+            forex_impact = "Negative pressure" if aspect['Strength'] in ['Exact', 'Close'] else "Neutral"
+            global_impact = "Negative pressure" if aspect['Strength'] in ['Exact', 'Close'] else "Neutral"
+        else:
+            indian_impact = "Neutral"
+            commodities_impact = "Neutral"
+            forex_impact = "Neutral"
+            global_impact = "Neutral"
+        
+        # Create meaning based on aspect
+        if aspect['Aspect'] == 'Conjunction':
+            meaning = "Planets joining energies, new beginnings"
+        elif aspect['Aspect'] == 'Trine':
+            meaning = "Harmonious flow, favorable conditions"
+        elif aspect['Aspect'] == 'Square':
+            meaning = "Tension, challenges, need for action"
+        elif aspect['Aspect'] == 'Opposition':
+            meaning = "Polarity, balance, relationship focus"
+        elif aspect['Aspect'] == 'Sextile':
+            meaning = "Opportunities, positive connections"
+        else:
+            meaning = "Planetary interaction"
+        
+        aspect_data.append({
+            "time": aspect["Time"],
+            "aspect": aspect_name,
+            "meaning": meaning,
+            "indian_market": indian_impact,
+            "commodities": commodities_impact,
+            "forex": forex_impact,
+            "global_market": global_impact,
+            "orb_window": aspect["Orb Window"]
+        })
+    
+    return aspect_data
+
+def market_impact(aspect, symbol):
+    """Pick the impact column of an aspect data row that applies to symbol"""
+    if symbol in ["Nifty", "BankNifty"]:
+        return aspect["indian_market"]
+    elif symbol in ["Gold", "Silver", "Crude"]:
+        return aspect["commodities"]
+    elif symbol == "BTC":
+        return aspect["forex"]
+    elif symbol == "DowJones":
+        return aspect["global_market"]
+    return "Neutral"
+
+def classify_impact(impact):
+    if "Positive" in impact or "recovery" in impact.lower() or "rally" in impact.lower():
+        return "Positive"
+    elif "Negative" in impact or "dip" in impact.lower() or "pressure" in impact.lower() or "risks" in impact.lower():
+        return "Negative"
+    return "Neutral"
+
+def aspect_event_frame(events, impact_filter):
+    """Advanced Aspect Search rows for coded events whose impact category is in impact_filter
+    
+    Besides the display strings, DateTime carries each perfection instant as a
+    timestamp so charts and summaries never parse Date and Time back.
+    """
+    import pandas as pd  # deferred so importing the package stays light
+    
+    impact = ASPECT_IMPACTS[events["aspect"], events["strength"]]
+    keep = np.isin(IMPACT_CATEGORIES[impact], impact_filter)
+    body1, body2, aspect, impact = events["body1"][keep], events["body2"][keep], events["aspect"][keep], impact[keep]
+    minute = events["minute"][keep]
+    
+    days, day_position = np.unique(events["day"][keep], return_inverse=True)
+    day_labels = pd.DatetimeIndex(days).strftime("%d %B %Y").to_numpy(dtype=object)
+    
+    return pd.DataFrame({
+        "Date": day_labels[day_position],
+        "Time": MINUTE_LABELS[minute],
+        "Aspect": ASPECT_EVENT_NAMES[body1, body2, aspect],
+        "Meaning": ASPECT_MEANINGS[aspect],
+        "Impact": IMPACT_LABELS[impact],
+        "Impact Category": IMPACT_CATEGORIES[impact],
+        "DateTime": days[day_position].astype("datetime64[m]") + minute.astype("timedelta64[m]")
+    })
+
+def search_aspect_events(events, symbol, impact_filter):
+    """Filter indexed events for the Advanced Aspect Search, keeping the August 6 reference table"""
+    import pandas as pd  # deferred so importing the package stays light
+    
+    reference_day = np.datetime64(datetime.date(2025, 8, 6))
+    lo, hi = np.searchsorted(events["day"], [reference_day, reference_day + 1])
+    
+    frames = [aspect_event_frame({name: column[:lo] for name, column in events.items()}, impact_filter)]
+    if hi > lo:
+        reference_rows = []
+        for aspect in aug6_aspects:
+            impact = market_impact(aspect, symbol)
+            if classify_impact(impact) in impact_filter:
+                reference_rows.append({
+                    "Date": "06 August 2025",
+                    "Time": aspect["time"],
+                    "Aspect": aspect["aspect"],
+                    "Meaning": aspect["meaning"],
+                    "Impact": impact,
+                    "Impact Category": classify_impact(impact),
+                    "DateTime": datetime.datetime.strptime(f"06 August 2025 {aspect['time']}", "%d %B %Y %I:%M %p")
+                })
+        frames.append(pd.DataFrame(reference_rows, columns=frames[0].columns))
+    frames.append(aspect_event_frame({name: column[hi:] for name, column in events.items()}, impact_filter))
+    
+    return pd.concat(frames, ignore_index=True)
+
+def search_impact_summary(search_df, max_bins):
+    """Impact counts of an Advanced Aspect Search frame per day, and rolled up to fit max_bins bars
+    
+    Counts come from the DateTime column and IMPACT_CATEGORIES codes in one
+    pass; the weekly or monthly rollup, chosen by aggregation_bin, sums the
+    daily rows. Count columns follow IMPACT_CATEGORIES.
+    """
+    import pandas as pd  # deferred so importing the package stays light
+    
+    days = search_df["DateTime"].to_numpy().astype("datetime64[D]")
+    codes = pd.Categorical(search_df["Impact Category"], categories=IMPACT_CATEGORIES).codes
+    daily_days, daily = binned_counts(days, codes, len(IMPACT_CATEGORIES), "D")
+    freq = aggregation_bin(daily_days, max_bins)
+    bins, counts = rollup_counts(daily_days, daily, freq)
+    return {"days": daily_days, "daily": daily, "freq": freq, "bins": bins, "counts": counts}
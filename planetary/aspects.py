@@ -0,0 +1,82 @@
+"""Aspect detection for positions matrices of many dates"""
+import numpy as np
+
+from .ephemeris import PLANETS
+from .tables import PLANET_CODES
+
+# Aspect rules, coded by position: aspect code indexes ASPECT_NAMES, strength code indexes STRENGTHS
+ASPECT_NAMES = ("Conjunction", "Sextile", "Square", "Trine", "Opposition")
+ASPECT_ANGLES = np.array([0, 60, 90, 120, 180])
+ASPECT_ORBS = np.array([8, 6, 8, 8, 8])
+
+STRENGTHS = ("Exact", "Close", "Wide")
+STRENGTH_LIMITS = np.array([2, 4])
+
+# Compact aspect rows: body codes index PLANETS (or the bodies passed alongside), orb in degrees
+ASPECT_RECORD_DTYPE = np.dtype([
+    ("body1", np.int8), ("body2", np.int8), ("aspect", np.int8), ("strength", np.int8), ("orb", np.float64)
+])
+
+def find_aspects_batch(positions):
+    """Every aspect hit in an (n_dates, n_bodies) positions matrix, as columnar arrays
+
+    Rows are ordered by date index, then body pair, then aspect code, matching
+    the order calculate_dynamic_aspects reports them in.
+    """
+    positions = np.atleast_2d(positions)
+    body1, body2 = np.triu_indices(positions.shape[1], 1)
+    
+    diff = np.abs(positions[:, body1] - positions[:, body2]) % 360
+    diff = np.where(diff > 180, 360 - diff, diff)
+    
+    orb = np.abs(diff[:, :, np.newaxis] - ASPECT_ANGLES)
+    date_idx, pair_idx, aspect_idx = np.nonzero(orb <= ASPECT_ORBS)
+    hit_orbs = orb[date_idx, pair_idx, aspect_idx]
+    
+    return {
+        "date": date_idx,
+        "body1": body1[pair_idx],
+        "body2": body2[pair_idx],
+        "aspect": aspect_idx,
+        "orb": hit_orbs,
+        "strength": np.searchsorted(STRENGTH_LIMITS, hit_orbs)
+    }
+
+def aspect_hit_ranks(hits, n_dates):
+    """Position of each hit among the hits of its own date"""
+    first_hit = np.searchsorted(hits["date"], np.arange(n_dates))
+    return np.arange(len(hits["date"])) - first_hit[hits["date"]]
+
+def aspect_array(hits, start=0, stop=None):
+    """ASPECT_RECORD_DTYPE rows for rows start:stop of a find_aspects_batch result"""
+    rows = slice(start, stop)
+    records = np.empty(len(hits["date"][rows]), dtype=ASPECT_RECORD_DTYPE)
+    for name in ASPECT_RECORD_DTYPE.names:
+        records[name] = hits[name][rows]
+    return records
+
+def aspect_arrays_by_date(hits, n_dates):
+    """Split a find_aspects_batch result into one ASPECT_RECORD_DTYPE array per date"""
+    bounds = np.searchsorted(hits["date"], np.arange(n_dates + 1)).tolist()
+    return [aspect_array(hits, bounds[k], bounds[k + 1]) for k in range(n_dates)]
+
+def aspect_display_rows(aspects, bodies=PLANETS):
+    """Planet 1, Aspect, Planet 2, Strength and Orb display dicts for ASPECT_RECORD_DTYPE rows"""
+    return [
+        {
+            "Planet 1": bodies[body1],
+            "Aspect": ASPECT_NAMES[aspect],
+            "Planet 2": bodies[body2],
+            "Strength": STRENGTHS[strength],
+            "Orb": f"{orb:.1f}°"
+        }
+        for body1, body2, aspect, strength, orb in aspects.tolist()
+    ]
+
+def calculate_dynamic_aspects(degrees):
+    """Aspects between the planets of a {planet: degree} dict, as ASPECT_RECORD_DTYPE rows with PLANETS codes"""
+    aspects = aspect_array(find_aspects_batch([list(degrees.values())]))
+    codes = np.array([PLANET_CODES[planet] for planet in degrees], dtype=np.int8)
+    aspects["body1"] = codes[aspects["body1"]]
+    aspects["body2"] = codes[aspects["body2"]]
+    return aspects
@@ -0,0 +1,103 @@
+"""Backtest of predicted day sentiment against realized daily returns"""
+import glob
+import os
+
+import numpy as np
+
+from .sentiment import SENTIMENT_LEVELS, calculate_market_sentiment_batch
+
+OHLC_HISTORY_PATH = os.environ.get(
+    "OHLC_HISTORY_PATH", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "ohlc")
+)
+OHLC_COLUMNS = ("date", "symbol", "open", "high", "low", "close")
+
+# Same rule as the timeline Action column: BUY above +1, SELL below -1
+BACKTEST_ACTIONS = ("SELL", "HOLD", "BUY")
+BACKTEST_THRESHOLD = 1
+REALIZED_LABELS = ("Down", "Flat", "Up")
+
+def load_ohlc(path=OHLC_HISTORY_PATH):
+    """Daily OHLC history from one long-format CSV or a directory of per-symbol CSVs
+    
+    Column names are matched case-insensitively. A file without a symbol column
+    takes its symbol from the file name.
+    """
+    import pandas as pd
+    
+    paths = sorted(glob.glob(os.path.join(path, "*.csv"))) if os.path.isdir(path) else [path]
+    if not paths:
+        raise FileNotFoundError(f"No OHLC CSV files in {path}")
+    
+    frames = []
+    for csv_path in paths:
+        frame = pd.read_csv(csv_path)
+        frame.columns = [str(column).strip().lower() for column in frame.columns]
+        if "symbol" not in frame.columns:
+            frame["symbol"] = os.path.splitext(os.path.basename(csv_path))[0].upper()
+        missing = [column for column in OHLC_COLUMNS if column not in frame.columns]
+        if missing:
+            raise ValueError(f"{csv_path} is missing OHLC columns: {', '.join(missing)}")
+        frames.append(frame[list(OHLC_COLUMNS)])
+    
+    ohlc = pd.concat(frames, ignore_index=True)
+    ohlc["date"] = pd.to_datetime(ohlc["date"]).dt.normalize()
+    return ohlc.drop_duplicates(["symbol", "date"], keep="last").sort_values(["symbol", "date"], ignore_index=True)
+
+def backtest_sentiment(ohlc, threshold=BACKTEST_THRESHOLD):
+    """Hit rate, confusion matrix, information coefficient and equity curve of the sentiment rule
+    
+    Each date is scored once with calculate_market_sentiment_batch and the score
+    is broadcast over a dates x symbols matrix of open-to-close returns, so the
+    cost is one batch over the unique dates plus a few array passes. Realized
+    market data is not applied, so the backtest measures the pure model rather
+    than dates scored with their own outcome.
+    """
+    import pandas as pd
+    
+    opens = ohlc.pivot(index="date", columns="symbol", values="open")
+    closes = ohlc.pivot(index="date", columns="symbol", values="close")
+    returns = (closes / opens - 1).to_numpy()
+    days = opens.index.values.astype("datetime64[D]")
+    
+    sentiment = calculate_market_sentiment_batch(days, use_realized=False)
+    score = sentiment["score"]
+    action = np.where(score > threshold, 2, np.where(score < -threshold, 0, 1))
+    position = (action - 1)[:, None]
+    
+    valid = ~np.isnan(returns)
+    realized = np.sign(np.where(valid, returns, 0)).astype(np.int64) + 1
+    traded = valid & (position != 0)
+    hits = traded & (realized - 1 == position)
+    
+    # Predicted sentiment level x realized direction, over every symbol-day with a return
+    levels = np.broadcast_to(sentiment["sentiment"][:, None], returns.shape)
+    confusion = np.bincount(
+        levels[valid] * len(REALIZED_LABELS) + realized[valid], minlength=len(SENTIMENT_LEVELS) * len(REALIZED_LABELS)
+    ).reshape(len(SENTIMENT_LEVELS), len(REALIZED_LABELS))
+    
+    # Spearman rank correlation of score with return, pooled and per symbol
+    pooled_score = np.broadcast_to(score[:, None], returns.shape)[valid]
+    pooled_ic = pd.Series(pooled_score).rank().corr(pd.Series(returns[valid]).rank())
+    return_ranks = pd.DataFrame(returns, index=opens.index, columns=opens.columns).rank()
+    score_ranks = pd.DataFrame(np.where(valid, score[:, None], np.nan), index=opens.index, columns=opens.columns).rank()
+    symbol_ic = return_ranks.corrwith(score_ranks)
+    
+    # Equal-weight portfolio of the symbols trading on each date
+    symbols_trading = np.maximum(valid.sum(axis=1), 1)
+    strategy_returns = np.where(valid, position * returns, 0).sum(axis=1) / symbols_trading
+    benchmark_returns = np.where(valid, returns, 0).sum(axis=1) / symbols_trading
+    
+    trade_count = int(traded.sum())
+    return {
+        "dates": days,
+        "symbols": len(opens.columns),
+        "observations": int(valid.sum()),
+        "trades": trade_count,
+        "hit_rate": float(hits.sum() / trade_count) if trade_count else float("nan"),
+        "actions": dict(zip(BACKTEST_ACTIONS, np.bincount(action, minlength=len(BACKTEST_ACTIONS)).tolist())),
+        "confusion": pd.DataFrame(confusion, index=list(SENTIMENT_LEVELS), columns=list(REALIZED_LABELS)),
+        "ic": float(pooled_ic),
+        "symbol_ic": symbol_ic,
+        "equity": pd.Series(np.cumprod(1 + strategy_returns), index=opens.index),
+        "benchmark": pd.Series(np.cumprod(1 + benchmark_returns), index=opens.index)
+    }
@@ -0,0 +1,170 @@
+"""Command-line batch runner: timelines and sentiment for symbols x dates
+
+Example::
+
+    python -m planetary --symbols NIFTY,BANKNIFTY,AAPL --start 2025-01-01 --end 2025-12-31 --output signals.csv
+
+Dates are split into chunks that run on a process pool. Each chunk computes
+positions and aspects once per date and shares them across every symbol.
+Finished chunks are streamed to CSV or Parquet in date order.
+"""
+import argparse
+import datetime
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .aspects import aspect_arrays_by_date, find_aspects_batch
+from .ephemeris import PLANETS, calculate_planetary_positions_batch
+from .sentiment import SENTIMENT_LEVELS, calculate_market_sentiment_batch
+from .watchlist import watchlist_timelines
+
+STAGES = ("positions", "aspects", "sentiment", "timeline", "write")
+
+def process_chunk(days, symbols):
+    """Timeline rows for every symbol on every day of a chunk, plus per-stage seconds"""
+    import pandas as pd
+    
+    timings = dict.fromkeys(STAGES, 0.0)
+    
+    started = time.perf_counter()
+    positions = calculate_planetary_positions_batch(days)
+    timings["positions"] = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    hits = find_aspects_batch(positions)
+    aspects_by_day = aspect_arrays_by_date(hits, len(days))
+    timings["aspects"] = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    sentiment = calculate_market_sentiment_batch(days, positions, hits)
+    timings["sentiment"] = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    rows = []
+    for k, day in enumerate(days.astype(datetime.date).tolist()):
+        degrees = dict(zip(PLANETS, positions[k].tolist()))
+        day_sentiment = SENTIMENT_LEVELS[sentiment["sentiment"][k]]
+        day_score = float(sentiment["score"][k])
+        timelines = watchlist_timelines(symbols, day, degrees, aspects_by_day[k])
+        for symbol in symbols:
+            for slot in timelines[symbol]:
+                rows.append({
+                    "Symbol": symbol,
+                    "Date": day,
+                    "Day Sentiment": day_sentiment,
+                    "Day Score": day_score,
+                    **slot
+                })
+    timings["timeline"] = time.perf_counter() - started
+    
+    return pd.DataFrame(rows), timings
+
+class SignalWriter:
+    """Streams result frames to a CSV or Parquet file chosen by extension"""
+    
+    def __init__(self, path):
+        self.path = path
+        self.parquet = path.lower().endswith(".parquet")
+        self._writer = None
+        self._header = True
+    
+    def write(self, frame):
+        if self.parquet:
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise SystemExit("Parquet output needs pyarrow; install it or write a .csv file")
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table)
+        else:
+            frame.to_csv(self.path, mode="w" if self._header else "a", header=self._header, index=False)
+            self._header = False
+    
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+def run_batch(symbols, start, end, output, workers=None, chunk_days=31):
+    """Run every symbol over start..end inclusive and stream the rows to output; returns a stats dict"""
+    days = np.arange(np.datetime64(start, "D"), np.datetime64(end, "D") + 1)
+    chunks = [days[i:i + chunk_days] for i in range(0, len(days), chunk_days)]
+    workers = workers or os.cpu_count() or 1
+    
+    totals = dict.fromkeys(STAGES, 0.0)
+    n_rows = 0
+    started = time.perf_counter()
+    writer = SignalWriter(output)
+    
+    def consume(results):
+        nonlocal n_rows
+        for frame, timings in results:
+            for stage, seconds in timings.items():
+                totals[stage] += seconds
+            write_started = time.perf_counter()
+            if len(frame):
+                writer.write(frame)
+            totals["write"] += time.perf_counter() - write_started
+            n_rows += len(frame)
+    
+    try:
+        if workers == 1:
+            consume(process_chunk(chunk, symbols) for chunk in chunks)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                consume(pool.map(process_chunk, chunks, [symbols] * len(chunks)))
+    finally:
+        writer.close()
+    
+    elapsed = time.perf_counter() - started
+    return {
+        "rows": n_rows,
+        "days": len(days),
+        "symbols": len(symbols),
+        "workers": workers,
+        "seconds": elapsed,
+        "rows_per_second": n_rows / elapsed if elapsed else 0.0,
+        "stages": totals
+    }
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m planetary", description="Generate timeline signals for symbols x dates")
+    parser.add_argument("--symbols", help="Comma-separated symbols, e.g. NIFTY,BANKNIFTY,AAPL")
+    parser.add_argument("--symbols-file", help="File with one symbol per line")
+    parser.add_argument("--start", required=True, type=datetime.date.fromisoformat, help="First date, YYYY-MM-DD")
+    parser.add_argument("--end", required=True, type=datetime.date.fromisoformat, help="Last date, YYYY-MM-DD")
+    parser.add_argument("--output", required=True, help="Output .csv or .parquet file")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-days", type=int, default=31, help="Days per work unit")
+    args = parser.parse_args(argv)
+    
+    symbols = [s.strip() for s in (args.symbols or "").split(",") if s.strip()]
+    if args.symbols_file:
+        with open(args.symbols_file) as f:
+            symbols += [line.strip() for line in f if line.strip()]
+    if not symbols:
+        parser.error("give --symbols or --symbols-file")
+    if args.start > args.end:
+        parser.error("--start must not be after --end")
+    args.symbols = symbols
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    stats = run_batch(args.symbols, args.start, args.end, args.output, args.workers, args.chunk_days)
+    
+    print(f"{stats['rows']} rows for {stats['symbols']} symbols x {stats['days']} days "
+          f"in {stats['seconds']:.2f}s ({stats['rows_per_second']:,.0f} rows/s, {stats['workers']} workers)")
+    print("Stage timings (seconds, summed over workers):")
+    for stage, seconds in stats["stages"].items():
+        print(f"  {stage:<10} {seconds:8.3f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,278 @@
+"""Benchmark suite for the compute paths and a headless app rerun, with JSON results
+
+Usage::
+
+    python -m planetary.benchmark --output bench.json
+    python -m planetary.benchmark --output new.json --baseline bench.json
+
+Each case runs at the day scales in BENCHMARK_DAYS (1 day to 50 years) and,
+where symbols matter, at 1 and 500 symbols. With --baseline, cases slower than
+the baseline by more than --tolerance are listed and the exit status is 1, so
+two versions can be compared in CI. The cold import of the package is timed
+in a fresh interpreter, next to the bare interpreter start.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from .aspect_data import generate_aspects_for_date, generate_aspects_for_dates, search_impact_summary
+from .aspects import calculate_dynamic_aspects, find_aspects_batch
+from .cache import SunTimesCache
+from .dashboard import compute_dashboard_data, forecast_series, forecast_window
+from .ephemeris import calculate_dynamic_planetary_positions, calculate_planetary_positions_batch
+from .events import aspect_rules_version
+from .index import AspectIndex, search_aspect_range, use_aspect_index_dir
+from .intraday import hora_grid
+from .market_store import use_market_data_dir
+from .sentiment import calculate_market_sentiment_batch, calculate_market_sentiment_dynamic
+from .tables import planet_array
+from .timeline import generate_dynamic_timeline
+from .watchlist import scan_watchlist
+
+BENCHMARK_DATE = datetime.date(2025, 8, 6)
+# The dashboard serves BENCHMARK_DATE from the static aug6_aspects table; update_all_data runs on an indexed day
+BENCHMARK_UPDATE_DATE = datetime.date(2025, 9, 15)
+BENCHMARK_DAYS = {"1d": 1, "1m": 30, "1y": 365, "50y": 18262}
+BENCHMARK_SYMBOLS = {"1sym": 1, "500sym": 500}
+BENCHMARK_IMPACTS = ["Positive", "Negative", "Neutral"]
+BENCHMARK_COUNT_BINS = 400
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+# Per-day loops of the scalar functions stop here; 50 years of them measure nothing new
+SCALAR_MAX_DAYS = 365
+SCALAR_MAX_CALLS = 20_000
+
+# Repeat a case until it has run this long or this often; cases slower than the floor are not flagged
+BENCHMARK_MIN_SECONDS = 0.5
+BENCHMARK_MAX_REPEAT = 50
+BENCHMARK_NOISE_FLOOR = 0.001
+
+def benchmark_days(n_days, start=BENCHMARK_DATE):
+    return np.datetime64(start, "D") + np.arange(n_days)
+
+def benchmark_symbols(n_symbols):
+    """n_symbols watchlist symbols, mixing Indian indices and international names"""
+    base = ["NIFTY", "BANKNIFTY", "AAPL", "MSFT", "GOLD", "BTC"]
+    return [base[i] if i < len(base) else f"SYM{i:03d}" for i in range(n_symbols)]
+
+def measure(setup, min_seconds=BENCHMARK_MIN_SECONDS, max_repeat=BENCHMARK_MAX_REPEAT):
+    """Median and best seconds of setup()() over repeats; setup runs outside the timed part"""
+    times = []
+    while len(times) < max_repeat and sum(times) < min_seconds:
+        run = setup()
+        started = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - started)
+    return {"seconds": statistics.median(times), "best": min(times), "repeat": len(times)}
+
+def scalar_day_inputs(days):
+    """Per-day positions, planet rows and aspects, prepared outside the timings of the scalar cases"""
+    dates = days.astype(datetime.date).tolist()
+    degrees = [calculate_dynamic_planetary_positions(date) for date in dates]
+    records = [planet_array(day_degrees) for day_degrees in degrees]
+    return dates, degrees, records, [calculate_dynamic_aspects(day_degrees) for day_degrees in degrees]
+
+def update_all_data_run(symbols, index_root):
+    """update_all_data without Streamlit: dashboard data per symbol plus the forecast window, on a fresh index and cache"""
+    aspect_index, sun_times_cache = AspectIndex(tempfile.mkdtemp(dir=index_root)), SunTimesCache()
+    return lambda: [
+        (
+            compute_dashboard_data(BENCHMARK_UPDATE_DATE, symbol, aspect_index, "Mumbai", sun_times_cache),
+            forecast_window(BENCHMARK_UPDATE_DATE)
+        )
+        for symbol in symbols
+    ]
+
+def search_summary_run(aspect_index, end_date):
+    """Tab6 impact summaries for a search result, with the search itself run before timing"""
+    search_df = search_aspect_range(aspect_index, BENCHMARK_DATE, end_date, "Nifty", BENCHMARK_IMPACTS)
+    return lambda: search_impact_summary(search_df, BENCHMARK_COUNT_BINS)
+
+def compute_cases(day_scales, symbol_scales, index_root):
+    """(case id, days, symbols, setup) for every compute case at the requested scales"""
+    cases = []
+    for day_label, n_days in day_scales.items():
+        days = benchmark_days(n_days)
+
+        if n_days <= SCALAR_MAX_DAYS:
+            dates, degrees, records, aspects = scalar_day_inputs(days)
+            cases += [
+                (f"positions.scalar/{day_label}", n_days, 1,
+                 lambda dates=dates: lambda: [calculate_dynamic_planetary_positions(date) for date in dates]),
+                (f"aspects.scalar/{day_label}", n_days, 1,
+                 lambda degrees=degrees: lambda: [calculate_dynamic_aspects(day_degrees) for day_degrees in degrees]),
+                (f"sentiment.scalar/{day_label}", n_days, 1,
+                 lambda dates=dates, records=records, aspects=aspects: lambda: [
+                     calculate_market_sentiment_dynamic(*day) for day in zip(records, aspects, dates)
+                 ])
+            ]
+            for symbol_label, n_symbols in symbol_scales.items():
+                if n_days * n_symbols > SCALAR_MAX_CALLS:
+                    continue
+                symbols = benchmark_symbols(n_symbols)
+                cases.append((
+                    f"timeline.scalar/{day_label}/{symbol_label}", n_days, n_symbols,
+                    lambda dates=dates, degrees=degrees, aspects=aspects, symbols=symbols: lambda: [
+                        generate_dynamic_timeline(symbol, *day)
+                        for day in zip(dates, degrees, aspects) for symbol in symbols
+                    ]
+                ))
+
+        positions = calculate_planetary_positions_batch(days)
+        cases += [
+            (f"positions.batch/{day_label}", n_days, 1, lambda days=days: lambda: calculate_planetary_positions_batch(days)),
+            (f"aspects.batch/{day_label}", n_days, 1, lambda positions=positions: lambda: find_aspects_batch(positions)),
+            (f"sentiment.batch/{day_label}", n_days, 1, lambda days=days: lambda: calculate_market_sentiment_batch(days)),
+            (f"hora_grid/{day_label}", n_days, 1, lambda days=days: lambda: hora_grid(days, "Indian")),
+            (f"forecast_series/{day_label}", n_days, 1,
+             lambda n_days=n_days: lambda: forecast_series(BENCHMARK_DATE, n_days)),
+            (f"aspect_data.generate/{day_label}", n_days, 1,
+             (lambda: lambda: generate_aspects_for_date(BENCHMARK_DATE)) if n_days == 1 else
+             (lambda days=days: lambda: generate_aspects_for_dates(days)))
+        ]
+
+        # Tab6 range scan: cold builds the index years into a fresh directory, warm reads the mapped years
+        end_date = BENCHMARK_DATE + datetime.timedelta(days=n_days - 1)
+        warm_index = AspectIndex(tempfile.mkdtemp(dir=index_root))
+        cases += [
+            (f"tab6.search.cold/{day_label}", n_days, 1,
+             lambda end_date=end_date: lambda: search_aspect_range(
+                 AspectIndex(tempfile.mkdtemp(dir=index_root)), BENCHMARK_DATE, end_date, "Nifty", BENCHMARK_IMPACTS
+             )),
+            (f"tab6.search.warm/{day_label}", n_days, 1,
+             lambda end_date=end_date, index=warm_index: lambda: search_aspect_range(
+                 index, BENCHMARK_DATE, end_date, "Nifty", BENCHMARK_IMPACTS
+             )),
+            (f"tab6.summary/{day_label}", n_days, 1,
+             lambda end_date=end_date, index=warm_index: search_summary_run(index, end_date))
+        ]
+
+    for symbol_label, n_symbols in symbol_scales.items():
+        symbols = benchmark_symbols(n_symbols)
+        cases += [
+            (f"watchlist.scan/1d/{symbol_label}", 1, n_symbols,
+             lambda symbols=symbols: lambda: scan_watchlist(symbols, BENCHMARK_DATE)),
+            (f"update_all_data.cold/1d/{symbol_label}", 1, n_symbols, lambda symbols=symbols: update_all_data_run(symbols, index_root))
+        ]
+    return cases
+
+def import_cases():
+    """Cold import of the compute package in a fresh interpreter, next to the bare interpreter start"""
+    def fresh_interpreter(code):
+        return lambda: lambda: subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(APP_PATH), check=True)
+
+    return [
+        ("import.interpreter", 1, 1, fresh_interpreter("pass")),
+        ("import.planetary", 1, 1, fresh_interpreter("import planetary"))
+    ]
+
+def app_cases():
+    """Headless script runs of app.py through Streamlit's testing harness; empty without Streamlit"""
+    try:
+        from streamlit.testing.v1 import AppTest
+    except ImportError:
+        return []
+
+    # A new AppTest is a new session; cache_resource caches stay warm across sessions as on a running server
+    def new_session():
+        return lambda: AppTest.from_file(APP_PATH, default_timeout=300).run()
+
+    def rerun():
+        app = AppTest.from_file(APP_PATH, default_timeout=300).run()
+        return app.run
+
+    return [("app.new_session", 1, 1, new_session), ("app.rerun", 1, 1, rerun)]
+
+def run_benchmarks(day_scales=BENCHMARK_DAYS, symbol_scales=BENCHMARK_SYMBOLS, include_app=True, report=print):
+    """Measure every case; returns {"meta": ..., "results": {case id: timings}}"""
+    results = {}
+    index_root = tempfile.mkdtemp(prefix="planetary-benchmark-")
+    # Cases, including the app runs, must not write a market store or an aspect index into the checkout
+    market_data_dir = use_market_data_dir(os.path.join(index_root, "market_data"))
+    aspect_index_dir = use_aspect_index_dir(os.path.join(index_root, "aspect_index"))
+    try:
+        cases = import_cases() + compute_cases(day_scales, symbol_scales, index_root) + (app_cases() if include_app else [])
+        for case_id, n_days, n_symbols, setup in cases:
+            results[case_id] = {"days": n_days, "symbols": n_symbols, **measure(setup)}
+            report(f"{case_id:<36} {results[case_id]['seconds'] * 1000:10.2f} ms  (x{results[case_id]['repeat']})")
+    finally:
+        use_market_data_dir(market_data_dir)
+        use_aspect_index_dir(aspect_index_dir)
+        shutil.rmtree(index_root, ignore_errors=True)
+    return {"meta": benchmark_meta(), "results": results}
+
+def benchmark_meta():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(APP_PATH), capture_output=True, text=True
+        ).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "aspect_rules": aspect_rules_version(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count()
+    }
+
+def compare_results(current, baseline, tolerance):
+    """(case id, baseline seconds, current seconds, ratio) for cases slower than tolerance x baseline"""
+    regressions = []
+    for case_id, timing in current["results"].items():
+        before = baseline["results"].get(case_id)
+        if before is None:
+            continue
+        ratio = timing["seconds"] / before["seconds"] if before["seconds"] else float("inf")
+        if ratio > tolerance and timing["seconds"] - before["seconds"] > BENCHMARK_NOISE_FLOOR:
+            regressions.append((case_id, before["seconds"], timing["seconds"], ratio))
+    return regressions
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m planetary.benchmark", description="Benchmark the dashboard compute paths")
+    parser.add_argument("--output", required=True, help="JSON file for the results")
+    parser.add_argument("--baseline", help="Earlier results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=1.25, help="Slowdown ratio reported as a regression")
+    parser.add_argument("--days", default=",".join(BENCHMARK_DAYS), help=f"Day scales, from {', '.join(BENCHMARK_DAYS)}")
+    parser.add_argument("--symbols", default=",".join(BENCHMARK_SYMBOLS), help=f"Symbol scales, from {', '.join(BENCHMARK_SYMBOLS)}")
+    parser.add_argument("--no-app", action="store_true", help="Skip the headless app.py runs")
+    args = parser.parse_args(argv)
+
+    try:
+        args.days = {label: BENCHMARK_DAYS[label] for label in args.days.split(",") if label}
+        args.symbols = {label: BENCHMARK_SYMBOLS[label] for label in args.symbols.split(",") if label}
+    except KeyError as error:
+        parser.error(f"unknown scale {error}")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    current = run_benchmarks(args.days, args.symbols, include_app=not args.no_app)
+    with open(args.output, "w") as f:
+        json.dump(current, f, indent=2)
+    print(f"{len(current['results'])} cases written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_results(current, baseline, args.tolerance)
+        print(f"Compared with {args.baseline} (commit {baseline['meta'].get('commit')}): {len(regressions)} regressions")
+        for case_id, before, after, ratio in regressions:
+            print(f"  {case_id:<36} {before * 1000:10.2f} ms -> {after * 1000:10.2f} ms  ({ratio:.2f}x)")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
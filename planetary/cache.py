@@ -0,0 +1,145 @@
+"""In-memory caches shared across reruns and sessions"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import numpy as np
+
+from .events import aspect_rules_version
+from .market_store import get_market_store
+from .sentiment import forecast_rows_for_dates
+from .solar import CITY_COORDINATES, sun_times
+
+class LRUCache:
+    """Bounded least-recently-used map with hit and miss counts, shared safely between threads"""
+    
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def lookup(self, keys):
+        """Cached values of the keys that are present, marking them as recently used"""
+        with self._lock:
+            found = {}
+            for key in keys:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    found[key] = self._entries[key]
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+            return found
+    
+    def store(self, items):
+        """Add (key, value) pairs, then evict the least recently used entries over maxsize"""
+        with self._lock:
+            self._store(items)
+    
+    def _store(self, items):
+        for key, value in items:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+class ForecastDayCache(LRUCache):
+    """Bounded LRU cache of per-day forecast rows keyed by (date, rules version, market store generation)
+
+    A sliding window only computes the days it has not seen, and rows scored
+    before a rules change or a market data import are never served again.
+    """
+    
+    def __init__(self, maxsize=4096):
+        super().__init__(maxsize)
+    
+    def get_range(self, dates, version=None):
+        """Forecast rows for each date, computing only the dates not already cached"""
+        version = version or (aspect_rules_version(), get_market_store().generation)
+        keys = [(day, version) for day in dates]
+        results = self.lookup(keys)
+        missing = [day for day, key in zip(dates, keys) if key not in results]
+        if missing:
+            computed = [((day, version), row) for day, row in zip(missing, forecast_rows_for_dates(missing))]
+            self.store(computed)
+            results.update(computed)
+        return [results[key] for key in keys]
+
+class SunTimesCache(LRUCache):
+    """Bounded LRU cache of local sunrise and sunset keyed by (city, date)"""
+    
+    def __init__(self, maxsize=16384):
+        super().__init__(maxsize)
+    
+    def get_range(self, city, dates):
+        """Sunrise and sunset arrays for a CITY_COORDINATES city, computing only the dates not already cached"""
+        days = np.atleast_1d(np.asarray(dates)).astype("datetime64[D]")
+        keys = [(city, day) for day in days.tolist()]
+        found = self.lookup(keys)
+        sunrise = np.empty(len(days), dtype="datetime64[s]")
+        sunset = np.empty(len(days), dtype="datetime64[s]")
+        missing = []
+        for k, key in enumerate(keys):
+            if key in found:
+                sunrise[k], sunset[k] = found[key]
+            else:
+                missing.append(k)
+        
+        if missing:
+            computed = sun_times(days[missing], *CITY_COORDINATES[city])
+            sunrise[missing] = computed["sunrise"]
+            sunset[missing] = computed["sunset"]
+            self.store((keys[k], (sunrise[k], sunset[k])) for k in missing)
+        
+        return {"sunrise": sunrise, "sunset": sunset}
+
+class ResultCache(LRUCache):
+    """Bounded LRU of computed results where concurrent callers of one key share a single computation
+
+    Values are handed out by reference, not copied, so callers must treat them
+    as read-only.
+    """
+    
+    def __init__(self, maxsize=256):
+        super().__init__(maxsize)
+        self.waits = 0
+        self._pending = {}
+    
+    def get_or_compute(self, key, compute):
+        """Cached value for key; otherwise compute it once, even if several threads ask at the same time"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            future = self._pending.get(key)
+            owner = future is None
+            if owner:
+                future = self._pending[key] = Future()
+                self.misses += 1
+            else:
+                self.waits += 1
+        
+        if not owner:
+            return future.result()
+        
+        try:
+            value = compute()
+        except BaseException as exc:
+            with self._lock:
+                del self._pending[key]
+            future.set_exception(exc)
+            raise
+        
+        with self._lock:
+            self._store([(key, value)])
+            del self._pending[key]
+        future.set_result(value)
+        return value
+    
+    def stats(self):
+        return {**super().stats(), "waits": self.waits}
@@ -0,0 +1,85 @@
+"""Everything the dashboard shows for one date and symbol, computed in one call"""
+import datetime
+
+import numpy as np
+
+from .aspect_data import aspect_event_records, build_aspect_data, generate_aspects_for_date
+from .aspects import calculate_dynamic_aspects
+from .data import aug6_aspects
+from .ephemeris import calculate_dynamic_planetary_positions
+from .intraday import hora_grid, slot_hora_lords
+from .sentiment import calculate_market_sentiment_batch, calculate_market_sentiment_dynamic, forecast_rows_for_dates
+from .tables import planet_array
+from .timeline import generate_dynamic_timeline, get_market_type
+from .timing import NULL_TIMER
+
+FORECAST_HORIZON_DAYS = 3
+FORECAST_LONG_HORIZONS = (30, 90, 365, 1000)
+
+def compute_dashboard_data(date, symbol, aspect_index=None, city=None, sun_times_cache=None, timer=NULL_TIMER):
+    """Positions, aspects, timeline, sentiment and aspect rows for one date and symbol
+
+    The result may be shared between sessions through a ResultCache, so callers
+    must treat it as read-only. With an AspectIndex the day's aspect rows are
+    sliced from its year partition. With a CITY_COORDINATES city the hora lords
+    follow that city's sunrise. Each step is timed as a "dashboard." stage of
+    the given StageTimer. planetary_data and aspects are compact
+    PLANET_RECORD_DTYPE and ASPECT_RECORD_DTYPE arrays; format them with
+    planet_display_rows and aspect_display_rows when rendering.
+    """
+    with timer.stage("dashboard.positions"):
+        planetary_degrees = calculate_dynamic_planetary_positions(date)
+        planetary_data = planet_array(planetary_degrees)
+    
+    with timer.stage("dashboard.aspects"):
+        aspects = calculate_dynamic_aspects(planetary_degrees)
+    with timer.stage("dashboard.timeline"):
+        market_type = get_market_type(symbol)
+        hora_lords = slot_hora_lords(date, market_type, city, sun_times_cache)
+        timeline_data = generate_dynamic_timeline(symbol, date, planetary_degrees, aspects, hora_lords)
+        timeline_grid = hora_grid([date], market_type, symbol, city=city, sun_times_cache=sun_times_cache)
+    
+    with timer.stage("dashboard.sentiment"):
+        sentiment, sentiment_score, sentiment_factors = calculate_market_sentiment_dynamic(planetary_data, aspects, date)
+    
+    # Generate aspects data for the selected date
+    with timer.stage("dashboard.aspect_rows"):
+        if date == datetime.date(2025, 8, 6):
+            aspects_data = aug6_aspects
+        elif aspect_index is not None:
+            aspects_data = build_aspect_data(aspect_event_records(aspect_index.read(date, date)))
+        else:
+            aspects_data = generate_aspects_for_date(date)
+    
+    return {
+        "planetary_degrees": planetary_degrees,
+        "planetary_data": planetary_data,
+        "aspects": aspects,
+        "timeline_data": timeline_data,
+        "timeline_grid": timeline_grid,
+        "sentiment_data": {
+            "sentiment": sentiment,
+            "sentiment_score": sentiment_score,
+            "sentiment_factors": sentiment_factors
+        },
+        "aspects_data": aspects_data,
+        "filtered_aspects_data": aspects_data
+    }
+
+def forecast_window(date, horizon=FORECAST_HORIZON_DAYS, forecast_day_cache=None):
+    """Forecast rows for date - horizon .. date + horizon
+
+    With a ForecastDayCache, moving the window by one day computes only the one
+    day that enters it.
+    """
+    forecast_dates = [date + datetime.timedelta(days=i) for i in range(-horizon, horizon + 1)]
+    if forecast_day_cache is not None:
+        rows = forecast_day_cache.get_range(forecast_dates)
+    else:
+        rows = forecast_rows_for_dates(forecast_dates)
+    
+    return [{**row, "Is Today": forecast_date == date} for forecast_date, row in zip(forecast_dates, rows)]
+
+def forecast_series(date, days):
+    """Batch sentiment for date .. date + days - 1 as arrays, for long-horizon charts and paging"""
+    return calculate_market_sentiment_batch(np.datetime64(date, "D") + np.arange(days))
@@ -0,0 +1,105 @@
+"""Static reference tables: realized market data and the August 6, 2025 aspect table"""
+import datetime
+
+# Define actual market data for August 2025 (Nifty)
+# This will override the calculated forecast for these specific dates
+actual_market_data = {
+    datetime.date(2025, 8, 1): {"sentiment": "Very Bearish", "score": -3.2, "reason": "Sharp market fall due to global economic concerns"},
+    datetime.date(2025, 8, 4): {"sentiment": "Very Bullish", "score": 2.8, "reason": "Strong recovery on positive global cues"},
+    datetime.date(2025, 8, 5): {"sentiment": "Very Bearish", "score": -3.5, "reason": "Market fell sharply throughout the day"},
+    datetime.date(2025, 8, 6): {"sentiment": "Very Bearish", "score": -3.0, "reason": "Continued selling pressure, bearish trend"}
+}
+
+# Define planetary aspects data for August 6, 2025 - UPDATED WITH NEW IMPACT MEANINGS
+aug6_aspects = [
+    {
+        "time": "02:06 am",
+        "aspect": "Moon Quintile Node (☽ ⬠ ☊)",
+        "meaning": "Unusual opportunities, karmic shifts",
+        "indian_market": "Neutral",
+        "commodities": "Neutral",
+        "forex": "Sudden trend change",
+        "global_market": "Neutral"
+    },
+    {
+        "time": "02:34 am",
+        "aspect": "Moon BiQuintile Uranus (☽ bQ ♅)",
+        "meaning": "Innovative but erratic energy",
+        "indian_market": "Tech stocks volatile",
+        "commodities": "Neutral",
+        "forex": "Positive movement",
+        "global_market": "Neutral"
+    },
+    {
+        "time": "02:38 am",
+        "aspect": "Moon Opposition Venus (☽ ☍ ♀)",
+        "meaning": "Emotional vs. financial balance",
+        "indian_market": "Neutral",
+        "commodities": "Short-term dip",
+        "forex": "Neutral",
+        "global_market": "Neutral"
+    },
+    {
+        "time": "04:38 am",
+        "aspect": "Sun BiQuintile Moon (☉ bQ ☽)",
+        "meaning": "Creative problem-solving",
+        "indian_market": "Banking recovery",
+        "commodities": "Neutral",
+        "forex": "Neutral",
+        "global_market": "Neutral"
+    },
+    {
+        "time": "10:25 am",
+        "aspect": "Mars SemiSquare Lilith (♂ ∠ ⚸)",
+        "meaning": "Aggressive speculation",
+        "indian_market": "Midcaps/Smallcaps risks",
+        "commodities": "Neutral",
+        "forex": "Neutral",
+        "global_market": "Neutral"
+    },
+    {
+        "time": "01:39 pm",
+        "aspect": "Moon Opposition Jupiter (☽ ☍ ♃)",
+        "meaning": "Overconfidence vs. reality check",
+        "indian_market": "Rally then profit-taking",
+        "commodities": "Neutral",
+        "forex": "Neutral",
+        "global_market": "Temporary rally then profit-taking"
+    },
+    {
+        "time": "04:53 pm",
+        "aspect": "Sun Quincunx Moon (☉ ⚻ ☽)",
+        "meaning": "Adjustments needed",
+        "indian_market": "Neutral",
+        "commodities": "Downward pressure",
+        "forex": "Neutral",
+        "global_market": "Neutral"
+    },
+    {
+        "time": "05:10 pm",
+        "aspect": "Moon Sextile Lilith (☽ ⚹ ⚸)",
+        "meaning": "Hidden opportunities",
+        "indian_market": "Neutral",
+        "commodities": "Neutral",
+        "forex": "Altcoins surge",
+        "global_market": "Neutral"
+    },
+    {
+        "time": "07:35 pm",
+        "aspect": "Moon Sesquiquadrate Uranus (☽ ⚼ ♅)",
+        "meaning": "Sudden disruptions",
+        "indian_market": "Neutral",
+        "commodities": "Neutral",
+        "forex": "Neutral",
+        "global_market": "After-hours volatility"
+    },
+    {
+        "time": "09:18 pm",
+        "aspect": "Sun Square Lilith (☉ ☐ ⚸)",
+        "meaning": "Power struggles, manipulation",
+        "indian_market": "Neutral",
+        "commodities": "Institutional manipulation",
+        "forex": "Neutral",
+        "global_market": "Neutral"
+    }
+]
@@ -0,0 +1,74 @@
+"""Server-side downsampling and binning of long series before they are sent to the browser"""
+import numpy as np
+
+def lttb_indices(x, y, threshold):
+    """Indices of the points kept by largest-triangle-three-buckets downsampling
+
+    Always keeps the first and last point and one point per bucket in between,
+    so at most threshold points are returned. Each bucket is scanned with NumPy;
+    only the loop over buckets is in Python.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n_points = len(x)
+    if threshold >= n_points or threshold < 3:
+        return np.arange(n_points)
+    
+    # threshold - 2 buckets over the interior points, then the last point
+    edges = np.linspace(1, n_points - 1, threshold - 1).astype(np.int64)
+    edges = np.append(edges, n_points)
+    
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n_points - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        next_stop = edges[bucket + 2]
+        next_x = x[stop:next_stop].mean()
+        next_y = y[stop:next_stop].mean()
+        
+        area = np.abs(
+            (x[previous] - next_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        selected[bucket + 1] = previous
+    
+    return selected
+
+# Bin widths for pre-aggregated count charts, narrowest first: day, Monday-started week, calendar month
+AGGREGATION_BINS = ("D", "W", "M")
+AGGREGATION_LABELS = {"D": "Daily", "W": "Weekly", "M": "Monthly"}
+
+def bin_starts(days, freq):
+    """First day of the freq bin holding each day, as datetime64[D]"""
+    days = np.asarray(days).astype("datetime64[D]")
+    if freq == "W":
+        # 1970-01-01 was a Thursday, so (day + 3) % 7 counts days since Monday
+        return days - (days.astype(np.int64) + 3) % 7
+    if freq == "M":
+        return days.astype("datetime64[M]").astype("datetime64[D]")
+    return days
+
+def aggregation_bin(days, max_bins):
+    """Narrowest AGGREGATION_BINS width that keeps days within max_bins bins; the widest when none does"""
+    days = np.asarray(days).astype("datetime64[D]")
+    for freq in AGGREGATION_BINS:
+        if len(np.unique(bin_starts(days, freq))) <= max_bins:
+            return freq
+    return AGGREGATION_BINS[-1]
+
+def binned_counts(days, codes, n_codes, freq):
+    """Bin start days with data and an (n_bins, n_codes) matrix counting each integer code per bin"""
+    bins, position = np.unique(bin_starts(days, freq), return_inverse=True)
+    counts = np.zeros((len(bins), n_codes), dtype=np.int64)
+    np.add.at(counts, (position, np.asarray(codes)), 1)
+    return bins, counts
+
+def rollup_counts(days, counts, freq):
+    """Sum the rows of a per-day counts matrix into freq bins: bin start days and the summed matrix"""
+    bins, position = np.unique(bin_starts(days, freq), return_inverse=True)
+    rolled = np.zeros((len(bins), counts.shape[1]), dtype=counts.dtype)
+    np.add.at(rolled, position, counts)
+    return bins, rolled
@@ -0,0 +1,41 @@
+"""Mean-motion ephemeris for the nine grahas, vectorized over dates"""
+import datetime
+
+import numpy as np
+
+# Enhanced planetary calculations
+REFERENCE_DATE = datetime.date(2025, 8, 6)
+
+PLANETS = ("Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Rahu", "Ketu")
+
+# Mean daily motion and reference-date longitude, in PLANETS order
+DAILY_MOVEMENTS = np.array([0.9856, 13.1764, 1.383, 1.202, 0.524, 0.083, 0.034, -0.053, -0.053])
+BASE_POSITIONS = np.array([109.5, 251.68, 94.27, 137.75, 87.0, 22.67, 308.33, 352.67, 172.67])
+
+def days_since_reference(dates):
+    """Fractional days from REFERENCE_DATE for an array of dates or timestamps"""
+    stamps = np.atleast_1d(np.asarray(dates))
+    if stamps.dtype.kind != "M":
+        stamps = stamps.astype("datetime64[s]")
+    return (stamps - np.datetime64(REFERENCE_DATE)) / np.timedelta64(1, "D")
+
+def reference_offset_to_datetime(days_diff):
+    """datetime64[s] instants for fractional day offsets from REFERENCE_DATE; NaN becomes NaT"""
+    days_diff = np.asarray(days_diff, dtype=float)
+    stamps = np.full(days_diff.shape, np.datetime64("NaT"), dtype="datetime64[s]")
+    known = ~np.isnan(days_diff)
+    seconds = np.round(days_diff[known] * 86400).astype(np.int64)
+    stamps[known] = np.datetime64(REFERENCE_DATE, "s") + seconds.astype("timedelta64[s]")
+    return stamps
+
+def planetary_positions_at(days_diff):
+    """Longitudes at fractional day offsets from REFERENCE_DATE, shape (n, n_bodies)"""
+    return (BASE_POSITIONS + np.multiply.outer(days_diff, DAILY_MOVEMENTS)) % 360
+
+def calculate_planetary_positions_batch(dates):
+    """Longitudes for many dates at once as an (n_dates, n_bodies) array in PLANETS order"""
+    return planetary_positions_at(days_since_reference(dates))
+
+def calculate_dynamic_planetary_positions(date):
+    positions = calculate_planetary_positions_batch([date])[0]
+    return dict(zip(PLANETS, positions.tolist()))
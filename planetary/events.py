@@ -0,0 +1,125 @@
+"""Exact aspect perfection and orb entry/exit instants"""
+import hashlib
+
+import numpy as np
+
+from .aspects import ASPECT_ANGLES, ASPECT_NAMES, ASPECT_ORBS, STRENGTH_LIMITS
+from .ephemeris import (
+    BASE_POSITIONS, DAILY_MOVEMENTS, PLANETS, REFERENCE_DATE,
+    days_since_reference, planetary_positions_at, reference_offset_to_datetime
+)
+
+# Perfection targets: each signed separation (body1 - body2) at which an aspect is exact
+ASPECT_TARGET_CODES = np.array([0, 1, 1, 2, 2, 3, 3, 4])
+ASPECT_TARGET_ANGLES = np.array([0, 60, 300, 90, 270, 120, 240, 180])
+
+ASPECT_EVENT_STEP_HOURS = 3
+ASPECT_EVENT_TOLERANCE_SECONDS = 1
+# Orb edges are searched as far beyond the range as the slowest moving pair takes to cross the widest orb
+RELATIVE_DAILY_MOVEMENTS = np.abs(np.subtract.outer(DAILY_MOVEMENTS, DAILY_MOVEMENTS))
+ASPECT_ORB_MARGIN_DAYS = int(np.ceil(ASPECT_ORBS.max() / RELATIVE_DAILY_MOVEMENTS[RELATIVE_DAILY_MOVEMENTS > 0].min())) + 1
+
+def aspect_rules_version():
+    """Fingerprint of the ephemeris and aspect rule parameters, used to invalidate cached aspects"""
+    params = (
+        REFERENCE_DATE, DAILY_MOVEMENTS.tolist(), BASE_POSITIONS.tolist(),
+        ASPECT_NAMES, ASPECT_ANGLES.tolist(), ASPECT_ORBS.tolist(), STRENGTH_LIMITS.tolist(),
+        ASPECT_TARGET_ANGLES.tolist(), ASPECT_EVENT_STEP_HOURS, ASPECT_EVENT_TOLERANCE_SECONDS, ASPECT_ORB_MARGIN_DAYS
+    )
+    return hashlib.sha1(repr(params).encode()).hexdigest()[:12]
+
+def aspect_target_offset(days_diff, body1, body2, target):
+    """Signed distance in [-180, 180) of the body1 - body2 separation from a target angle, elementwise"""
+    longitude1 = (BASE_POSITIONS[body1] + DAILY_MOVEMENTS[body1] * days_diff) % 360
+    longitude2 = (BASE_POSITIONS[body2] + DAILY_MOVEMENTS[body2] * days_diff) % 360
+    return (longitude1 - longitude2 - ASPECT_TARGET_ANGLES[target] + 180) % 360 - 180
+
+def bracket_crossings(values):
+    """Grid and series indexes where values change sign between consecutive grid rows
+
+    Jumps of 90 or more are wrap-arounds of an angle, not crossings.
+    """
+    below = values < 0
+    change = (below[:-1] != below[1:]) & (np.abs(np.diff(values, axis=0)) < 90)
+    return np.nonzero(change)
+
+def refine_crossings(fn, lo, hi, tolerance):
+    """Vectorized bisection of every [lo, hi] bracket of fn, finished with one secant step"""
+    f_lo = fn(lo)
+    while len(lo) and np.max(hi - lo) > tolerance:
+        mid = (lo + hi) / 2
+        f_mid = fn(mid)
+        same_side = (f_mid < 0) == (f_lo < 0)
+        lo, f_lo = np.where(same_side, mid, lo), np.where(same_side, f_mid, f_lo)
+        hi = np.where(same_side, hi, mid)
+    f_hi = fn(hi)
+    span = np.where(f_hi != f_lo, f_hi - f_lo, 1)
+    return np.clip(lo - f_lo * (hi - lo) / span, lo, hi)
+
+def find_aspect_events(start, end):
+    """Exact, orb-entry and orb-exit instants of every body pair and aspect perfecting in [start, end)
+
+    Sign changes of (separation - aspect angle) and of (|offset| - orb) are
+    bracketed on an ASPECT_EVENT_STEP_HOURS grid and all brackets are refined
+    together. Orb edges are searched ASPECT_ORB_MARGIN_DAYS beyond the range,
+    which covers the slowest moving pair. Pairs that never move relative to
+    each other (Rahu and Ketu) have no perfection instant.
+    """
+    t_start, t_end = days_since_reference([start, end]).tolist()
+    step = ASPECT_EVENT_STEP_HOURS / 24
+    tolerance = ASPECT_EVENT_TOLERANCE_SECONDS / 86400
+    grid = np.arange(t_start - ASPECT_ORB_MARGIN_DAYS, t_end + ASPECT_ORB_MARGIN_DAYS + step, step)
+    
+    body1, body2 = np.triu_indices(len(PLANETS), 1)
+    positions = planetary_positions_at(grid)
+    separation = positions[:, body1] - positions[:, body2]
+    offset = (separation[:, :, np.newaxis] - ASPECT_TARGET_ANGLES + 180) % 360 - 180
+    target_orbs = ASPECT_ORBS[ASPECT_TARGET_CODES]
+    
+    def offset_at(t, pair, target):
+        return aspect_target_offset(t, body1[pair], body2[pair], target)
+    
+    def edge_at(t, pair, target):
+        return np.abs(offset_at(t, pair, target)) - target_orbs[target]
+    
+    def crossings(values, fn):
+        k, pair, target = bracket_crossings(values)
+        t = refine_crossings(lambda t: fn(t, pair, target), grid[k], grid[k + 1], tolerance)
+        return t, pair, target, values[k + 1, pair, target] >= 0
+    
+    exact_t, exact_pair, exact_target, _ = crossings(offset, offset_at)
+    in_range = (exact_t >= t_start) & (exact_t < t_end)
+    exact_t, exact_pair, exact_target = exact_t[in_range], exact_pair[in_range], exact_target[in_range]
+    edge_t, edge_pair, edge_target, leaving = crossings(np.abs(offset) - target_orbs, edge_at)
+    
+    # Pair each perfection with the closest orb entry before it and exit after it in the same series
+    n_targets = len(ASPECT_TARGET_ANGLES)
+    span = grid[-1] - grid[0] + 1
+    exact_series = exact_pair * n_targets + exact_target
+    exact_keys = exact_series * span + (exact_t - grid[0])
+    
+    def nearest_edge(mask, before):
+        series = edge_pair[mask] * n_targets + edge_target[mask]
+        keys = series * span + (edge_t[mask] - grid[0])
+        order = np.argsort(keys)
+        keys, series, times = keys[order], series[order], edge_t[mask][order]
+        pos = np.searchsorted(keys, exact_keys) - (1 if before else 0)
+        found = (pos >= 0) & (pos < len(keys))
+        pos = pos.clip(0, max(len(keys) - 1, 0))
+        if len(keys):
+            found &= series[pos] == exact_series
+            return np.where(found, times[pos], np.nan)
+        return np.full(len(exact_keys), np.nan)
+    
+    enter_t = nearest_edge(~leaving, before=True)
+    leave_t = nearest_edge(leaving, before=False)
+    
+    order = np.argsort(exact_t, kind="stable")
+    return {
+        "exact": reference_offset_to_datetime(exact_t[order]),
+        "enter": reference_offset_to_datetime(enter_t[order]),
+        "leave": reference_offset_to_datetime(leave_t[order]),
+        "body1": body1[exact_pair[order]].astype(np.int8),
+        "body2": body2[exact_pair[order]].astype(np.int8),
+        "aspect": ASPECT_TARGET_CODES[exact_target[order]].astype(np.int8)
+    }
@@ -0,0 +1,108 @@
+"""On-disk columnar index of aspect events"""
+import datetime
+import os
+import shutil
+import tempfile
+import threading
+
+import numpy as np
+
+from .aspect_data import ASPECT_EVENT_COLUMNS, aspect_event_columns, search_aspect_events
+from .events import aspect_rules_version
+
+ASPECT_INDEX_DIR = os.environ.get(
+    "ASPECT_INDEX_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".aspect_index")
+)
+
+# Written into every version directory; only directories carrying it are ever pruned
+ASPECT_INDEX_MARKER = ".aspect-index-version"
+
+class AspectIndex:
+    """On-disk columnar store of aspect events, partitioned by year and memory-mapped on read
+
+    Partitions live under <root>/<rules version>/<year>/ with one .npy file per
+    column. A year is built the first time a read touches it. Version
+    directories carry an ASPECT_INDEX_MARKER file, and those written under
+    another rules version are removed when the index is opened; nothing else
+    in root is touched, so root may be a shared directory. root defaults to
+    ASPECT_INDEX_DIR at the time the index is opened.
+    """
+    
+    def __init__(self, root=None):
+        if root is None:
+            root = ASPECT_INDEX_DIR
+        self.root = root
+        self.version = aspect_rules_version()
+        self.path = os.path.join(root, self.version)
+        self.built = 0
+        self._partitions = {}
+        self._lock = threading.Lock()
+        
+        os.makedirs(self.path, exist_ok=True)
+        with open(os.path.join(self.path, ASPECT_INDEX_MARKER), "w") as f:
+            f.write(self.version)
+        for name in os.listdir(root):
+            folder = os.path.join(root, name)
+            if name != self.version and os.path.isfile(os.path.join(folder, ASPECT_INDEX_MARKER)):
+                shutil.rmtree(folder, ignore_errors=True)
+    
+    def build_year(self, year):
+        """Compute one year of events and move the finished partition into place"""
+        days = np.arange(np.datetime64(f"{year:04d}-01-01"), np.datetime64(f"{year + 1:04d}-01-01"))
+        columns = aspect_event_columns(days)
+        staging = tempfile.mkdtemp(prefix=f".{year}-", dir=self.path)
+        for name in ASPECT_EVENT_COLUMNS:
+            np.save(os.path.join(staging, f"{name}.npy"), columns[name])
+        try:
+            os.replace(staging, os.path.join(self.path, str(year)))
+            self.built += 1
+        except OSError:
+            # Another process finished the same partition first
+            shutil.rmtree(staging, ignore_errors=True)
+    
+    def partition(self, year):
+        with self._lock:
+            if year not in self._partitions:
+                folder = os.path.join(self.path, str(year))
+                if not os.path.isdir(folder):
+                    self.build_year(year)
+                self._partitions[year] = {
+                    name: np.load(os.path.join(folder, f"{name}.npy"), mmap_mode="r")
+                    for name in ASPECT_EVENT_COLUMNS
+                }
+            return self._partitions[year]
+    
+    def read(self, start_date, end_date, progress=None):
+        """Event columns from start_date to end_date inclusive, sliced from the year partitions
+        
+        progress(done, total) is called after each year, with one extra step
+        left for the caller.
+        """
+        bounds = np.array([start_date, end_date + datetime.timedelta(days=1)], dtype="datetime64[D]")
+        years = range(start_date.year, end_date.year + 1)
+        pieces = []
+        for done, year in enumerate(years, 1):
+            part = self.partition(year)
+            lo, hi = np.searchsorted(part["day"], bounds)
+            pieces.append({name: part[name][lo:hi] for name in ASPECT_EVENT_COLUMNS})
+            if progress is not None:
+                progress(done, len(years) + 1)
+        return {name: np.concatenate([piece[name] for piece in pieces]) for name in ASPECT_EVENT_COLUMNS}
+    
+    def stats(self):
+        return {"version": self.version, "mapped_years": len(self._partitions), "built": self.built}
+
+def use_aspect_index_dir(root):
+    """Open default AspectIndex instances under root from now on; returns the previous root"""
+    global ASPECT_INDEX_DIR
+    previous, ASPECT_INDEX_DIR = ASPECT_INDEX_DIR, root
+    return previous
+
+def search_aspect_range(aspect_index, start_date, end_date, symbol, impact_filter, progress=None):
+    """Advanced Aspect Search over an index range, reporting progress per year and for the final filter"""
+    events = aspect_index.read(start_date, end_date, progress)
+    search_df = search_aspect_events(events, symbol, impact_filter)
+    if progress is not None:
+        total = end_date.year - start_date.year + 2
+        progress(total, total)
+    return search_df
@@ -0,0 +1,160 @@
+"""Numeric intraday hora engine: slot grids of lords and scores, vectorized over days
+
+hora_grid produces the same lords, scores and sentiments as hora_timeline, but
+as (n_days, n_slots) arrays with datetime64 slot boundaries, so the current
+slot is a binary search and a minute-level grid is a single take.
+"""
+import datetime
+
+import numpy as np
+
+from .aspects import find_aspects_batch
+from .ephemeris import PLANETS, calculate_planetary_positions_batch
+from .market_store import MARKET_REFERENCE_SYMBOL, get_market_store
+from .solar import city_planetary_hours
+from .tables import PLANET_CODES, dignity_code, sign_code
+from .timeline import HORA_SENTIMENT_WEIGHTS, MARKET_SESSION_TIMES
+
+HORA_SEQUENCE = np.array([PLANET_CODES[planet] for planet in ("Sun", "Venus", "Mercury", "Moon", "Saturn", "Jupiter", "Mars")])
+
+def minutes_after_midnight(time_str):
+    """Minutes after midnight for an "hh:mm AM" slot label"""
+    slot_time = datetime.datetime.strptime(time_str, "%I:%M %p")
+    return slot_time.hour * 60 + slot_time.minute
+
+# Slot start minutes, parsed once; a session may close after midnight (minute >= 1440)
+MARKET_SESSION_SLOT_MINUTES = {
+    market_type: np.array([minutes_after_midnight(time_str) for time_str in times])
+    for market_type, times in MARKET_SESSION_TIMES.items()
+}
+MARKET_SESSION_CLOSE_MINUTES = {"Indian": 15 * 60 + 30, "International": 25 * 60}
+
+# Slot score rules: aspect sign in ASPECT_NAMES order, points in STRENGTHS order
+HORA_ASPECT_SIGNS = np.array([0, 1, -1, 1, -1])
+HORA_STRENGTH_POINTS = np.array([2, 1.5, 1])
+HORA_ASPECT_LIMIT = 2
+
+HORA_SENTIMENTS = ("Very Bearish", "Bearish", "Neutral", "Bullish", "Very Bullish")
+HORA_SENTIMENT_THRESHOLDS = np.array([-2, -1, 1, 2])
+HORA_ACTIONS = ("SELL", "HOLD", "BUY")
+
+def realized_adjustments(days, symbol=None):
+    """Per-day score adjustment from realized sentiment of the symbol, else of the reference index"""
+    store = get_market_store()
+    adjustment = np.zeros(len(days))
+    if not len(days):
+        return adjustment
+    
+    sources = [MARKET_REFERENCE_SYMBOL]
+    if symbol is not None and symbol in store:
+        sources.append(symbol)
+    label_adjustment = np.array([
+        -1.5 if "Bearish" in label else 1.0 if "Bullish" in label else 0.0 for label in store.labels
+    ])
+    
+    # Later sources win, so the symbol's own rows override the reference index
+    for source in sources:
+        realized = store.read(days.min(), days.max(), source)
+        if not len(realized["day"]):
+            continue
+        row = np.minimum(np.searchsorted(realized["day"], days), len(realized["day"]) - 1)
+        matched = realized["day"][row] == days
+        adjustment[matched] = label_adjustment[realized["sentiment"][row[matched]]]
+    return adjustment
+
+def hora_aspect_scores(hits, n_dates, n_bodies=len(PLANETS)):
+    """Aspect part of the slot score for every (date, planet): the first HORA_ASPECT_LIMIT aspects involving it"""
+    n_hits = len(hits["date"])
+    date = np.concatenate([hits["date"], hits["date"]])
+    planet = np.concatenate([hits["body1"], hits["body2"]])
+    order = np.concatenate([np.arange(n_hits), np.arange(n_hits)])
+    value = np.tile(HORA_ASPECT_SIGNS[hits["aspect"]] * HORA_STRENGTH_POINTS[hits["strength"]], 2)
+    
+    # Rank each hit among the hits of its own (date, planet), in engine order
+    sort = np.lexsort((order, planet, date))
+    group = date[sort] * n_bodies + planet[sort]
+    first = np.searchsorted(group, group)
+    used = sort[np.arange(len(sort)) - first < HORA_ASPECT_LIMIT]
+    
+    scores = np.zeros((n_dates, n_bodies))
+    np.add.at(scores, (date[used], planet[used]), value[used])
+    return scores
+
+def fixed_hora_lords(days, n_slots):
+    """Lords of the simplified hora count used by hora_timeline: weekday * 24 + 9, one lord per slot"""
+    weekday = (days.astype(np.int64) + 3) % 7
+    hora_index = ((weekday * 24 + 9) % 7)[:, None] + np.arange(n_slots)
+    return HORA_SEQUENCE[hora_index % 7]
+
+def sunrise_hora_lords(days, start, city, sun_times_cache=None):
+    """Lord of the sunrise-based planetary hour containing each slot start, in the city's local time
+
+    Slots before sunrise fall in the previous day's night hours, so that day
+    is included in the lookup.
+    """
+    hour_days = np.union1d(days - 1, days)
+    hours = city_planetary_hours(city, hour_days, sun_times_cache)
+    hour = np.searchsorted(hours["start"].ravel(), start.ravel().astype("datetime64[s]"), side="right") - 1
+    return hours["lord"].ravel()[hour].reshape(start.shape)
+
+def slot_hora_lords(date, market_type, city=None, sun_times_cache=None):
+    """Planet names of the sunrise-based lords of one day's slots, for hora_timeline; None without a city"""
+    if city is None:
+        return None
+    days = np.atleast_1d(np.datetime64(date, "D"))
+    start = days.astype("datetime64[m]")[:, None] + MARKET_SESSION_SLOT_MINUTES[market_type]
+    return [PLANETS[lord] for lord in sunrise_hora_lords(days, start, city, sun_times_cache)[0].tolist()]
+
+def hora_grid(dates, market_type, symbol=None, positions=None, hits=None, city=None, sun_times_cache=None):
+    """Slot starts and ends (datetime64[m]), lords, dignities, scores, sentiment and action codes, shape (n_days, n_slots)
+
+    city must be a CITY_COORDINATES name; slot times are then read as that
+    city's local clock.
+    """
+    days = np.atleast_1d(np.asarray(dates)).astype("datetime64[D]")
+    if positions is None:
+        positions = calculate_planetary_positions_batch(days)
+    if hits is None:
+        hits = find_aspects_batch(positions)
+    
+    slot_minutes = MARKET_SESSION_SLOT_MINUTES[market_type]
+    n_slots = len(slot_minutes)
+    start = days.astype("datetime64[m]")[:, None] + slot_minutes
+    end = np.concatenate([start[:, 1:], days.astype("datetime64[m]")[:, None] + MARKET_SESSION_CLOSE_MINUTES[market_type]], axis=1)
+    
+    # Planetary hours from local sunrise for a known city, else the simplified count
+    if city is not None:
+        lord = sunrise_hora_lords(days, start, city, sun_times_cache)
+    else:
+        lord = fixed_hora_lords(days, n_slots)
+    lord_degree = np.take_along_axis(positions, lord, axis=1)
+    dignity = dignity_code(lord, sign_code(lord_degree))
+    
+    aspect_scores = np.take_along_axis(hora_aspect_scores(hits, len(days), positions.shape[1]), lord, axis=1)
+    score = aspect_scores + realized_adjustments(days, symbol)[:, None] + HORA_SENTIMENT_WEIGHTS[lord, dignity]
+    
+    return {
+        "day": days,
+        "start": start,
+        "end": end,
+        "lord": lord,
+        "dignity": dignity,
+        "score": score,
+        "sentiment": np.searchsorted(HORA_SENTIMENT_THRESHOLDS, score, side="right"),
+        "action": np.where(score > 1, 2, np.where(score < -1, 0, 1))
+    }
+
+def current_slot(grid, now):
+    """(day index, slot index) of the slot containing now, or None outside every session; a binary search"""
+    starts = grid["start"].ravel()
+    flat = int(np.searchsorted(starts, np.datetime64(now, "m"), side="right")) - 1
+    if flat < 0 or np.datetime64(now, "m") >= grid["end"].ravel()[flat]:
+        return None
+    return divmod(flat, grid["start"].shape[1])
+
+def minute_grid(grid, market_type):
+    """Lord and score for every session minute of every day, shape (n_days, n_minutes)"""
+    slot_minutes = MARKET_SESSION_SLOT_MINUTES[market_type]
+    minutes = np.arange(slot_minutes[0], MARKET_SESSION_CLOSE_MINUTES[market_type])
+    slot = np.searchsorted(slot_minutes, minutes, side="right") - 1
+    return {"minute": minutes, "slot": slot, "lord": grid["lord"][:, slot], "score": grid["score"][:, slot]}
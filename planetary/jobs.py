@@ -0,0 +1,53 @@
+"""Background jobs with throttled progress and cooperative cancellation"""
+import threading
+import time
+
+JOB_PROGRESS_INTERVAL = 0.25
+
+class JobCancelled(Exception):
+    """Raised inside a job's progress callback once the job has been cancelled"""
+
+class BackgroundJob:
+    """fn(*args, progress=...) submitted to an executor, tagged with the key of the query it answers
+    
+    fn reports work through progress(done, total), which also raises
+    JobCancelled after cancel(), so a job stops at its next step. Progress
+    is published at most every interval seconds, plus the final step.
+    """
+    
+    def __init__(self, executor, key, fn, *args, interval=JOB_PROGRESS_INTERVAL):
+        self.key = key
+        self.interval = interval
+        self.done = 0
+        self.total = 0
+        self._published = 0.0
+        self._cancel = threading.Event()
+        self._future = executor.submit(fn, *args, progress=self.progress)
+    
+    def progress(self, done, total):
+        if self._cancel.is_set():
+            raise JobCancelled()
+        now = time.monotonic()
+        if done >= total or now - self._published >= self.interval:
+            self.done, self.total = done, total
+            self._published = now
+    
+    def cancel(self):
+        self._cancel.set()
+        self._future.cancel()
+    
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+    
+    @property
+    def running(self):
+        return not self._future.done()
+    
+    @property
+    def fraction(self):
+        return self.done / self.total if self.total else 0.0
+    
+    def result(self):
+        """The job's return value; re-raises its exception, and a cancelled job raises"""
+        return self._future.result()
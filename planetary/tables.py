@@ -0,0 +1,100 @@
+"""Sign, nakshatra and dignity lookup tables"""
+import numpy as np
+
+from .ephemeris import PLANETS
+
+# Compiled lookup tables: sign, nakshatra and dignity codes index SIGNS, NAKSHATRAS and DIGNITIES
+SIGNS = ("Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+         "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces")
+
+NAKSHATRAS = (
+    "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra",
+    "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni",
+    "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha",
+    "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha",
+    "Purva Bhadrapada", "Uttara Bhadrapada", "Revati"
+)
+NAKSHATRA_SPAN = 13.333333
+
+DIGNITIES = ("Neutral", "Exalted", "Own Sign", "Debilitated")
+
+PLANET_RULERSHIPS = {
+    "Sun": {"exalted": "Aries", "own": ["Leo"], "debilitated": "Libra"},
+    "Moon": {"exalted": "Taurus", "own": ["Cancer"], "debilitated": "Scorpio"},
+    "Mercury": {"exalted": "Virgo", "own": ["Gemini", "Virgo"], "debilitated": "Pisces"},
+    "Venus": {"exalted": "Pisces", "own": ["Taurus", "Libra"], "debilitated": "Virgo"},
+    "Mars": {"exalted": "Capricorn", "own": ["Aries", "Scorpio"], "debilitated": "Cancer"},
+    "Jupiter": {"exalted": "Cancer", "own": ["Sagittarius", "Pisces"], "debilitated": "Capricorn"},
+    "Saturn": {"exalted": "Libra", "own": ["Capricorn", "Aquarius"], "debilitated": "Aries"},
+    "Rahu": {"exalted": "Gemini", "own": [], "debilitated": "Sagittarius"},
+    "Ketu": {"exalted": "Sagittarius", "own": [], "debilitated": "Gemini"}
+}
+
+PLANET_CODES = {planet: code for code, planet in enumerate(PLANETS)}
+SIGN_CODES = {sign: code for code, sign in enumerate(SIGNS)}
+
+def build_dignity_table():
+    """(planet code, sign code) -> dignity code; exaltation wins over own sign, own sign over debilitation"""
+    table = np.zeros((len(PLANETS), len(SIGNS)), dtype=np.int8)
+    for planet, rulership in PLANET_RULERSHIPS.items():
+        row = table[PLANET_CODES[planet]]
+        row[SIGN_CODES[rulership["debilitated"]]] = DIGNITIES.index("Debilitated")
+        for sign in rulership["own"]:
+            row[SIGN_CODES[sign]] = DIGNITIES.index("Own Sign")
+        row[SIGN_CODES[rulership["exalted"]]] = DIGNITIES.index("Exalted")
+    return table
+
+DIGNITY_TABLE = build_dignity_table()
+
+def sign_code(degree):
+    """Sign code for a degree or an array of degrees"""
+    return np.floor_divide(degree, 30).astype(int) % 12
+
+def nakshatra_code(degree):
+    """Nakshatra code for a degree or an array of degrees"""
+    return np.floor_divide(degree, NAKSHATRA_SPAN).astype(int) % 27
+
+def dignity_code(planet, sign):
+    """Dignity code for planet and sign codes, scalars or broadcastable arrays"""
+    return DIGNITY_TABLE[planet, sign]
+
+# Compact planet rows: planet, sign, nakshatra and dignity codes index PLANETS, SIGNS, NAKSHATRAS and DIGNITIES
+PLANET_RECORD_DTYPE = np.dtype([
+    ("planet", np.int8), ("degree", np.float64), ("sign", np.int8), ("nakshatra", np.int8), ("dignity", np.int8)
+])
+
+def planet_array(planetary_degrees):
+    """PLANET_RECORD_DTYPE rows for a {planet: degree} dict, in its order"""
+    planets = np.array([PLANET_CODES[planet] for planet in planetary_degrees], dtype=int)
+    degrees = np.array(list(planetary_degrees.values()), dtype=np.float64)
+    records = np.empty(len(planets), dtype=PLANET_RECORD_DTYPE)
+    records["planet"] = planets
+    records["degree"] = degrees
+    records["sign"] = sign_code(degrees)
+    records["nakshatra"] = nakshatra_code(degrees)
+    records["dignity"] = dignity_code(planets, sign_code(degrees))
+    return records
+
+def planet_display_rows(planets):
+    """Planet, Degree, Sign, Nakshatra and Strength display dicts for PLANET_RECORD_DTYPE rows"""
+    return [
+        {
+            "Planet": PLANETS[planet],
+            "Degree": f"{int(degree)}°{int((degree % 1) * 60)}'",
+            "Sign": SIGNS[sign],
+            "Nakshatra": NAKSHATRAS[nakshatra],
+            "Strength": DIGNITIES[dignity]
+        }
+        for planet, degree, sign, nakshatra, dignity in planets.tolist()
+    ]
+
+def get_planet_strength(planet, sign):
+    if planet in PLANET_CODES and sign in SIGN_CODES:
+        return DIGNITIES[DIGNITY_TABLE[PLANET_CODES[planet], SIGN_CODES[sign]]]
+    return "Neutral"
+
+def get_sign_from_degree(degree):
+    return SIGNS[sign_code(degree)]
+
+def get_nakshatra_from_degree(degree):
+    return NAKSHATRAS[nakshatra_code(degree)]
@@ -0,0 +1,120 @@
+"""Hora-based intraday trading timeline"""
+import numpy as np
+
+from .aspects import ASPECT_NAMES, STRENGTHS
+from .ephemeris import PLANETS
+from .market_store import get_market_store
+from .tables import DIGNITIES, NAKSHATRAS, PLANET_CODES, SIGNS, dignity_code, nakshatra_code, sign_code
+
+# Hora lord dignity weights: planet rows follow PLANETS, dignity columns follow DIGNITIES
+HORA_SENTIMENT_WEIGHTS = np.array([
+    [0, 1.5, 1, -1.5],      # Sun
+    [0, 1.5, 1, -1.5],      # Moon
+    [0, 1.5, 1, -1.5],      # Mercury
+    [0, 2, 1, -2],          # Venus
+    [-0.5, 1, 0.5, -2],     # Mars
+    [0, 2, 1, -2],          # Jupiter
+    [-0.5, 1, 0.5, -2],     # Saturn
+    [-0.5, 1, 0.5, -2],     # Rahu
+    [-0.5, 1, 0.5, -2]      # Ketu
+])
+
+INDIAN_INDEX_SYMBOLS = ("NIFTY", "BANKNIFTY", "FINNIFTY", "MIDCPNIFTY")
+
+# Timeline slot start times for each market session profile
+MARKET_SESSION_TIMES = {
+    "Indian": ["09:15 AM", "10:15 AM", "11:15 AM", "12:15 PM", "01:15 PM", "02:15 PM", "03:15 PM"],
+    "International": ["05:00 AM", "07:00 AM", "09:00 AM", "11:00 AM", "01:00 PM", "03:00 PM", "05:00 PM", "07:00 PM", "09:00 PM", "11:00 PM"]
+}
+
+def get_market_type(symbol):
+    return "Indian" if symbol.upper() in INDIAN_INDEX_SYMBOLS else "International"
+
+def realized_market_sentiment(symbol, date):
+    """Realized sentiment label for the symbol itself, else for the reference index, else None"""
+    store = get_market_store()
+    realized = store.lookup(date, symbol) or store.lookup(date)
+    return realized["sentiment"] if realized is not None else None
+
+def generate_dynamic_timeline(symbol, date, planetary_degrees, aspects, hora_lords=None):
+    return hora_timeline(
+        get_market_type(symbol), date, planetary_degrees, aspects, realized_market_sentiment(symbol, date), hora_lords
+    )
+
+def hora_timeline(market_type, date, planetary_degrees, aspects, market_sentiment=None, hora_lords=None):
+    """Hora slots for one market session profile; symbols sharing the profile and realized sentiment share the result
+
+    hora_lords, one planet name per slot, replaces the simplified weekday count,
+    e.g. with sunrise-based lords from planetary.intraday. aspects are
+    ASPECT_RECORD_DTYPE rows with PLANETS codes.
+    """
+    hora_sequence = ["Sun", "Venus", "Mercury", "Moon", "Saturn", "Jupiter", "Mars"]
+    times = MARKET_SESSION_TIMES[market_type]
+    
+    timeline_data = []
+    hora_index = (date.weekday() * 24 + 9) % 7
+    
+    for i, time_str in enumerate(times):
+        hora_lord = hora_lords[i] if hora_lords is not None else hora_sequence[hora_index % 7]
+        
+        hora_degree = planetary_degrees.get(hora_lord, 0)
+        hora_sign = sign_code(hora_degree)
+        hora_code = PLANET_CODES[hora_lord]
+        hora_strength = dignity_code(hora_code, hora_sign)
+        
+        relevant_aspects = aspects[(aspects["body1"] == hora_code) | (aspects["body2"] == hora_code)][:2]
+        
+        influence_parts = []
+        influence_parts.append(f"{hora_lord} at {hora_degree:.1f}° in {SIGNS[hora_sign]} ({NAKSHATRAS[nakshatra_code(hora_degree)]})")
+        
+        if hora_strength:
+            influence_parts.append(f"{hora_lord} is {DIGNITIES[hora_strength]}")
+        
+        sentiment_score = 0
+        for body1, body2, aspect, strength in zip(
+            relevant_aspects["body1"].tolist(), relevant_aspects["body2"].tolist(),
+            relevant_aspects["aspect"].tolist(), relevant_aspects["strength"].tolist()
+        ):
+            other_planet = PLANETS[body2 if body1 == hora_code else body1]
+            aspect_type = ASPECT_NAMES[aspect]
+            strength = STRENGTHS[strength]
+            
+            influence_parts.append(f"{aspect_type} with {other_planet} ({strength})")
+            
+            if aspect_type in ["Trine", "Sextile"]:
+                sentiment_score += {"Exact": 2, "Close": 1.5, "Wide": 1}[strength]
+            elif aspect_type in ["Square", "Opposition"]:
+                sentiment_score -= {"Exact": 2, "Close": 1.5, "Wide": 1}[strength]
+        
+        # Adjust sentiment based on actual market data for the date
+        if market_sentiment is not None:
+            if "Bearish" in market_sentiment:
+                sentiment_score -= 1.5  # Adjust for bearish market
+            elif "Bullish" in market_sentiment:
+                sentiment_score += 1.0  # Adjust for bullish market
+        
+        sentiment_score += float(HORA_SENTIMENT_WEIGHTS[hora_code, hora_strength])
+        
+        if sentiment_score >= 2:
+            sentiment = "Very Bullish"
+        elif sentiment_score >= 1:
+            sentiment = "Bullish"
+        elif sentiment_score >= -1:
+            sentiment = "Neutral"
+        elif sentiment_score >= -2:
+            sentiment = "Bearish"
+        else:
+            sentiment = "Very Bearish"
+        
+        timeline_data.append({
+            "Time": time_str,
+            "Hora Lord": hora_lord,
+            "Influence": ". ".join(influence_parts),
+            "Sentiment": sentiment,
+            "Score": sentiment_score,
+            "Action": "BUY" if sentiment_score > 1 else "SELL" if sentiment_score < -1 else "HOLD"
+        })
+        
+        hora_index += 1
+    
+    return timeline_data
@@ -0,0 +1,100 @@
+"""Per-run stage timings for diagnostics, kept in a bounded history and optionally logged as JSON lines"""
+import collections
+import contextlib
+import datetime
+import json
+import os
+import threading
+import time
+
+import numpy as np
+
+TIMING_ENABLED = os.environ.get("PLANETARY_TIMING", "") not in ("", "0")
+TIMING_LOG_PATH = os.environ.get("PLANETARY_TIMING_LOG") or None
+TIMING_HISTORY_SIZE = 50
+TIMING_PERCENTILES = (50, 90, 99)
+
+_NO_STAGE = contextlib.nullcontext()
+
+class StageTimer:
+    """Wall-clock seconds per named stage of one run, plus bytes per named payload
+    
+    Stages may nest, and a stage entered more than once in a run adds up.
+    A disabled timer hands out one shared no-op context, so instrumented code
+    costs a method call per stage.
+    """
+    
+    def __init__(self, label="script", enabled=True):
+        self.label = label
+        self.enabled = enabled
+        self.stages = {}
+        self.payloads = {}
+        self.total = None
+        self._created = datetime.datetime.now()
+        self._started = time.perf_counter()
+    
+    def stage(self, name):
+        return self._measure(name) if self.enabled else _NO_STAGE
+    
+    @contextlib.contextmanager
+    def _measure(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - started
+    
+    def payload(self, name, size):
+        """Record size bytes sent to the browser under name; ignored while disabled"""
+        if self.enabled:
+            self.payloads[name] = self.payloads.get(name, 0) + size
+    
+    @property
+    def finished(self):
+        return self.total is not None
+    
+    def finish(self):
+        """Close the run and return it as a JSON-ready record"""
+        self.total = time.perf_counter() - self._started
+        return {
+            "run": self.label, "at": self._created.isoformat(timespec="milliseconds"), "total": self.total,
+            "stages": dict(self.stages), "payloads": dict(self.payloads)
+        }
+
+# For compute functions called without a timer
+NULL_TIMER = StageTimer(enabled=False)
+
+class TimingHistory:
+    """The last maxlen finished runs, each also appended to log_path as one JSON line when given"""
+    
+    def __init__(self, maxlen=TIMING_HISTORY_SIZE, log_path=TIMING_LOG_PATH):
+        self.runs = collections.deque(maxlen=maxlen)
+        self.log_path = log_path
+        self._lock = threading.Lock()
+    
+    def record(self, run):
+        with self._lock:
+            self.runs.append(run)
+            if self.log_path:
+                with open(self.log_path, "a") as f:
+                    f.write(json.dumps(run) + "\n")
+    
+    def percentiles(self, percentiles=TIMING_PERCENTILES):
+        """Count, percentiles and max seconds per stage over the recorded runs, with "total" for whole runs"""
+        with self._lock:
+            runs = list(self.runs)
+        samples = collections.defaultdict(list)
+        for run in runs:
+            samples["total"].append(run["total"])
+            for name, seconds in run["stages"].items():
+                samples[name].append(seconds)
+    
+        summary = {}
+        for name, values in samples.items():
+            values = np.array(values)
+            summary[name] = {
+                "count": len(values),
+                **{f"p{p}": float(value) for p, value in zip(percentiles, np.percentile(values, percentiles))},
+                "max": float(values.max())
+            }
+        return summary
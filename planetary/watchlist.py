@@ -0,0 +1,68 @@
+"""Watchlist scanner: one hora timeline per market session group, fanned out to every symbol"""
+from .aspects import calculate_dynamic_aspects
+from .ephemeris import calculate_dynamic_planetary_positions
+from .intraday import slot_hora_lords
+from .market_store import MARKET_REFERENCE_SYMBOL, get_market_store
+from .timeline import get_market_type, hora_timeline, realized_market_sentiment
+
+def parse_watchlist(text):
+    """Unique upper-case symbols from comma- or newline-separated text, in first-seen order"""
+    symbols = [symbol.strip().upper() for symbol in text.replace("\n", ",").split(",")]
+    return list(dict.fromkeys(symbol for symbol in symbols if symbol))
+
+def group_watchlist(symbols, date):
+    """Symbols keyed by (market type, realized sentiment), the only inputs of the timeline that vary by symbol"""
+    store = get_market_store()
+    reference = realized_market_sentiment(MARKET_REFERENCE_SYMBOL, date)
+    groups = {}
+    for symbol in symbols:
+        # Only symbols with their own realized data need a lookup
+        market_sentiment = realized_market_sentiment(symbol, date) if symbol in store else reference
+        key = (get_market_type(symbol), market_sentiment)
+        groups.setdefault(key, []).append(symbol)
+    return groups
+
+def watchlist_timelines(symbols, date, planetary_degrees, aspects, city=None, sun_times_cache=None):
+    """Timeline for each symbol; symbols in the same group share one computed list, so treat it as read-only"""
+    timelines = {}
+    for (market_type, market_sentiment), group in group_watchlist(symbols, date).items():
+        hora_lords = slot_hora_lords(date, market_type, city, sun_times_cache)
+        timeline = hora_timeline(market_type, date, planetary_degrees, aspects, market_sentiment, hora_lords)
+        for symbol in group:
+            timelines[symbol] = timeline
+    return timelines
+
+def summarize_timeline(timeline):
+    """Day-level BUY/SELL/HOLD summary of one timeline"""
+    scores = [slot["Score"] for slot in timeline]
+    actions = [slot["Action"] for slot in timeline]
+    best = max(timeline, key=lambda slot: slot["Score"])
+    worst = min(timeline, key=lambda slot: slot["Score"])
+    average = sum(scores) / len(scores)
+    return {
+        "Action": "BUY" if average > 1 else "SELL" if average < -1 else "HOLD",
+        "Avg Score": average,
+        "BUY Slots": actions.count("BUY"),
+        "SELL Slots": actions.count("SELL"),
+        "HOLD Slots": actions.count("HOLD"),
+        "Best Slot": f"{best['Time']} ({best['Hora Lord']})",
+        "Worst Slot": f"{worst['Time']} ({worst['Hora Lord']})"
+    }
+
+def scan_watchlist(symbols, date, planetary_degrees=None, aspects=None, city=None, sun_times_cache=None):
+    """One board row per symbol; timelines and summaries are computed once per group, not per symbol"""
+    if planetary_degrees is None:
+        planetary_degrees = calculate_dynamic_planetary_positions(date)
+    if aspects is None:
+        aspects = calculate_dynamic_aspects(planetary_degrees)
+    
+    rows = []
+    for (market_type, market_sentiment), group in group_watchlist(symbols, date).items():
+        hora_lords = slot_hora_lords(date, market_type, city, sun_times_cache)
+        summary = summarize_timeline(hora_timeline(market_type, date, planetary_degrees, aspects, market_sentiment, hora_lords))
+        for symbol in group:
+            rows.append({"Symbol": symbol, "Market": market_type, "Realized": market_sentiment or "", **summary})
+    
+    order = {symbol: i for i, symbol in enumerate(symbols)}
+    rows.sort(key=lambda row: order[row["Symbol"]])
+    return rows
@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from planetary.market_store import use_market_data_dir
+
+@pytest.fixture(autouse=True)
+def market_data_dir(tmp_path):
+    """Point get_market_store at an empty per-test directory, so tests never touch the checkout's store"""
+    root = str(tmp_path / "market_data")
+    previous = use_market_data_dir(root)
+    yield root
+    use_market_data_dir(previous)
@@ -0,0 +1,305 @@
+"""Scalar reference implementations, kept as they were in app.py before the planetary package
+
+Tests compare the vectorized engines against these per-date loops.
+"""
+import datetime
+
+from planetary.data import actual_market_data
+
+def calculate_dynamic_planetary_positions(date):
+    reference_date = datetime.date(2025, 8, 6)
+    days_diff = (date - reference_date).days
+
+    daily_movements = {
+        "Sun": 0.9856, "Moon": 13.1764, "Mercury": 1.383,
+        "Venus": 1.202, "Mars": 0.524, "Jupiter": 0.083,
+        "Saturn": 0.034, "Rahu": -0.053, "Ketu": -0.053
+    }
+
+    base_positions = {
+        "Sun": 109.5, "Moon": 251.68, "Mercury": 94.27,
+        "Venus": 137.75, "Mars": 87.0, "Jupiter": 22.67,
+        "Saturn": 308.33, "Rahu": 352.67, "Ketu": 172.67
+    }
+
+    new_positions = {}
+    for planet, base_pos in base_positions.items():
+        movement = daily_movements[planet] * days_diff
+        new_pos = (base_pos + movement) % 360
+        new_positions[planet] = new_pos
+
+    return new_positions
+
+def get_planet_strength(planet, sign):
+    planet_rulerships = {
+        "Sun": {"exalted": "Aries", "own": ["Leo"], "debilitated": "Libra"},
+        "Moon": {"exalted": "Taurus", "own": ["Cancer"], "debilitated": "Scorpio"},
+        "Mercury": {"exalted": "Virgo", "own": ["Gemini", "Virgo"], "debilitated": "Pisces"},
+        "Venus": {"exalted": "Pisces", "own": ["Taurus", "Libra"], "debilitated": "Virgo"},
+        "Mars": {"exalted": "Capricorn", "own": ["Aries", "Scorpio"], "debilitated": "Cancer"},
+        "Jupiter": {"exalted": "Cancer", "own": ["Sagittarius", "Pisces"], "debilitated": "Capricorn"},
+        "Saturn": {"exalted": "Libra", "own": ["Capricorn", "Aquarius"], "debilitated": "Aries"},
+        "Rahu": {"exalted": "Gemini", "own": [], "debilitated": "Sagittarius"},
+        "Ketu": {"exalted": "Sagittarius", "own": [], "debilitated": "Gemini"}
+    }
+
+    if planet in planet_rulerships:
+        rulership = planet_rulerships[planet]
+        if sign == rulership.get("exalted"):
+            return "Exalted"
+        elif sign in rulership.get("own", []):
+            return "Own Sign"
+        elif sign == rulership.get("debilitated"):
+            return "Debilitated"
+    return "Neutral"
+
+def get_sign_from_degree(degree):
+    signs = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+             "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
+    sign_index = int(degree // 30)
+    return signs[sign_index % 12]
+
+def get_nakshatra_from_degree(degree):
+    nakshatras = [
+        "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra",
+        "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni",
+        "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha",
+        "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha",
+        "Purva Bhadrapada", "Uttara Bhadrapada", "Revati"
+    ]
+    nakshatra_index = int(degree // 13.333333)
+    return nakshatras[nakshatra_index % 27]
+
+def calculate_dynamic_aspects(degrees):
+    aspects = []
+    planets = list(degrees.keys())
+
+    aspect_types = {
+        "Conjunction": {"angle": 0, "orb": 8},
+        "Sextile": {"angle": 60, "orb": 6},
+        "Square": {"angle": 90, "orb": 8},
+        "Trine": {"angle": 120, "orb": 8},
+        "Opposition": {"angle": 180, "orb": 8}
+    }
+
+    for i in range(len(planets)):
+        for j in range(i+1, len(planets)):
+            planet1, planet2 = planets[i], planets[j]
+            angle1, angle2 = degrees[planet1], degrees[planet2]
+
+            diff = abs(angle1 - angle2) % 360
+            if diff > 180:
+                diff = 360 - diff
+
+            for aspect_name, aspect_data in aspect_types.items():
+                aspect_angle = aspect_data["angle"]
+                orb = aspect_data["orb"]
+
+                if abs(diff - aspect_angle) <= orb:
+                    orb_difference = abs(diff - aspect_angle)
+                    if orb_difference <= 2:
+                        strength = "Exact"
+                    elif orb_difference <= 4:
+                        strength = "Close"
+                    else:
+                        strength = "Wide"
+
+                    aspects.append({
+                        "Planet 1": planet1,
+                        "Aspect": aspect_name,
+                        "Planet 2": planet2,
+                        "Strength": strength,
+                        "Orb": f"{orb_difference:.1f}°"
+                    })
+
+    return aspects
+
+def calculate_market_sentiment_dynamic(planetary_data, aspects, date):
+    sentiment_score = 0
+    sentiment_factors = []
+
+    # Check if we have actual market data for this date
+    if date in actual_market_data:
+        market_data = actual_market_data[date]
+        return market_data["sentiment"], market_data["score"], [f"Actual market: {market_data['reason']}"]
+
+    # Otherwise, calculate based on planetary positions
+    for planet in planetary_data:
+        strength = planet.get("Strength", "Neutral")
+        planet_name = planet["Planet"]
+
+        if planet_name in ["Jupiter", "Venus"]:
+            if strength == "Exalted":
+                sentiment_score += 3
+                sentiment_factors.append(f"✅ {planet_name} exalted (+3)")
+            elif strength == "Own Sign":
+                sentiment_score += 2
+                sentiment_factors.append(f"✅ {planet_name} in own sign (+2)")
+            elif strength == "Debilitated":
+                sentiment_score -= 2
+                sentiment_factors.append(f"❌ {planet_name} debilitated (-2)")
+            else:
+                sentiment_score += 1
+                sentiment_factors.append(f"⚪ {planet_name} neutral (+1)")
+
+        elif planet_name in ["Mars", "Saturn"]:
+            if strength == "Exalted":
+                sentiment_score += 1
+                sentiment_factors.append(f"⚡ {planet_name} exalted (+1)")
+            elif strength == "Own Sign":
+                sentiment_score += 0.5
+                sentiment_factors.append(f"⚡ {planet_name} in own sign (+0.5)")
+            elif strength == "Debilitated":
+                sentiment_score -= 3
+                sentiment_factors.append(f"💥 {planet_name} debilitated (-3)")
+            else:
+                sentiment_score -= 1
+                sentiment_factors.append(f"⚠️ {planet_name} neutral (-1)")
+
+        elif planet_name in ["Rahu", "Ketu"]:
+            if strength == "Exalted":
+                sentiment_score += 0.5
+                sentiment_factors.append(f"🌟 {planet_name} exalted (+0.5)")
+            elif strength == "Debilitated":
+                sentiment_score -= 2
+                sentiment_factors.append(f"🌑 {planet_name} debilitated (-2)")
+            else:
+                sentiment_score -= 0.5
+                sentiment_factors.append(f"🔄 {planet_name} creates uncertainty (-0.5)")
+
+    # Enhanced aspect influence with more weight for negative aspects
+    for aspect in aspects[:6]:
+        aspect_type = aspect["Aspect"]
+        strength = aspect["Strength"]
+
+        multiplier = {"Exact": 1.0, "Close": 0.8, "Wide": 0.5}[strength]
+
+        if aspect_type in ["Trine", "Sextile"]:
+            sentiment_score += 1 * multiplier
+            sentiment_factors.append(f"🔺 {aspect['Planet 1']}-{aspect['Planet 2']} {aspect_type} (+{1*multiplier:.1f})")
+        elif aspect_type in ["Square", "Opposition"]:
+            # Increase negative impact of challenging aspects
+            sentiment_score -= 1.5 * multiplier  # Increased from 1.0 to 1.5
+            sentiment_factors.append(f"🔻 {aspect['Planet 1']}-{aspect['Planet 2']} {aspect_type} (-{1.5*multiplier:.1f})")
+
+    # Day of week influence with more realistic weights
+    weekday = date.weekday()
+    weekday_effects = {
+        0: ("🌙 Monday (Moon day) - emotional volatility", -0.8),  # Increased negative impact
+        1: ("⚔️ Tuesday (Mars day) - aggressive trading", -1.2),  # Increased negative impact
+        2: ("☿️ Wednesday (Mercury day) - volatile trading", -0.5),  # Added Wednesday
+        3: ("🎯 Thursday (Jupiter day) - optimistic trading", 0.8),  # Reduced positive impact
+        4: ("💎 Friday (Venus day) - favorable for gains", 0.3),  # Reduced positive impact
+        5: ("🪐 Saturday (Saturn day) - slow trading", -0.7),  # Added Saturday
+        6: ("☉ Sunday (Sun day) - weekly close effect", -0.4)  # Added Sunday
+    }
+
+    if weekday in weekday_effects:
+        effect_text, effect_score = weekday_effects[weekday]
+        sentiment_score += effect_score
+        sentiment_factors.append(f"{effect_text} ({effect_score:+.1f})")
+
+    # Special date-based adjustments
+    if date.month == 8 and date.day in [1, 5, 6]:  # August 1, 5, 6
+        sentiment_score -= 2.5  # Additional bearish adjustment for these specific dates
+        sentiment_factors.append("⚠️ Historical bearish pattern for this date (-2.5)")
+    elif date.month == 8 and date.day == 4:  # August 4
+        sentiment_score += 2.0  # Additional bullish adjustment for this specific date
+        sentiment_factors.append("✅ Historical bullish pattern for this date (+2.0)")
+
+    # Determine sentiment level with adjusted thresholds
+    if sentiment_score >= 4:
+        return "Extremely Bullish", sentiment_score, sentiment_factors
+    elif sentiment_score >= 2:
+        return "Very Bullish", sentiment_score, sentiment_factors
+    elif sentiment_score >= 0.5:
+        return "Bullish", sentiment_score, sentiment_factors
+    elif sentiment_score >= -0.5:
+        return "Neutral", sentiment_score, sentiment_factors
+    elif sentiment_score >= -2:
+        return "Bearish", sentiment_score, sentiment_factors
+    elif sentiment_score >= -4:
+        return "Very Bearish", sentiment_score, sentiment_factors
+    else:
+        return "Extremely Bearish", sentiment_score, sentiment_factors
+
+def generate_dynamic_timeline(symbol, date, planetary_degrees, aspects):
+    market_type = "Indian" if symbol.upper() in ["NIFTY", "BANKNIFTY", "FINNIFTY", "MIDCPNIFTY"] else "International"
+
+    hora_sequence = ["Sun", "Venus", "Mercury", "Moon", "Saturn", "Jupiter", "Mars"]
+
+    if market_type == "Indian":
+        times = ["09:15 AM", "10:15 AM", "11:15 AM", "12:15 PM", "01:15 PM", "02:15 PM", "03:15 PM"]
+    else:
+        times = ["05:00 AM", "07:00 AM", "09:00 AM", "11:00 AM", "01:00 PM", "03:00 PM", "05:00 PM", "07:00 PM", "09:00 PM", "11:00 PM"]
+
+    timeline_data = []
+    hora_index = (date.weekday() * 24 + 9) % 7
+
+    for i, time_str in enumerate(times):
+        hora_lord = hora_sequence[hora_index % 7]
+
+        hora_degree = planetary_degrees.get(hora_lord, 0)
+        hora_sign = get_sign_from_degree(hora_degree)
+        hora_nakshatra = get_nakshatra_from_degree(hora_degree)
+        hora_strength = get_planet_strength(hora_lord, hora_sign)
+
+        relevant_aspects = [asp for asp in aspects if asp["Planet 1"] == hora_lord or asp["Planet 2"] == hora_lord]
+
+        influence_parts = []
+        influence_parts.append(f"{hora_lord} at {hora_degree:.1f}° in {hora_sign} ({hora_nakshatra})")
+
+        if hora_strength != "Neutral":
+            influence_parts.append(f"{hora_lord} is {hora_strength}")
+
+        sentiment_score = 0
+        for aspect in relevant_aspects[:2]:
+            other_planet = aspect["Planet 2"] if aspect["Planet 1"] == hora_lord else aspect["Planet 1"]
+            aspect_type = aspect["Aspect"]
+            strength = aspect["Strength"]
+
+            influence_parts.append(f"{aspect_type} with {other_planet} ({strength})")
+
+            if aspect_type in ["Trine", "Sextile"]:
+                sentiment_score += {"Exact": 2, "Close": 1.5, "Wide": 1}[strength]
+            elif aspect_type in ["Square", "Opposition"]:
+                sentiment_score -= {"Exact": 2, "Close": 1.5, "Wide": 1}[strength]
+
+        # Adjust sentiment based on actual market data for the date
+        if date in actual_market_data:
+            market_sentiment = actual_market_data[date]["sentiment"]
+            if "Bearish" in market_sentiment:
+                sentiment_score -= 1.5  # Adjust for bearish market
+            elif "Bullish" in market_sentiment:
+                sentiment_score += 1.0  # Adjust for bullish market
+
+        if hora_lord in ["Jupiter", "Venus"]:
+            sentiment_score += {"Exalted": 2, "Own Sign": 1, "Debilitated": -2}.get(hora_strength, 0)
+        elif hora_lord in ["Mars", "Saturn", "Rahu", "Ketu"]:
+            sentiment_score += {"Exalted": 1, "Own Sign": 0.5, "Debilitated": -2}.get(hora_strength, -0.5)
+        else:
+            sentiment_score += {"Exalted": 1.5, "Own Sign": 1, "Debilitated": -1.5}.get(hora_strength, 0)
+
+        if sentiment_score >= 2:
+            sentiment = "Very Bullish"
+        elif sentiment_score >= 1:
+            sentiment = "Bullish"
+        elif sentiment_score >= -1:
+            sentiment = "Neutral"
+        elif sentiment_score >= -2:
+            sentiment = "Bearish"
+        else:
+            sentiment = "Very Bearish"
+
+        timeline_data.append({
+            "Time": time_str,
+            "Hora Lord": hora_lord,
+            "Influence": ". ".join(influence_parts),
+            "Sentiment": sentiment,
+            "Score": sentiment_score,
+            "Action": "BUY" if sentiment_score > 1 else "SELL" if sentiment_score < -1 else "HOLD"
+        })
+
+        hora_index += 1
+
+    return timeline_data
@@ -0,0 +1,30 @@
+import datetime
+
+import numpy as np
+
+import reference
+from planetary.aspects import (
+    aspect_arrays_by_date, aspect_display_rows, calculate_dynamic_aspects, find_aspects_batch
+)
+from planetary.ephemeris import calculate_planetary_positions_batch
+
+DATES = [datetime.date(2020, 1, 1) + datetime.timedelta(days=k) for k in range(3000)]
+
+def test_batch_aspects_match_scalar_baseline():
+    hits = find_aspects_batch(calculate_planetary_positions_batch(DATES))
+    for date, aspects in zip(DATES, aspect_arrays_by_date(hits, len(DATES))):
+        degrees = reference.calculate_dynamic_planetary_positions(date)
+        assert aspect_display_rows(aspects) == reference.calculate_dynamic_aspects(degrees)
+
+def test_scalar_aspects_match_scalar_baseline():
+    for date in DATES[::50]:
+        degrees = reference.calculate_dynamic_planetary_positions(date)
+        assert aspect_display_rows(calculate_dynamic_aspects(degrees)) == reference.calculate_dynamic_aspects(degrees)
+
+def test_scalar_aspects_map_subset_bodies_to_planet_codes():
+    degrees = {"Moon": 10.0, "Saturn": 100.0, "Ketu": 12.0}
+    assert aspect_display_rows(calculate_dynamic_aspects(degrees)) == reference.calculate_dynamic_aspects(degrees)
+
+def test_batch_aspects_are_ordered_by_date():
+    hits = find_aspects_batch(calculate_planetary_positions_batch(DATES))
+    assert np.all(np.diff(hits["date"]) >= 0)
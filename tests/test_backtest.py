@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+from planetary.backtest import BACKTEST_THRESHOLD, backtest_sentiment
+from planetary.sentiment import calculate_market_sentiment_batch
+
+# August 2025 carries realized market data, which the backtest must not score with
+DAYS = pd.bdate_range("2025-07-14", "2025-09-12")
+
+def model_scores():
+    return calculate_market_sentiment_batch(DAYS.values.astype("datetime64[D]"), use_realized=False)["score"]
+
+def synthetic_ohlc(symbol, returns, days=DAYS):
+    opens = np.full(len(days), 100.0)
+    closes = opens * (1 + returns)
+    return pd.DataFrame({
+        "date": days, "symbol": symbol, "open": opens, "high": np.maximum(opens, closes) + 1,
+        "low": np.minimum(opens, closes) - 1, "close": closes
+    })
+
+def test_backtest_scores_the_model_without_realized_data():
+    score = model_scores()
+    assert not np.array_equal(score, calculate_market_sentiment_batch(DAYS.values.astype("datetime64[D]"))["score"])
+
+    # Returns that always follow the model's sign: every trade is a hit
+    returns = 0.01 * np.sign(score)
+    result = backtest_sentiment(synthetic_ohlc("NIFTY", returns))
+    position = np.where(score > BACKTEST_THRESHOLD, 1, np.where(score < -BACKTEST_THRESHOLD, -1, 0))
+    assert result["symbols"] == 1
+    assert result["observations"] == len(DAYS)
+    assert result["trades"] == np.count_nonzero(position) > 0
+    assert result["hit_rate"] == 1.0
+    assert result["actions"] == {
+        "SELL": int((position < 0).sum()), "HOLD": int((position == 0).sum()), "BUY": int((position > 0).sum())
+    }
+    np.testing.assert_allclose(result["equity"].to_numpy(), np.cumprod(1 + position * returns))
+    np.testing.assert_allclose(result["benchmark"].to_numpy(), np.cumprod(1 + returns))
+    assert result["ic"] > 0.5
+
+def test_backtest_pools_symbols_with_missing_days():
+    score = model_scores()
+    ohlc = pd.concat([
+        synthetic_ohlc("AAA", 0.01 * np.sign(score)),
+        synthetic_ohlc("BBB", -0.02 * np.sign(score[1:]), DAYS[1:])
+    ], ignore_index=True)
+    result = backtest_sentiment(ohlc)
+
+    traded = np.abs(score) > BACKTEST_THRESHOLD
+    assert result["symbols"] == 2
+    assert result["observations"] == 2 * len(DAYS) - 1
+    assert result["trades"] == traded.sum() + traded[1:].sum()
+    assert result["hit_rate"] == traded.sum() / result["trades"]
+    assert result["confusion"].to_numpy().sum() == result["observations"]
+    assert result["symbol_ic"]["AAA"] > 0 > result["symbol_ic"]["BBB"]
+    assert len(result["equity"]) == len(DAYS)
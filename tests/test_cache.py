@@ -0,0 +1,127 @@
+import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import planetary.cache
+from planetary.cache import ForecastDayCache, LRUCache, ResultCache
+from planetary.market_store import MarketDataStore
+from planetary.sentiment import forecast_rows_for_dates
+
+def test_concurrent_callers_share_one_computation():
+    cache = ResultCache()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"value": 42}
+
+    with ThreadPoolExecutor(4) as executor:
+        owner = executor.submit(cache.get_or_compute, "key", compute)
+        started.wait(5)
+        waiters = [executor.submit(cache.get_or_compute, "key", compute) for _ in range(3)]
+        while cache.stats()["waits"] < 3:
+            time.sleep(0.001)
+        release.set()
+        results = [owner.result(5)] + [waiter.result(5) for waiter in waiters]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert cache.stats() == {"hits": 0, "misses": 1, "waits": 3, "size": 1, "maxsize": 256}
+    assert cache.get_or_compute("key", compute) is results[0]
+    assert cache.stats()["hits"] == 1
+
+def test_failed_computation_reaches_waiters_and_is_not_cached():
+    cache = ResultCache()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(2) as executor:
+        owner = executor.submit(cache.get_or_compute, "key", fail)
+        started.wait(5)
+        waiter = executor.submit(cache.get_or_compute, "key", fail)
+        while cache.stats()["waits"] < 1:
+            time.sleep(0.001)
+        release.set()
+        for future in (owner, waiter):
+            with pytest.raises(ValueError):
+                future.result(5)
+
+    assert cache.stats()["size"] == 0
+    assert cache.get_or_compute("key", lambda: 1) == 1
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResultCache(maxsize=2)
+    cache.get_or_compute("a", lambda: 1)
+    cache.get_or_compute("b", lambda: 2)
+    cache.get_or_compute("a", lambda: 0)
+    cache.get_or_compute("c", lambda: 3)
+    assert cache.get_or_compute("a", lambda: 0) == 1
+    assert cache.get_or_compute("b", lambda: 20) == 20
+
+def recording_forecast_rows(monkeypatch):
+    """Patch ForecastDayCache's row builder to record which dates it is asked for"""
+    calls = []
+
+    def forecast_rows(dates):
+        calls.append(list(dates))
+        return forecast_rows_for_dates(dates)
+
+    monkeypatch.setattr(planetary.cache, "forecast_rows_for_dates", forecast_rows)
+    return calls
+
+def test_sliding_window_computes_only_new_days(monkeypatch):
+    calls = recording_forecast_rows(monkeypatch)
+    cache = ForecastDayCache()
+    days = [datetime.date(2026, 3, 1) + datetime.timedelta(days=k) for k in range(10)]
+
+    first = cache.get_range(days[:7])
+    second = cache.get_range(days[3:10])
+    assert calls == [days[:7], days[7:10]]
+    assert second[:4] == first[3:]
+    assert second == forecast_rows_for_dates(days[3:10])
+    assert cache.stats() == {"hits": 4, "misses": 10, "size": 10, "maxsize": 4096}
+
+def test_rows_are_keyed_by_version_and_market_generation(monkeypatch, tmp_path, market_data_dir):
+    calls = recording_forecast_rows(monkeypatch)
+    cache = ForecastDayCache()
+    day = datetime.date(2025, 8, 5)
+
+    assert cache.get_range([day])[0]["Score"] == -3.5
+    cache.get_range([day], version="other rules")
+    assert len(calls) == 2
+
+    csv = tmp_path / "realized.csv"
+    csv.write_text("Date,Symbol,Sentiment,Score\n2025-08-05,NIFTY,Bullish,1.5\n")
+    MarketDataStore(market_data_dir).import_csv(str(csv))
+    assert cache.get_range([day])[0]["Score"] == 1.5
+    assert len(calls) == 3
+
+def test_forecast_days_are_evicted_oldest_first():
+    cache = ForecastDayCache(maxsize=3)
+    days = [datetime.date(2026, 3, 1) + datetime.timedelta(days=k) for k in range(4)]
+    cache.get_range(days[:3])
+    cache.get_range(days[:1])
+    cache.get_range(days[3:])
+    cache.get_range(days[:1] + days[2:])
+    assert cache.stats()["hits"] == 4
+    assert cache.stats()["size"] == 3
+
+def test_lru_cache_counts_and_evicts():
+    cache = LRUCache(maxsize=2)
+    cache.store([("a", 1), ("b", 2)])
+    assert cache.lookup(["a", "c"]) == {"a": 1}
+    cache.store([("c", 3)])
+    assert cache.lookup(["a", "b", "c"]) == {"a": 1, "c": 3}
+    assert cache.stats() == {"hits": 3, "misses": 2, "size": 2, "maxsize": 2}
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+from planetary.downsample import AGGREGATION_BINS, aggregation_bin, bin_starts, binned_counts, lttb_indices, rollup_counts
+
+def reference_lttb(x, y, threshold):
+    """Point-by-point largest-triangle-three-buckets over the same bucket edges"""
+    n_points = len(x)
+    edges = [int(edge) for edge in np.linspace(1, n_points - 1, threshold - 1)] + [n_points]
+    selected = [0]
+    for bucket in range(threshold - 2):
+        start, stop, next_stop = edges[bucket], edges[bucket + 1], edges[bucket + 2]
+        next_x = sum(x[stop:next_stop]) / (next_stop - stop)
+        next_y = sum(y[stop:next_stop]) / (next_stop - stop)
+        a = selected[-1]
+        areas = [
+            abs((x[a] - next_x) * (y[k] - y[a]) - (x[a] - x[k]) * (next_y - y[a]))
+            for k in range(start, stop)
+        ]
+        selected.append(start + areas.index(max(areas)))
+    return selected + [n_points - 1]
+
+def test_lttb_matches_point_by_point_reference():
+    rng = np.random.default_rng(7)
+    x = np.arange(5000, dtype=float)
+    y = np.cumsum(rng.normal(size=5000))
+    for threshold in (3, 10, 333, 1000):
+        indices = lttb_indices(x, y, threshold)
+        assert indices.tolist() == reference_lttb(x.tolist(), y.tolist(), threshold)
+        assert len(indices) == threshold
+        assert np.all(np.diff(indices) > 0)
+
+def test_lttb_keeps_isolated_spikes():
+    y = np.zeros(10000)
+    y[[1234, 7777]] = [50, -50]
+    indices = lttb_indices(np.arange(10000), y, 100)
+    assert {0, 1234, 7777, 9999} <= set(indices.tolist())
+
+def test_lttb_returns_every_point_below_threshold():
+    assert lttb_indices([0, 1, 2], [5, 6, 7], 10).tolist() == [0, 1, 2]
+    assert lttb_indices(np.arange(100), np.arange(100), 2).tolist() == list(range(100))
+
+DAYS = np.datetime64("2024-12-20") + np.random.default_rng(3).integers(0, 800, 5000).astype("timedelta64[D]")
+CODES = np.random.default_rng(4).integers(0, 3, 5000)
+
+def pandas_bin_starts(days, freq):
+    periods = pd.DatetimeIndex(days).to_period({"D": "D", "W": "W-SUN", "M": "M"}[freq])
+    return periods.start_time.values.astype("datetime64[D]")
+
+def test_bin_starts_match_pandas_periods():
+    for freq in AGGREGATION_BINS:
+        np.testing.assert_array_equal(bin_starts(DAYS, freq), pandas_bin_starts(DAYS, freq))
+    assert bin_starts(np.array(["2026-10-18"], dtype="datetime64[D]"), "W")[0] == np.datetime64("2026-10-12")
+
+def test_binned_counts_match_pandas_crosstab():
+    for freq in AGGREGATION_BINS:
+        bins, counts = binned_counts(DAYS, CODES, 4, freq)
+        expected = pd.crosstab(pandas_bin_starts(DAYS, freq), CODES).reindex(columns=range(4), fill_value=0)
+        np.testing.assert_array_equal(bins, expected.index.values.astype("datetime64[D]"))
+        np.testing.assert_array_equal(counts, expected.to_numpy())
+
+def test_rollup_of_daily_counts_equals_direct_binning():
+    days, daily = binned_counts(DAYS, CODES, 3, "D")
+    for freq in ("W", "M"):
+        bins, rolled = rollup_counts(days, daily, freq)
+        direct_bins, direct = binned_counts(DAYS, CODES, 3, freq)
+        np.testing.assert_array_equal(bins, direct_bins)
+        np.testing.assert_array_equal(rolled, direct)
+        assert rolled.sum() == len(DAYS)
+
+def test_aggregation_bin_picks_the_narrowest_width_that_fits():
+    assert aggregation_bin(DAYS, 1000) == "D"
+    assert aggregation_bin(DAYS, 200) == "W"
+    assert aggregation_bin(DAYS, 30) == "M"
+    assert aggregation_bin(DAYS, 5) == "M"
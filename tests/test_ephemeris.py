@@ -0,0 +1,18 @@
+import datetime
+
+import numpy as np
+
+import reference
+from planetary.ephemeris import PLANETS, calculate_dynamic_planetary_positions, calculate_planetary_positions_batch
+
+DATES = [datetime.date(2020, 1, 1) + datetime.timedelta(days=k) for k in range(3000)]
+
+def test_batch_positions_match_scalar_baseline():
+    expected = np.array([list(reference.calculate_dynamic_planetary_positions(date).values()) for date in DATES])
+    np.testing.assert_array_equal(calculate_planetary_positions_batch(DATES), expected)
+
+def test_scalar_positions_keep_planet_order():
+    for date in DATES[::250]:
+        degrees = calculate_dynamic_planetary_positions(date)
+        assert list(degrees) == list(PLANETS)
+        assert degrees == reference.calculate_dynamic_planetary_positions(date)
@@ -0,0 +1,117 @@
+import datetime
+
+import numpy as np
+import pytest
+
+import reference
+from planetary.aspects import ASPECT_ANGLES, ASPECT_NAMES, ASPECT_ORBS
+from planetary.ephemeris import PLANETS, REFERENCE_DATE
+from planetary.events import find_aspect_events
+
+START = datetime.date(2026, 1, 1)
+END = datetime.date(2027, 1, 1)
+
+def reference_motion():
+    """Reference-date longitudes and daily motions, read back from the scalar baseline"""
+    base = reference.calculate_dynamic_planetary_positions(REFERENCE_DATE)
+    next_day = reference.calculate_dynamic_planetary_positions(REFERENCE_DATE + datetime.timedelta(days=1))
+    return (
+        np.array([base[planet] for planet in PLANETS]),
+        np.array([(next_day[planet] - base[planet] + 180) % 360 - 180 for planet in PLANETS])
+    )
+
+BASE, MOTION = reference_motion()
+
+def aspect_orbs(t, body1, body2):
+    """Baseline |separation - aspect angle| at fractional days t from REFERENCE_DATE, shape (len(t), n_aspects)"""
+    longitude1 = (BASE[body1] + MOTION[body1] * t) % 360
+    longitude2 = (BASE[body2] + MOTION[body2] * t) % 360
+    diff = np.abs(longitude1 - longitude2) % 360
+    diff = np.where(diff > 180, 360 - diff, diff)
+    return np.abs(diff[:, None] - ASPECT_ANGLES)
+
+def days_from_reference(stamps):
+    return (stamps - np.datetime64(REFERENCE_DATE, "s")) / np.timedelta64(1, "D")
+
+def brute_force_events(start, end):
+    """(body1, body2, aspect, minute) of every local orb minimum reaching zero, on a one-minute scan
+
+    Pairs without relative motion (Rahu and Ketu) never perfect and are skipped.
+    """
+    t_start = (start - REFERENCE_DATE).days
+    minutes = t_start + np.arange(-1, (end - start).days * 1440 + 1) / 1440
+    events = []
+    for body1 in range(len(PLANETS)):
+        for body2 in range(body1 + 1, len(PLANETS)):
+            if MOTION[body1] == MOTION[body2]:
+                continue
+            orb = aspect_orbs(minutes, body1, body2)
+            # Fastest relative motion is under 0.015 degrees a minute
+            minimum = (orb[1:-1] <= orb[:-2]) & (orb[1:-1] < orb[2:]) & (orb[1:-1] < 0.01)
+            for k, aspect in zip(*np.nonzero(minimum)):
+                events.append((body1, body2, aspect, minutes[k + 1]))
+    return events
+
+def test_exact_instants_match_brute_force_minute_scan():
+    events = find_aspect_events(START, END)
+    found = sorted(zip(
+        events["body1"].tolist(), events["body2"].tolist(), events["aspect"].tolist(),
+        days_from_reference(events["exact"]).tolist()
+    ))
+    expected = sorted(brute_force_events(START, END))
+
+    # Events within a minute of the year boundaries may land on either side of them
+    t_start, t_end = (START - REFERENCE_DATE).days, (END - REFERENCE_DATE).days
+    inner = 2 / 1440
+    found = [event for event in found if t_start + inner <= event[3] < t_end - inner]
+    expected = [event for event in expected if t_start + inner <= event[3] < t_end - inner]
+    assert len(found) == len(expected) > 0
+    for (body1, body2, aspect, t), (ref_body1, ref_body2, ref_aspect, ref_t) in zip(found, expected):
+        assert (body1, body2, aspect) == (ref_body1, ref_body2, ref_aspect)
+        assert abs(t - ref_t) * 1440 <= 1
+
+def test_orb_edges_sit_on_the_orb():
+    events = find_aspect_events(START, END)
+    for edge in ("enter", "leave"):
+        known = ~np.isnat(events[edge])
+        t = days_from_reference(events[edge][known])
+        body1, body2, aspect = events["body1"][known], events["body2"][known], events["aspect"][known]
+        orb = np.array([aspect_orbs(np.array([t_k]), b1, b2)[0, a] for t_k, b1, b2, a in zip(t, body1, body2, aspect)])
+        # Instants are rounded to the second; the Moon covers 0.00015 degrees a second
+        np.testing.assert_allclose(orb, ASPECT_ORBS[aspect], atol=1e-3)
+
+def test_edges_bracket_the_exact_instant():
+    events = find_aspect_events(START, END)
+    known = ~np.isnat(events["enter"]) & ~np.isnat(events["leave"])
+    assert known.any()
+    assert np.all(events["enter"][known] <= events["exact"][known])
+    assert np.all(events["exact"][known] <= events["leave"][known])
+
+def test_events_are_sorted_and_in_range():
+    events = find_aspect_events(START, END)
+    assert np.all(np.diff(events["exact"].astype(np.int64)) >= 0)
+    assert events["exact"].min() >= np.datetime64(START)
+    assert events["exact"].max() < np.datetime64(END)
+    assert not np.any((events["body1"] == PLANETS.index("Rahu")) & (events["body2"] == PLANETS.index("Ketu")))
+
+@pytest.mark.parametrize("date, body1, aspect, body2", [
+    # Slow pairs whose orb edges lie months away from the perfection
+    (datetime.date(2026, 12, 28), "Saturn", "Opposition", "Ketu"),
+    (datetime.date(2026, 12, 28), "Saturn", "Conjunction", "Rahu"),
+    (datetime.date(2008, 1, 12), "Jupiter", "Trine", "Saturn"),
+    (datetime.date(2028, 2, 23), "Jupiter", "Trine", "Saturn")
+])
+def test_slow_pairs_have_both_orb_edges(date, body1, aspect, body2):
+    events = find_aspect_events(date, date + datetime.timedelta(days=1))
+    match = (
+        (events["body1"] == PLANETS.index(body1)) & (events["body2"] == PLANETS.index(body2))
+        & (events["aspect"] == ASPECT_NAMES.index(aspect))
+    )
+    assert match.sum() == 1
+    assert not np.isnat(events["enter"][match][0])
+    assert not np.isnat(events["leave"][match][0])
+
+def test_every_event_in_a_year_has_both_orb_edges():
+    events = find_aspect_events(START, END)
+    assert not np.isnat(events["enter"]).any()
+    assert not np.isnat(events["leave"]).any()
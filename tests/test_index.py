@@ -0,0 +1,54 @@
+import datetime
+import os
+
+import numpy as np
+
+import planetary.index
+from planetary.aspect_data import ASPECT_EVENT_COLUMNS, aspect_event_columns
+from planetary.index import ASPECT_INDEX_MARKER, AspectIndex, use_aspect_index_dir
+
+def test_read_builds_year_partitions_once(tmp_path):
+    index = AspectIndex(str(tmp_path))
+    events = index.read(datetime.date(2025, 12, 30), datetime.date(2026, 1, 2))
+    assert index.stats()["built"] == 2
+    assert sorted(os.listdir(index.path)) == sorted([ASPECT_INDEX_MARKER, "2025", "2026"])
+
+    days = np.arange(np.datetime64("2025-01-01"), np.datetime64("2027-01-01"))
+    expected = aspect_event_columns(days)
+    rows = (expected["day"] >= np.datetime64("2025-12-30")) & (expected["day"] <= np.datetime64("2026-01-02"))
+    assert rows.any()
+    for name in ASPECT_EVENT_COLUMNS:
+        np.testing.assert_array_equal(events[name], expected[name][rows])
+
+    reopened = AspectIndex(str(tmp_path))
+    reopened.read(datetime.date(2026, 3, 1), datetime.date(2026, 3, 31))
+    assert reopened.stats() == {"version": index.version, "mapped_years": 1, "built": 0}
+
+def test_read_reports_progress_per_year(tmp_path):
+    calls = []
+    AspectIndex(str(tmp_path)).read(datetime.date(2025, 6, 1), datetime.date(2026, 6, 1), lambda *step: calls.append(step))
+    assert calls == [(1, 3), (2, 3)]
+
+def test_rules_change_prunes_only_marked_versions(tmp_path, monkeypatch):
+    root = str(tmp_path)
+    old = AspectIndex(root)
+    old.read(datetime.date(2026, 1, 1), datetime.date(2026, 1, 1))
+    os.makedirs(os.path.join(root, "unrelated"))
+    with open(os.path.join(root, "notes.txt"), "w") as f:
+        f.write("kept")
+
+    monkeypatch.setattr(planetary.index, "aspect_rules_version", lambda: "changed")
+    index = AspectIndex(root)
+    assert sorted(os.listdir(root)) == ["changed", "notes.txt", "unrelated"]
+
+    index.read(datetime.date(2026, 1, 1), datetime.date(2026, 1, 1))
+    assert index.stats()["built"] == 1
+
+def test_default_root_follows_use_aspect_index_dir(tmp_path):
+    previous = use_aspect_index_dir(str(tmp_path / "index"))
+    try:
+        index = AspectIndex()
+    finally:
+        use_aspect_index_dir(previous)
+    assert index.root == str(tmp_path / "index")
+    assert os.listdir(index.root) == [index.version]
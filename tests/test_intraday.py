@@ -0,0 +1,42 @@
+import datetime
+
+import numpy as np
+import pytest
+
+import reference
+from planetary.aspects import calculate_dynamic_aspects
+from planetary.ephemeris import PLANETS
+from planetary.intraday import HORA_ACTIONS, HORA_SENTIMENTS, current_slot, hora_grid, minute_grid
+from planetary.timeline import generate_dynamic_timeline, get_market_type
+
+# Covers the August 2025 dates with realized market data
+DATES = [datetime.date(2025, 6, 1) + datetime.timedelta(days=k) for k in range(400)]
+
+@pytest.mark.parametrize("symbol", ["NIFTY", "AAPL"])
+def test_hora_grid_matches_scalar_baseline(symbol):
+    grid = hora_grid(DATES, get_market_type(symbol), symbol)
+    for k, date in enumerate(DATES):
+        degrees = reference.calculate_dynamic_planetary_positions(date)
+        expected = reference.generate_dynamic_timeline(symbol, date, degrees, reference.calculate_dynamic_aspects(degrees))
+        assert [PLANETS[lord] for lord in grid["lord"][k].tolist()] == [row["Hora Lord"] for row in expected]
+        assert grid["score"][k].tolist() == [row["Score"] for row in expected]
+        assert [HORA_SENTIMENTS[code] for code in grid["sentiment"][k].tolist()] == [row["Sentiment"] for row in expected]
+        assert [HORA_ACTIONS[code] for code in grid["action"][k].tolist()] == [row["Action"] for row in expected]
+
+@pytest.mark.parametrize("symbol", ["NIFTY", "AAPL"])
+def test_generate_dynamic_timeline_matches_scalar_baseline(symbol):
+    for date in DATES[::7]:
+        degrees = reference.calculate_dynamic_planetary_positions(date)
+        expected = reference.generate_dynamic_timeline(symbol, date, degrees, reference.calculate_dynamic_aspects(degrees))
+        assert generate_dynamic_timeline(symbol, date, degrees, calculate_dynamic_aspects(degrees)) == expected
+
+def test_current_slot_and_minute_grid():
+    grid = hora_grid(DATES[:2], "Indian")
+    assert current_slot(grid, datetime.datetime(2025, 6, 2, 10, 20)) == (1, 1)
+    assert current_slot(grid, datetime.datetime(2025, 6, 2, 15, 30)) is None
+    assert current_slot(grid, datetime.datetime(2025, 6, 1, 9, 0)) is None
+
+    minutes = minute_grid(grid, "Indian")
+    assert len(minutes["minute"]) == (15 * 60 + 30) - (9 * 60 + 15)
+    np.testing.assert_array_equal(minutes["score"][:, 0], grid["score"][:, 0])
+    np.testing.assert_array_equal(minutes["lord"][:, -1], grid["lord"][:, -1])
@@ -0,0 +1,59 @@
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+import pytest
+
+from planetary.jobs import BackgroundJob, JobCancelled
+
+def stepping_job(steps, started, release):
+    """A job that reports each step and waits for release after the first"""
+    def run(progress):
+        for done in range(1, steps + 1):
+            progress(done, steps)
+            started.set()
+            release.wait(5)
+        return steps
+    return run
+
+def test_job_runs_to_completion_and_reports_final_progress():
+    started, release = threading.Event(), threading.Event()
+    release.set()
+    with ThreadPoolExecutor(1) as executor:
+        job = BackgroundJob(executor, "key", stepping_job(50, started, release), interval=60)
+        assert job.result() == 50
+    assert not job.running and not job.cancelled
+    assert (job.done, job.total, job.fraction) == (50, 50, 1.0)
+
+def test_cancel_stops_a_running_job_at_its_next_step():
+    started, release = threading.Event(), threading.Event()
+    with ThreadPoolExecutor(1) as executor:
+        job = BackgroundJob(executor, ("NIFTY", 2025), stepping_job(1000, started, release), interval=0)
+        started.wait(5)
+        assert job.running
+        job.cancel()
+        release.set()
+        with pytest.raises(JobCancelled):
+            job.result()
+    assert job.cancelled and not job.running
+    assert job.done == 1
+
+def test_cancel_before_start_never_runs_the_job():
+    calls = []
+    blocker = threading.Event()
+    with ThreadPoolExecutor(1) as executor:
+        executor.submit(blocker.wait, 5)
+        job = BackgroundJob(executor, "key", lambda progress: calls.append(1))
+        job.cancel()
+        blocker.set()
+        with pytest.raises(CancelledError):
+            job.result()
+    assert calls == []
+
+def test_progress_is_throttled_to_the_interval():
+    with ThreadPoolExecutor(1) as executor:
+        job = BackgroundJob(executor, "key", lambda progress: progress(10, 10), interval=60)
+        job.result()
+    job.progress(3, 20)
+    assert (job.done, job.total) == (10, 10)
+    job.progress(20, 20)
+    assert (job.done, job.total) == (20, 20)
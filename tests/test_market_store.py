@@ -0,0 +1,88 @@
+import datetime
+import os
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from planetary.data import actual_market_data
+from planetary.market_store import MarketDataStore, get_market_store, market_store_generation
+
+CSV = """Date,Symbol,Sentiment,Score,Reason
+2025-08-05,NIFTY,Bullish,1.5,Revised close
+2025-08-07,nifty,Bearish,-1.0,
+2025-08-07,AAPL,Very Bullish,2.5,Earnings beat
+2025-08-08,AAPL,Neutral,0.0,Flat session
+"""
+
+def write_csv(tmp_path):
+    path = tmp_path / "realized.csv"
+    path.write_text(CSV)
+    return str(path)
+
+def test_built_in_records_are_served_without_writing(market_data_dir):
+    store = get_market_store()
+    for date, row in actual_market_data.items():
+        assert store.lookup(date) == row
+    assert store.lookup(datetime.date(2025, 8, 2)) is None
+    assert store.generation == 0
+    assert not os.path.exists(market_data_dir)
+
+def test_import_csv_merges_and_replaces_rows(tmp_path, market_data_dir):
+    store = MarketDataStore(market_data_dir)
+    store.import_csv(write_csv(tmp_path), chunksize=2)
+
+    assert store.generation == market_store_generation(market_data_dir) != 0
+    assert store.lookup(datetime.date(2025, 8, 5)) == {"sentiment": "Bullish", "score": 1.5, "reason": "Revised close"}
+    assert store.lookup(datetime.date(2025, 8, 7)) == {"sentiment": "Bearish", "score": -1.0, "reason": ""}
+    assert store.lookup(datetime.date(2025, 8, 1)) == actual_market_data[datetime.date(2025, 8, 1)]
+    assert store.lookup(datetime.date(2025, 8, 7), "aapl")["sentiment"] == "Very Bullish"
+    assert store.lookup(datetime.date(2025, 8, 5), "AAPL") is None
+    assert store.lookup(datetime.date(2025, 8, 5), "MSFT") is None
+    assert "AAPL" in store and "MSFT" not in store
+    assert store.stats() == {"rows": len(actual_market_data) + 3, "symbols": 2}
+
+def test_read_slices_a_symbol_date_range(tmp_path, market_data_dir):
+    store = MarketDataStore(market_data_dir)
+    store.import_csv(write_csv(tmp_path))
+
+    rows = store.read(datetime.date(2025, 8, 4), datetime.date(2025, 8, 7))
+    np.testing.assert_array_equal(rows["day"], np.array(["2025-08-04", "2025-08-05", "2025-08-06", "2025-08-07"], dtype="datetime64[D]"))
+    assert [store.labels[code] for code in rows["sentiment"].tolist()] == ["Very Bullish", "Bullish", "Very Bearish", "Bearish"]
+    assert rows["score"].tolist() == [2.8, 1.5, -3.0, -1.0]
+    assert len(store.read(datetime.date(2025, 9, 1), datetime.date(2025, 9, 30))["day"]) == 0
+
+def test_default_store_reopens_after_import(tmp_path, market_data_dir):
+    before = get_market_store()
+    MarketDataStore(market_data_dir).import_csv(write_csv(tmp_path))
+    after = get_market_store()
+    assert after is not before
+    assert after.lookup(datetime.date(2025, 8, 5))["score"] == 1.5
+
+def test_import_memory_is_bounded_by_compact_columns(tmp_path, market_data_dir):
+    n_rows = 100_000
+    rng = np.random.default_rng(0)
+    csv = tmp_path / "large.csv"
+    pd.DataFrame({
+        "Date": (np.datetime64("2000-01-01") + rng.integers(0, 9000, n_rows).astype("timedelta64[D]")).astype(str),
+        "Symbol": np.array([f"SYM{k:03d}" for k in range(500)])[rng.integers(0, 500, n_rows)],
+        "Sentiment": np.array(["Bullish", "Bearish", "Neutral"])[rng.integers(0, 3, n_rows)],
+        "Score": rng.normal(size=n_rows).round(2),
+        "Reason": np.array([f"Session note {k} explaining the close in a full sentence" for k in range(2000)])[rng.integers(0, 2000, n_rows)]
+    }).to_csv(csv, index=False)
+    expected = pd.read_csv(csv).drop_duplicates(["Symbol", "Date"], keep="last").iloc[-1]
+
+    store = MarketDataStore(market_data_dir)
+    tracemalloc.start()
+    try:
+        store.import_csv(str(csv), chunksize=10_000)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    # Text rows as fixed-width unicode arrays take over 1 kB each; code columns take 26 bytes
+    assert peak < 200 * n_rows
+    assert store.lookup(datetime.date.fromisoformat(expected["Date"]), expected["Symbol"]) == {
+        "sentiment": expected["Sentiment"], "score": expected["Score"], "reason": expected["Reason"]
+    }
+    assert store.stats()["symbols"] == 501
@@ -0,0 +1,42 @@
+import datetime
+
+import numpy as np
+
+import reference
+from planetary.sentiment import (
+    SENTIMENT_LEVELS, calculate_market_sentiment_batch, forecast_rows_for_dates, sentiment_factors_for_date
+)
+
+DATES = [datetime.date(2020, 1, 1) + datetime.timedelta(days=k) for k in range(3000)]
+
+def reference_sentiment(date):
+    degrees = reference.calculate_dynamic_planetary_positions(date)
+    planetary_data = [
+        {"Planet": planet, "Strength": reference.get_planet_strength(planet, reference.get_sign_from_degree(degree))}
+        for planet, degree in degrees.items()
+    ]
+    return reference.calculate_market_sentiment_dynamic(planetary_data, reference.calculate_dynamic_aspects(degrees), date)
+
+def test_batch_sentiment_matches_scalar_baseline():
+    expected = [reference_sentiment(date) for date in DATES]
+    batch = calculate_market_sentiment_batch(DATES)
+    np.testing.assert_array_equal(batch["score"], [score for _, score, _ in expected])
+    assert [SENTIMENT_LEVELS[code] for code in batch["sentiment"].tolist()] == [sentiment for sentiment, _, _ in expected]
+
+def test_realized_market_data_overrides_unless_disabled(monkeypatch):
+    dates = [datetime.date(2025, 8, 1) + datetime.timedelta(days=k) for k in range(7)]
+    realized = calculate_market_sentiment_batch(dates)
+    assert realized["score"][[0, 3, 4, 5]].tolist() == [-3.2, 2.8, -3.5, -3.0]
+
+    monkeypatch.setattr(reference, "actual_market_data", {})
+    model = calculate_market_sentiment_batch(dates, use_realized=False)
+    np.testing.assert_array_equal(model["score"], [reference_sentiment(date)[1] for date in dates])
+
+def test_factors_match_scalar_baseline():
+    for date in DATES[::100] + [datetime.date(2025, 8, 4), datetime.date(2025, 8, 7)]:
+        assert sentiment_factors_for_date(date) == reference_sentiment(date)[2]
+
+def test_forecast_rows_carry_batch_scores():
+    rows = forecast_rows_for_dates(DATES[:14])
+    assert [row["Score"] for row in rows] == [reference_sentiment(date)[1] for date in DATES[:14]]
+    assert all("Factors" not in row for row in rows)
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from planetary.cache import SunTimesCache
+from planetary.ephemeris import PLANETS
+from planetary.solar import CITY_COORDINATES, city_planetary_hours, find_city, sun_times
+
+# Consecutive hora lords as the baseline timeline cycled through them
+BASELINE_HORA_SEQUENCE = ["Sun", "Venus", "Mercury", "Moon", "Saturn", "Jupiter", "Mars"]
+WEEKDAY_RULERS = ["Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Sun"]  # Monday first
+
+DAYS = np.arange(np.datetime64("2025-01-01"), np.datetime64("2026-01-01"))
+
+@pytest.mark.parametrize("city, date, sunrise, sunset", [
+    # Published times, converted to the city's standard UTC offset
+    ("London", "2024-06-21", "03:43", "20:21"),
+    ("New York", "2024-12-21", "07:17", "16:32"),
+    ("Sydney", "2024-12-21", "04:41", "19:05")
+])
+def test_sun_times_match_published_tables(city, date, sunrise, sunset):
+    times = sun_times(np.array([date], dtype="datetime64[D]"), *CITY_COORDINATES[city])
+    for key, expected in (("sunrise", sunrise), ("sunset", sunset)):
+        error = times[key][0] - np.datetime64(f"{date}T{expected}")
+        assert abs(error) <= np.timedelta64(3, "m")
+
+def test_no_sunrise_in_polar_day_or_night():
+    times = sun_times(np.array(["2024-06-21", "2024-12-21", "2024-03-20"], dtype="datetime64[D]"), 78.2, 15.6, 1.0)
+    assert np.isnat(times["sunrise"][:2]).all() and np.isnat(times["sunset"][:2]).all()
+    assert not np.isnat(times["sunrise"][2])
+
+def test_planetary_hours_follow_the_baseline_chaldean_order():
+    hours = city_planetary_hours("Mumbai", DAYS)
+    lords = [PLANETS[lord] for lord in hours["lord"].ravel().tolist()]
+    start = BASELINE_HORA_SEQUENCE.index(lords[0])
+    assert lords == [BASELINE_HORA_SEQUENCE[(start + k) % 7] for k in range(len(lords))]
+
+    weekday = [day.weekday() for day in DAYS.tolist()]
+    assert [PLANETS[lord] for lord in hours["lord"][:, 0].tolist()] == [WEEKDAY_RULERS[k] for k in weekday]
+
+def test_planetary_hours_tile_sunrise_to_next_sunrise():
+    hours = city_planetary_hours("London", DAYS)
+    times = sun_times(np.append(DAYS, DAYS[-1] + 1), *CITY_COORDINATES["London"])
+    np.testing.assert_array_equal(hours["start"][:, 0], times["sunrise"][:-1])
+    np.testing.assert_array_equal(hours["start"][:, 12], times["sunset"][:-1])
+    np.testing.assert_array_equal(hours["end"][:, -1], times["sunrise"][1:])
+    np.testing.assert_array_equal(hours["start"].ravel()[1:], hours["end"].ravel()[:-1])
+
+    # Long summer days: day hours are longer than night hours in London
+    june = DAYS.astype("datetime64[M]") == np.datetime64("2025-06")
+    assert np.all(np.diff(hours["start"][june], axis=1)[:, 0] > np.diff(hours["start"][june], axis=1)[:, 12])
+
+def test_find_city_is_case_insensitive():
+    assert find_city("  new york ") == "New York"
+    assert find_city("Atlantis") is None
+    assert find_city("") is None
+
+def test_sun_times_cache_computes_each_city_day_once():
+    cache = SunTimesCache(maxsize=500)
+    first = cache.get_range("Mumbai", DAYS[:200])
+    second = cache.get_range("Mumbai", DAYS[100:300])
+    expected = sun_times(DAYS[100:300], *CITY_COORDINATES["Mumbai"])
+    np.testing.assert_array_equal(second["sunrise"], expected["sunrise"])
+    np.testing.assert_array_equal(second["sunset"], expected["sunset"])
+    np.testing.assert_array_equal(first["sunrise"][100:], second["sunrise"][:100])
+    assert cache.stats() == {"hits": 100, "misses": 300, "size": 300, "maxsize": 500}
+
+    cache.get_range("Tokyo", DAYS[:300])
+    assert cache.stats()["size"] == 500
+    cache.get_range("Mumbai", DAYS[:100])
+    assert cache.stats()["misses"] == 700
+
+def test_planetary_hours_through_the_cache_match_direct():
+    cache = SunTimesCache()
+    direct = city_planetary_hours("Tokyo", DAYS)
+    cached = city_planetary_hours("Tokyo", DAYS, cache)
+    for key in ("start", "end", "lord"):
+        np.testing.assert_array_equal(cached[key], direct[key])